@@ -5,24 +5,53 @@ Usage:
     client = ActiveCampaignClient(api_url, api_key)
     tags = client.list_tags()
     client.create_tag('My Tag')
+    tag = client.get_tag_by_name('my tag')  # Served from the cached tag index
 """
 
 import os
+import re
 import requests
-from typing import Dict, List, Optional
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
 import time
+from urllib.parse import urlencode, urlsplit
+from http_session import create_session
+from rate_limiter import TokenBucket
+from retry_policy import RetryPolicy, TransientHTTPError
 
 
-class ActiveCampaignClient:
-    """Client for ActiveCampaign API."""
+DEFAULT_TAG_INDEX_TTL = 600  # Seconds before the tag index is reloaded from the API
+MAX_PAGE_SIZE = 100  # ActiveCampaign v3 caps list endpoints at 100 records per page
+DEFAULT_REQUESTS_PER_SECOND = 5  # ActiveCampaign's documented per-account limit
+DEFAULT_CONCURRENCY = 5  # Parallel requests for paginated reads and bulk jobs
+BULK_IMPORT_MAX_CONTACTS = 250  # Contacts accepted per /import/bulk_import request
+
+
+class ActiveCampaignClientBase:
+    """Transport-independent state shared by the sync and async ActiveCampaign clients."""
     
-    def __init__(self, api_url: Optional[str] = None, api_key: Optional[str] = None):
+    # Methods that can be repeated without side effects
+    IDEMPOTENT_METHODS = {'GET', 'HEAD', 'PUT', 'DELETE'}
+    max_rate_limit_waits = 3  # Times to wait out a 429 before handing it to the retry policy
+    
+    def __init__(self, api_url: Optional[str] = None, api_key: Optional[str] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+                 concurrency: int = DEFAULT_CONCURRENCY):
         """
-        Initialize ActiveCampaign API client.
+        Initialize credentials, retry policy and the shared rate limiter.
         
         Args:
             api_url: ActiveCampaign API URL (e.g., 'https://{account}.api-us1.com')
             api_key: ActiveCampaign API key
+            retry_policy: Timeout/backoff policy for transient failures
+            requests_per_second: Account-wide request rate shared by every client
+                                 and process using this API key
+            concurrency: Requests kept in flight by paginated reads and bulk jobs.
+                         Also sizes the connection pool.
         """
         self.api_url = (api_url or os.getenv('ACTIVE_CAMPAIGN_API_URL')).rstrip('/')
         self.api_key = api_key or os.getenv('ACTIVE_CAMPAIGN_API_KEY')
@@ -41,9 +70,90 @@ class ActiveCampaignClient:
             'Api-Token': self.api_key,
             'Content-Type': 'application/json'
         }
-        self.rate_limit_delay = 0.1  # Small delay to respect rate limits
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.concurrency = max(1, concurrency)
+        
+        # AC limits requests per account, so every client (and process) using
+        # this key draws from one bucket. Throughput follows the bucket rather
+        # than a fixed per-request sleep; 429s pause the bucket for Retry-After.
+        self.limiter = TokenBucket.shared(
+            f"activecampaign-{TokenBucket.key_hash(self.api_key)}",
+            capacity=requests_per_second, period=1
+        )
+    
+    def _request_info(self, method: str, endpoint: str, idempotent: Optional[bool]) -> Tuple[str, str, bool]:
+        """Return (url, retry counter name, idempotent) for a request."""
+        path = re.sub(r'/\d+', '/{id}', urlsplit(endpoint).path)  # Group counters by route
+        if idempotent is None:
+            idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        return f"{self.api_url}{endpoint}", f"activecampaign:{method.upper()} {path}", idempotent
+    
+    def _throttle(self, response) -> None:
+        """Pause every client sharing this API key until Retry-After has passed."""
+        retry_after = response.headers.get('Retry-After', '')
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            delay = 1.0  # AC's window is one second
+        self.limiter.block_until(time.time() + max(delay, 0.1))
     
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
+    @staticmethod
+    def _page_bounds(response: Dict, offset: int, limit: Optional[int]) -> Optional[int]:
+        """Offset to stop paging at, from meta.total and the caller's limit (None if unknown)."""
+        total = int(response.get('meta', {}).get('total') or 0)
+        end = total if total else None  # meta.total counts every record, not the remainder
+        if limit is not None:
+            end = min(end, offset + limit) if end is not None else offset + limit
+        return end
+
+
+class ActiveCampaignClient(ActiveCampaignClientBase):
+    """Client for ActiveCampaign API."""
+    
+    def __init__(self, api_url: Optional[str] = None, api_key: Optional[str] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 tag_index_ttl: float = DEFAULT_TAG_INDEX_TTL,
+                 session: Optional[requests.Session] = None,
+                 requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Initialize ActiveCampaign API client.
+        
+        Args:
+            api_url: ActiveCampaign API URL (e.g., 'https://{account}.api-us1.com')
+            api_key: ActiveCampaign API key
+            retry_policy: Timeout/backoff policy for transient failures
+            tag_index_ttl: Seconds to trust the cached tag index before reloading it
+            session: Optional shared HTTP session
+            requests_per_second: Account-wide request rate shared by every client
+                                 and process using this API key
+            concurrency: Requests kept in flight by paginated reads and bulk jobs.
+                         Also sizes the connection pool.
+        """
+        super().__init__(api_url, api_key, retry_policy=retry_policy,
+                         requests_per_second=requests_per_second, concurrency=concurrency)
+        self.session = session or create_session(pool_size=self.concurrency)
+        
+        # Case-folded tag name -> tag record, loaded lazily and kept in sync
+        # by create_tag/delete_tag so lookups don't re-download the tag list
+        self.tag_index_ttl = tag_index_ttl
+        self._tag_index: Optional[Dict[str, Dict]] = None
+        self._tag_index_loaded_at = 0.0
+        self._tag_index_lock = threading.RLock()
+    
+    @staticmethod
+    def _tag_key(tag_name: str) -> str:
+        """Normalize a tag name for case-insensitive index lookups."""
+        return tag_name.strip().casefold()
+    
+    @staticmethod
+    def _is_duplicate(error: Exception) -> bool:
+        """Whether a create failed because the record already exists (AC answers 422)."""
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+        return status == 422 or 'duplicate' in str(error).lower()
+    
+    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                      idempotent: Optional[bool] = None) -> Dict:
         """
         Make API request.
         
@@ -51,56 +161,163 @@ class ActiveCampaignClient:
             method: HTTP method ('GET', 'POST', 'PUT', 'DELETE')
             endpoint: API endpoint (e.g., '/api/3/tags')
             data: Request body data
+            idempotent: Whether the request is safe to retry. Defaults to True
+                        for GET/HEAD/PUT/DELETE and False for POST.
             
         Returns:
             Response data
         """
-        url = f"{self.api_url}{endpoint}"
+        url, endpoint_name, idempotent = self._request_info(method, endpoint, idempotent)
+        
+        def send() -> Dict:
+            for attempt in range(self.max_rate_limit_waits + 1):
+                self.limiter.acquire()
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    headers=self.headers,
+                    json=data,
+                    timeout=self.retry_policy.timeout
+                )
+                if response.status_code != 429:
+                    break
+                self._throttle(response)
+            else:
+                raise TransientHTTPError(429, f"ActiveCampaign rate limit exceeded for {endpoint_name}")
+            
+            response.raise_for_status()
+            return response.json() if response.content else {}
         
-        response = requests.request(
-            method=method,
-            url=url,
-            headers=self.headers,
-            json=data
+        return self.retry_policy.call(
+            send,
+            endpoint=endpoint_name,
+            idempotent=idempotent
         )
+    
+    def iter_paginated(self, endpoint: str, collection: str, params: Optional[Dict] = None,
+                       page_size: int = MAX_PAGE_SIZE, offset: int = 0,
+                       limit: Optional[int] = None, concurrency: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Iterate over every record of an ActiveCampaign v3 list endpoint.
         
-        time.sleep(self.rate_limit_delay)  # Rate limiting
+        Follows limit/offset pages until meta.total is reached (or a short page
+        is returned when the endpoint reports no total). With concurrency > 1,
+        the remaining pages are fetched in parallel once the first page has
+        reported the total; records are still yielded in order. At most
+        `concurrency` pages are requested or buffered ahead of the consumer:
+        the next page is only submitted as a finished one is handed over.
+        
+        Args:
+            endpoint: List endpoint (e.g., '/api/3/tags')
+            collection: Response key holding the records (e.g., 'tags')
+            params: Extra query parameters (filters, ordering)
+            page_size: Records per request (capped at MAX_PAGE_SIZE)
+            offset: Record offset to start from
+            limit: Maximum number of records to yield. None means all.
+            concurrency: Number of pages to fetch at once after the first page.
+                         None uses the client's concurrency setting.
+            
+        Yields:
+            Record dictionaries
+        """
+        concurrency = self.concurrency if concurrency is None else concurrency
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE, limit or MAX_PAGE_SIZE))
         
-        response.raise_for_status()
-        return response.json()
+        def fetch(page_offset: int) -> Dict:
+            query = urlencode({**(params or {}), 'limit': page_size, 'offset': page_offset})
+            return self._make_request('GET', f"{endpoint}?{query}")
+        
+        def pages() -> Iterator[List[Dict]]:
+            response = fetch(offset)
+            page = response.get(collection, [])
+            yield page
+            if len(page) < page_size:
+                return
+            
+            end = self._page_bounds(response, offset, limit)
+            next_offset = offset + len(page)
+            
+            if concurrency > 1 and end is not None:
+                offsets = iter(range(next_offset, end, page_size))
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    window = deque(executor.submit(fetch, page_offset)
+                                   for page_offset in islice(offsets, concurrency))
+                    try:
+                        while window:
+                            response = window.popleft().result()
+                            for page_offset in islice(offsets, 1):
+                                window.append(executor.submit(fetch, page_offset))
+                            yield response.get(collection, [])
+                    finally:
+                        for future in window:
+                            future.cancel()
+                return
+            
+            while end is None or next_offset < end:
+                page = fetch(next_offset).get(collection, [])
+                yield page
+                if len(page) < page_size:
+                    return
+                next_offset += len(page)
+        
+        yielded = 0
+        for page in pages():
+            for record in page:
+                if limit is not None and yielded >= limit:
+                    return
+                yield record
+                yielded += 1
     
-    def list_tags(self, limit: int = 100, offset: int = 0) -> List[Dict]:
+    def list_tags(self, limit: Optional[int] = None, offset: int = 0,
+                  concurrency: Optional[int] = None) -> List[Dict]:
         """
-        List all tags.
+        List tags, following pagination.
         
         Args:
-            limit: Maximum number of tags to return
+            limit: Maximum number of tags to return. None returns every tag.
             offset: Offset for pagination
+            concurrency: Number of pages to fetch at once (default: client setting)
             
         Returns:
             List of tag dictionaries
         """
-        endpoint = f'/api/3/tags?limit={limit}&offset={offset}'
-        response = self._make_request('GET', endpoint)
-        return response.get('tags', [])
+        return list(self.iter_paginated('/api/3/tags', 'tags', offset=offset,
+                                        limit=limit, concurrency=concurrency))
+    
+    def get_tag_index(self, refresh: bool = False) -> Dict[str, Dict]:
+        """
+        Get the case-folded tag name -> tag index, loading it on first use.
+        
+        Args:
+            refresh: Reload from the API even if the cached index is still fresh
+            
+        Returns:
+            Snapshot of the tag index
+        """
+        with self._tag_index_lock:
+            expired = time.time() - self._tag_index_loaded_at > self.tag_index_ttl
+            if self._tag_index is None or refresh or expired:
+                self._tag_index = {self._tag_key(tag.get('tag', '')): tag for tag in self.list_tags()}
+                self._tag_index_loaded_at = time.time()
+            return dict(self._tag_index)
+    
+    def invalidate_tag_index(self) -> None:
+        """Drop the cached tag index so the next lookup reloads it."""
+        with self._tag_index_lock:
+            self._tag_index = None
     
-    def get_tag_by_name(self, tag_name: str) -> Optional[Dict]:
+    def get_tag_by_name(self, tag_name: str, refresh: bool = False) -> Optional[Dict]:
         """
         Get tag by name (case-insensitive).
         
         Args:
             tag_name: Tag name to search for
+            refresh: Reload the tag index first (e.g., after another process created tags)
             
         Returns:
             Tag dictionary if found, None otherwise
         """
-        tags = self.list_tags(limit=1000)  # Get all tags
-        
-        for tag in tags:
-            if tag.get('tag', '').lower() == tag_name.lower():
-                return tag
-        
-        return None
+        return self.get_tag_index(refresh=refresh).get(self._tag_key(tag_name))
     
     def create_tag(self, tag_name: str, tag_type: str = 'contact', description: str = '') -> Dict:
         """
@@ -119,6 +336,10 @@ class ActiveCampaignClient:
         if existing:
             return existing  # Return existing tag instead of creating duplicate
         
+        return self._post_tag(tag_name, tag_type, description)
+    
+    def _post_tag(self, tag_name: str, tag_type: str, description: str) -> Dict:
+        """Create a tag without checking the index first, then add it to the index."""
         endpoint = '/api/3/tags'
         data = {
             'tag': {
@@ -129,7 +350,103 @@ class ActiveCampaignClient:
         }
         
         response = self._make_request('POST', endpoint, data)
-        return response.get('tag', {})
+        tag = response.get('tag', {})
+        if tag:
+            with self._tag_index_lock:
+                if self._tag_index is not None:
+                    self._tag_index[self._tag_key(tag.get('tag', tag_name))] = tag
+        return tag
+    
+    def delete_tag(self, tag_name: str) -> bool:
+        """
+        Delete a tag by name (case-insensitive).
+        
+        Args:
+            tag_name: Tag name to delete
+            
+        Returns:
+            True if the tag was deleted, False if it did not exist
+        """
+        tag = self.get_tag_by_name(tag_name)
+        if not tag:
+            return False
+        
+        self._make_request('DELETE', f"/api/3/tags/{tag['id']}")
+        with self._tag_index_lock:
+            if self._tag_index is not None:
+                self._tag_index.pop(self._tag_key(tag_name), None)
+        return True
+    
+    def provision_tags(self, tag_names: List[str], tag_type: str = 'contact', description: str = '',
+                       concurrency: Optional[int] = None) -> Dict:
+        """
+        Ensure a set of tags exists, creating only the missing ones.
+        
+        Desired names are diffed against the tag index (case-insensitive), and
+        missing tags are created in parallel under the shared rate limiter.
+        Re-running with the same names creates nothing new. Creates rejected
+        as duplicates (another worker or process got there first) are resolved
+        with one index refresh once every create has finished.
+        
+        Args:
+            tag_names: Tag names that should exist (duplicates are ignored)
+            tag_type: Tag type for created tags
+            description: Description for created tags
+            concurrency: Parallel create requests (default: client setting)
+            
+        Returns:
+            Dictionary with per-tag 'results' (name, status, tag, error) in input
+            order, plus 'created', 'existing' and 'failed' counts. Status is one
+            of 'created', 'exists' or 'failed'.
+        """
+        desired = {}
+        for tag_name in tag_names:
+            desired.setdefault(self._tag_key(tag_name), tag_name)
+        
+        index = self.get_tag_index()
+        results = {
+            key: {'name': name, 'status': 'exists', 'tag': index[key], 'error': None}
+            for key, name in desired.items() if key in index
+        }
+        missing = [name for key, name in desired.items() if key not in index]
+        
+        def create(tag_name: str) -> Dict:
+            try:
+                tag = self._post_tag(tag_name, tag_type, description)
+                return {'name': tag_name, 'status': 'created', 'tag': tag, 'error': None}
+            except Exception as e:
+                return {'name': tag_name, 'status': 'failed', 'tag': None, 'error': str(e),
+                        'duplicate': self._is_duplicate(e)}
+        
+        if missing:
+            workers = min(concurrency or self.concurrency, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for result in executor.map(create, missing):
+                    results[self._tag_key(result['name'])] = result
+        
+        # Created meanwhile by another worker or process: look them up with one refresh
+        conflicts = [key for key, result in results.items() if result.pop('duplicate', False)]
+        if conflicts:
+            try:
+                index = self.get_tag_index(refresh=True)
+            except Exception as e:
+                index = {}
+                for key in conflicts:
+                    results[key]['error'] += f" (tag lookup failed: {e})"
+            for key in conflicts:
+                if key in index:
+                    results[key] = {'name': results[key]['name'], 'status': 'exists',
+                                    'tag': index[key], 'error': None}
+        
+        ordered = [results[key] for key in desired]
+        counts = {status: sum(1 for r in ordered if r['status'] == status)
+                  for status in ('created', 'exists', 'failed')}
+        return {
+            'results': ordered,
+            'created': counts['created'],
+            'existing': counts['exists'],
+            'failed': counts['failed'],
+        }
     
     def create_tags_batch(self, tag_names: List[str], tag_type: str = 'contact') -> Dict:
         """
@@ -142,19 +459,12 @@ class ActiveCampaignClient:
         Returns:
             Dictionary with created and skipped tags
         """
-        created = []
-        skipped = []
-        
-        for tag_name in tag_names:
-            existing = self.get_tag_by_name(tag_name)
-            if existing:
-                skipped.append({'name': tag_name, 'reason': 'Already exists'})
-            else:
-                try:
-                    tag = self.create_tag(tag_name, tag_type)
-                    created.append(tag)
-                except Exception as e:
-                    skipped.append({'name': tag_name, 'reason': str(e)})
+        results = self.provision_tags(tag_names, tag_type)['results']
+        created = [r['tag'] for r in results if r['status'] == 'created']
+        skipped = [
+            {'name': r['name'], 'reason': 'Already exists' if r['status'] == 'exists' else r['error']}
+            for r in results if r['status'] != 'created'
+        ]
         
         return {
             'created': created,
@@ -163,16 +473,67 @@ class ActiveCampaignClient:
             'skipped_count': len(skipped)
         }
     
-    def list_automations(self) -> List[Dict]:
+    def bulk_import_contacts(self, contacts: List[Dict], callback: Optional[Dict] = None) -> Dict:
+        """
+        Queue up to 250 contacts for import in one request.
+        
+        Contacts are upserted by email, so resubmitting a chunk is safe.
+        
+        Args:
+            contacts: Contact dictionaries in bulk import format
+                      (email, first_name, last_name, phone, tags, fields, subscribe)
+            callback: Optional callback definition AC calls when the batch finishes
+            
+        Returns:
+            Response with 'batchId' and 'queued_contacts'
+        """
+        if len(contacts) > BULK_IMPORT_MAX_CONTACTS:
+            raise ValueError(
+                f"Bulk import accepts at most {BULK_IMPORT_MAX_CONTACTS} contacts per request "
+                f"(got {len(contacts)}). Use contact_sync.ContactSync to chunk larger imports."
+            )
+        data = {'contacts': contacts}
+        if callback:
+            data['callback'] = callback
+        return self._make_request('POST', '/api/3/import/bulk_import', data, idempotent=True)
+    
+    def get_bulk_import_status(self, batch_id: str) -> Dict:
+        """
+        Get the status of a queued bulk import.
+        
+        Args:
+            batch_id: batchId returned by bulk_import_contacts
+            
+        Returns:
+            Status dictionary ('status', plus 'success'/'failure' email lists when finished)
+        """
+        return self._make_request('GET', f"/api/3/import/info?{urlencode({'batchId': batch_id})}")
+    
+    def iter_contacts(self, params: Optional[Dict] = None, concurrency: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Iterate over every contact, ordered by ID.
+        
+        Args:
+            params: Extra filters for /api/3/contacts (e.g., {'listid': 3})
+            concurrency: Number of pages to fetch at once (default: client setting)
+            
+        Yields:
+            Contact dictionaries
+        """
+        params = {'orders[id]': 'ASC', **(params or {})}
+        return self.iter_paginated('/api/3/contacts', 'contacts', params=params, concurrency=concurrency)
+    
+    def list_automations(self, concurrency: Optional[int] = None) -> List[Dict]:
         """
-        List all automations.
+        List all automations, following pagination.
         
+        Args:
+            concurrency: Number of pages to fetch at once (default: client setting)
+            
         Returns:
             List of automation dictionaries
         """
-        endpoint = '/api/3/automations'
-        response = self._make_request('GET', endpoint)
-        return response.get('automations', [])
+        return list(self.iter_paginated('/api/3/automations', 'automations', concurrency=concurrency))
     
     def get_automation(self, automation_id: int) -> Dict:
         """
@@ -188,6 +549,57 @@ class ActiveCampaignClient:
         response = self._make_request('GET', endpoint)
         return response.get('automation', {})
     
+    def get_automation_blocks(self, automation_id: int) -> List[Dict]:
+        """
+        Get the blocks (steps) of an automation.
+        
+        Args:
+            automation_id: Automation ID
+            
+        Returns:
+            List of automation block dictionaries
+        """
+        response = self._make_request('GET', f'/api/3/automations/{automation_id}/blocks')
+        return response.get('automationBlocks', [])
+    
+    def get_automations_details(self, automation_ids: List[int], include_blocks: bool = True,
+                                concurrency: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Fetch details (and optionally blocks) for automations concurrently.
+        
+        Details and blocks requests run on a small thread pool over this
+        client's session and shared rate limiter. A failure for one automation
+        is reported in its entry instead of failing the whole call.
+        
+        Args:
+            automation_ids: Automation IDs
+            include_blocks: Also fetch each automation's blocks
+            concurrency: Requests in flight at once (default: client setting)
+            
+        Returns:
+            Dictionary mapping automation ID (as a string) to
+            {'automation': dict, 'blocks': list or None, 'error': str or None}
+        """
+        automation_ids = [str(automation_id) for automation_id in automation_ids]
+        if not automation_ids:
+            return {}
+        
+        workers = min(concurrency or self.concurrency, len(automation_ids) * (2 if include_blocks else 1))
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {
+                automation_id: (executor.submit(self.get_automation, automation_id),
+                                executor.submit(self.get_automation_blocks, automation_id) if include_blocks else None)
+                for automation_id in automation_ids
+            }
+            results = {}
+            for automation_id, (automation, blocks) in futures.items():
+                try:
+                    results[automation_id] = {'automation': automation.result(),
+                                              'blocks': blocks.result() if blocks else None, 'error': None}
+                except Exception as e:
+                    results[automation_id] = {'automation': {}, 'blocks': None, 'error': str(e)}
+        return results
+    
     def create_goal(self, automation_id: int, goal_name: str, goal_type: str = 'contact') -> Dict:
         """
         Create a goal in automation.
@@ -204,14 +616,13 @@ class ActiveCampaignClient:
         Returns:
             Dictionary with goal information and manual steps required
         """
-        # Get automation details
-        automation = self.get_automation(automation_id)
+        # Automation details and its blocks (to find where the goal goes), fetched together
+        details = self.get_automations_details([automation_id])[str(automation_id)]
+        if details['error']:
+            raise Exception(f"Could not read automation {automation_id}: {details['error']}")
+        automation = details['automation']
         automation_name = automation.get('name', f'Automation {automation_id}')
-        
-        # Get automation blocks to find where goal should be added
-        blocks_endpoint = f'/api/3/automations/{automation_id}/blocks'
-        blocks_response = self._make_request('GET', blocks_endpoint)
-        blocks = blocks_response.get('automationBlocks', [])
+        blocks = details['blocks'] or []
         
         # Return information about what needs to be done manually
         return {
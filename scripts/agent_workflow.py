@@ -34,6 +34,7 @@ sys.path.insert(0, os.path.dirname(__file__))
 from team_manager import TeamManager
 from task_analyzer import TaskAnalyzer
 from linear_client import LinearClient
+from linear_queries import format_query_stats
 from execute_tasks import TaskExecutor
 from cloud_executor import CloudExecutor
 
@@ -41,10 +42,15 @@ from cloud_executor import CloudExecutor
 class AgentWorkflow:
     """Main workflow handler for multi-team agent operations."""
     
-    def __init__(self):
-        """Initialize workflow with team manager."""
+    def __init__(self, use_mirror: bool = True):
+        """
+        Initialize workflow with team manager.
+        
+        Args:
+            use_mirror: Analyze from the local Linear mirror (incremental sync)
+        """
         self.team_manager = TeamManager()
-        self.analyzer = TaskAnalyzer(self.team_manager)
+        self.analyzer = TaskAnalyzer(self.team_manager, use_mirror=use_mirror)
         self.cloud_executor = CloudExecutor(self.team_manager)
     
     def list_teams(self):
@@ -76,6 +82,13 @@ class AgentWorkflow:
         
         print(summary)
         
+        coalesced = sum(c['hits'] for c in LinearClient.get_coalescing_stats().values())
+        if coalesced:
+            print(f"Linear requests coalesced (served by an identical in-flight query): {coalesced}")
+        query_summary = format_query_stats()
+        if query_summary:
+            print(query_summary)
+        
         # Also save detailed results to file
         output_file = Path(__file__).parent.parent / "analysis_results.json"
         with open(output_file, 'w') as f:
@@ -120,7 +133,8 @@ class AgentWorkflow:
         return analysis
     
     def work_on_team(self, team_id: str, project_id: Optional[str] = None, 
-                     limit: Optional[int] = None, execution_mode: str = "local"):
+                     limit: Optional[int] = None, execution_mode: str = "local",
+                     task_ids: Optional[List[str]] = None):
         """
         Work on open tasks for a team.
         
@@ -129,6 +143,11 @@ class AgentWorkflow:
             project_id: Optional project filter
             limit: Maximum number of tasks to work on
             execution_mode: 'local' or 'cloud' - where to execute tasks
+            task_ids: Optional identifiers to restrict work to (e.g., queued by the webhook receiver)
+            
+        Returns:
+            Result dictionaries (with 'task_id') for the tasks actually worked on;
+            empty if analysis failed or no task was selected
         """
         print(f"\n{'='*60}")
         print(f"Working on tasks for team: {team_id}")
@@ -141,10 +160,12 @@ class AgentWorkflow:
         
         if 'error' in analysis:
             print(f"❌ Error: {analysis['error']}")
-            return
+            return []
         
         categorized = analysis.get('categorized', {})
         agent_suitable = categorized.get('agent_suitable', [])
+        if task_ids is not None:
+            agent_suitable = [task for task in agent_suitable if task['identifier'] in task_ids]
         
         if not agent_suitable:
             print("No agent-suitable tasks found.\n")
@@ -157,7 +178,7 @@ class AgentWorkflow:
             print("  1. Try a different team: --team OTHER_TEAM")
             print("  2. Try a specific project: --project PROJECT_ID")
             print("  3. Add more detail to tasks in Linear")
-            return
+            return []
         
         # Limit number of tasks if specified
         tasks_to_work = agent_suitable[:limit] if limit else agent_suitable
@@ -180,7 +201,7 @@ class AgentWorkflow:
             print("  1. List teams: python scripts/agent_workflow.py --list-teams")
             print("  2. Add team: python scripts/setup_team.py")
             print("  3. Check team ID spelling (case-sensitive)")
-            return
+            return []
         
         # Set environment variables for this team's credentials
         # This allows existing TaskExecutor to work with team credentials
@@ -603,6 +624,9 @@ Examples:
   python agent_workflow.py --check-status
   python agent_workflow.py --check-status TRA-56
 
+  # Bypass the local issue mirror (full download from Linear)
+  python agent_workflow.py --team trade-ideas --analyze --no-mirror
+
   # Interactive mode (guided prompts)
   python agent_workflow.py --interactive
   python agent_workflow.py -i
@@ -627,10 +651,12 @@ Examples:
                        help='Check status of cloud-executed tasks (optionally specify task ID)')
     parser.add_argument('--interactive', '-i', action='store_true',
                        help='Run in interactive mode with guided prompts')
+    parser.add_argument('--no-mirror', action='store_true',
+                       help='Fetch open issues directly from Linear instead of the local mirror')
     
     args = parser.parse_args()
     
-    workflow = AgentWorkflow()
+    workflow = AgentWorkflow(use_mirror=not args.no_mirror)
     
     if args.interactive:
         workflow.interactive_mode()
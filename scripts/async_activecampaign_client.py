@@ -0,0 +1,316 @@
+"""
+Async ActiveCampaign API client (asyncio + httpx).
+
+Shares the per-account token bucket with ActiveCampaignClient, so sync and
+async code running side by side stay under AC's request limit together.
+Automation audits fan out detail and block requests concurrently instead
+of walking automations one at a time.
+
+Usage:
+    async with AsyncActiveCampaignClient() as client:
+        automations = await client.list_automations()
+        details = await client.get_automations_details([a['id'] for a in automations])
+"""
+
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+
+import httpx
+
+from activecampaign_client import (
+    ActiveCampaignClientBase,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_REQUESTS_PER_SECOND,
+    MAX_PAGE_SIZE,
+)
+from http_session import create_async_http_client
+from retry_policy import RetryPolicy, TransientHTTPError
+
+
+class AsyncActiveCampaignClient(ActiveCampaignClientBase):
+    """Async client for ActiveCampaign API."""
+
+    def __init__(self, api_url: Optional[str] = None, api_key: Optional[str] = None,
+                 http_client: Optional[httpx.AsyncClient] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+                 concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Initialize async ActiveCampaign API client.
+
+        Args:
+            api_url: ActiveCampaign API URL (e.g., 'https://{account}.api-us1.com')
+            api_key: ActiveCampaign API key
+            http_client: Optional shared httpx.AsyncClient. If omitted, the client
+                         creates its own and closes it in aclose().
+            retry_policy: Timeout/backoff policy for transient failures
+            requests_per_second: Account-wide request rate (shared with the sync client)
+            concurrency: Requests kept in flight by paginated reads and fan-out helpers
+        """
+        super().__init__(api_url, api_key, retry_policy=retry_policy,
+                         requests_per_second=requests_per_second, concurrency=concurrency)
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or create_async_http_client(max_connections=self.concurrency)
+
+    async def __aenter__(self) -> 'AsyncActiveCampaignClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def _acquire(self) -> None:
+        """Wait for a request slot without blocking the event loop."""
+        while True:
+            wait = self.limiter.reserve()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                            idempotent: Optional[bool] = None) -> Dict:
+        """
+        Make API request.
+
+        Args:
+            method: HTTP method ('GET', 'POST', 'PUT', 'DELETE')
+            endpoint: API endpoint (e.g., '/api/3/tags')
+            data: Request body data
+            idempotent: Whether the request is safe to retry (see ActiveCampaignClient._make_request)
+
+        Returns:
+            Response data
+        """
+        url, endpoint_name, idempotent = self._request_info(method, endpoint, idempotent)
+
+        timeout = self.retry_policy.timeout
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+        async def send() -> Dict:
+            for attempt in range(self.max_rate_limit_waits + 1):
+                await self._acquire()
+                response = await self.http_client.request(
+                    method,
+                    url,
+                    headers=self.headers,
+                    json=data,
+                    timeout=timeout
+                )
+                if response.status_code != 429:
+                    break
+                self._throttle(response)
+            else:
+                raise TransientHTTPError(429, f"ActiveCampaign rate limit exceeded for {endpoint_name}")
+
+            response.raise_for_status()
+            return response.json() if response.content else {}
+
+        return await self.retry_policy.call_async(send, endpoint=endpoint_name, idempotent=idempotent)
+
+    async def iter_paginated(self, endpoint: str, collection: str, params: Optional[Dict] = None,
+                             page_size: int = MAX_PAGE_SIZE, offset: int = 0,
+                             limit: Optional[int] = None,
+                             concurrency: Optional[int] = None) -> AsyncIterator[Dict]:
+        """
+        Iterate over every record of an ActiveCampaign v3 list endpoint.
+
+        Same paging rules as ActiveCampaignClient.iter_paginated: once the first
+        page reports meta.total, up to `concurrency` remaining pages are fetched
+        at a time, and records are yielded in order.
+
+        Args:
+            endpoint: List endpoint (e.g., '/api/3/automations')
+            collection: Response key holding the records (e.g., 'automations')
+            params: Extra query parameters
+            page_size: Records per request (capped at MAX_PAGE_SIZE)
+            offset: Record offset to start from
+            limit: Maximum number of records to yield. None means all.
+            concurrency: Pages fetched at once (default: client setting)
+
+        Yields:
+            Record dictionaries
+        """
+        concurrency = self.concurrency if concurrency is None else max(1, concurrency)
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE, limit or MAX_PAGE_SIZE))
+
+        async def fetch(page_offset: int) -> Dict:
+            query = httpx.QueryParams({**(params or {}), 'limit': page_size, 'offset': page_offset})
+            return await self._make_request('GET', f"{endpoint}?{query}")
+
+        yielded = 0
+
+        def take(page: List[Dict]) -> List[Dict]:
+            nonlocal yielded
+            if limit is not None:
+                page = page[:max(limit - yielded, 0)]
+            yielded += len(page)
+            return page
+
+        response = await fetch(offset)
+        page = response.get(collection, [])
+        for record in take(page):
+            yield record
+        if len(page) < page_size:
+            return
+
+        end = self._page_bounds(response, offset, limit)
+        next_offset = offset + len(page)
+        if end is None:
+            # No total reported - walk pages until a short one
+            while limit is None or yielded < limit:
+                page = (await fetch(next_offset)).get(collection, [])
+                for record in take(page):
+                    yield record
+                if len(page) < page_size:
+                    return
+                next_offset += len(page)
+            return
+
+        offsets = list(range(next_offset, end, page_size))
+        for start in range(0, len(offsets), concurrency):
+            responses = await asyncio.gather(*(fetch(o) for o in offsets[start:start + concurrency]))
+            for response in responses:
+                for record in take(response.get(collection, [])):
+                    yield record
+
+    async def list_tags(self, limit: Optional[int] = None, concurrency: Optional[int] = None) -> List[Dict]:
+        """
+        List tags, following pagination.
+
+        Args:
+            limit: Maximum number of tags to return. None returns every tag.
+            concurrency: Pages fetched at once (default: client setting)
+
+        Returns:
+            List of tag dictionaries
+        """
+        return [tag async for tag in self.iter_paginated('/api/3/tags', 'tags', limit=limit,
+                                                          concurrency=concurrency)]
+
+    async def list_automations(self, concurrency: Optional[int] = None) -> List[Dict]:
+        """
+        List all automations, following pagination.
+
+        Args:
+            concurrency: Pages fetched at once (default: client setting)
+
+        Returns:
+            List of automation dictionaries
+        """
+        return [automation async for automation in
+                self.iter_paginated('/api/3/automations', 'automations', concurrency=concurrency)]
+
+    async def get_automation(self, automation_id: int) -> Dict:
+        """
+        Get automation details.
+
+        Args:
+            automation_id: Automation ID
+
+        Returns:
+            Automation dictionary
+        """
+        response = await self._make_request('GET', f'/api/3/automations/{automation_id}')
+        return response.get('automation', {})
+
+    async def get_automation_blocks(self, automation_id: int) -> List[Dict]:
+        """
+        Get the blocks (steps) of an automation.
+
+        Args:
+            automation_id: Automation ID
+
+        Returns:
+            List of automation block dictionaries
+        """
+        response = await self._make_request('GET', f'/api/3/automations/{automation_id}/blocks')
+        return response.get('automationBlocks', [])
+
+    async def get_automations_details(self, automation_ids: Iterable[int], include_blocks: bool = True,
+                                      concurrency: Optional[int] = None) -> Dict[str, Dict]:
+        """
+        Fetch details (and optionally blocks) for many automations concurrently.
+
+        At most `concurrency` automations are in flight at once, and all requests
+        draw from the shared per-account rate limiter. A failure for one
+        automation is reported in its entry instead of failing the whole audit.
+
+        Args:
+            automation_ids: Automation IDs
+            include_blocks: Also fetch each automation's blocks
+            concurrency: Automations fetched at once (default: client setting)
+
+        Returns:
+            Dictionary mapping automation ID (as a string) to
+            {'automation': dict, 'blocks': list or None, 'error': str or None}
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def fetch(automation_id) -> Dict:
+            async with semaphore:
+                try:
+                    if include_blocks:
+                        automation, blocks = await asyncio.gather(
+                            self.get_automation(automation_id),
+                            self.get_automation_blocks(automation_id)
+                        )
+                    else:
+                        automation, blocks = await self.get_automation(automation_id), None
+                    return {'automation': automation, 'blocks': blocks, 'error': None}
+                except Exception as e:
+                    return {'automation': {}, 'blocks': None, 'error': str(e)}
+
+        automation_ids = [str(automation_id) for automation_id in automation_ids]
+        results = await asyncio.gather(*(fetch(automation_id) for automation_id in automation_ids))
+        return dict(zip(automation_ids, results))
+
+    async def audit_automations(self, include_blocks: bool = True,
+                                concurrency: Optional[int] = None) -> List[Dict]:
+        """
+        List every automation and fetch its details and blocks concurrently.
+
+        Args:
+            include_blocks: Also fetch each automation's blocks
+            concurrency: Requests in flight at once (default: client setting)
+
+        Returns:
+            Automation list entries, each with 'details', 'blocks' and 'error' added
+        """
+        automations = await self.list_automations(concurrency=concurrency)
+        details = await self.get_automations_details(
+            [automation['id'] for automation in automations],
+            include_blocks=include_blocks,
+            concurrency=concurrency
+        )
+        audited = []
+        for automation in automations:
+            entry = details[str(automation['id'])]
+            audited.append({**automation, 'details': entry['automation'],
+                            'blocks': entry['blocks'], 'error': entry['error']})
+        return audited
+
+
+def audit_automations(api_url: Optional[str] = None, api_key: Optional[str] = None,
+                      include_blocks: bool = True, concurrency: int = DEFAULT_CONCURRENCY) -> List[Dict]:
+    """
+    Blocking wrapper around AsyncActiveCampaignClient.audit_automations for sync callers.
+
+    Args:
+        api_url: ActiveCampaign API URL (default: ACTIVE_CAMPAIGN_API_URL)
+        api_key: ActiveCampaign API key (default: ACTIVE_CAMPAIGN_API_KEY)
+        include_blocks: Also fetch each automation's blocks
+        concurrency: Requests in flight at once
+
+    Returns:
+        Automation list entries with details and blocks
+    """
+    async def run() -> List[Dict]:
+        async with AsyncActiveCampaignClient(api_url, api_key, concurrency=concurrency) as client:
+            return await client.audit_automations(include_blocks=include_blocks)
+
+    return asyncio.run(run())
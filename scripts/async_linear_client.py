@@ -0,0 +1,378 @@
+"""
+Async Linear API client (asyncio + httpx).
+
+Same surface as LinearClient, with awaitable methods. Rate-limit buckets,
+the metadata cache and the identifier index are shared with the sync client.
+
+Usage:
+    async with AsyncLinearClient(api_key) as client:
+        issue = await client.get_issue_by_identifier('TRA-56')
+        await client.update_issue_status('TRA-56', 'In Review')
+"""
+
+import asyncio
+import uuid
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+
+from http_session import create_async_http_client
+from linear_cache import DEFAULT_TTL
+from linear_client import LinearClientBase, ISSUE_NOT_FOUND_HELP
+from linear_queries import (
+    TEAMS_QUERY,
+    TEAM_STATES_QUERY,
+    UPDATE_ISSUE_STATE_MUTATION,
+    CREATE_COMMENT_MUTATION,
+    issue_query,
+    issues_query,
+    team_issues_query,
+    record_response,
+)
+from retry_policy import RetryPolicy
+
+
+class AsyncLinearClient(LinearClientBase):
+    """Async client for interacting with Linear API."""
+
+    def __init__(self, api_key: Optional[str] = None, http_client: Optional[httpx.AsyncClient] = None,
+                 metadata_ttl: float = DEFAULT_TTL, retry_policy: Optional[RetryPolicy] = None):
+        """
+        Initialize async Linear API client.
+
+        Args:
+            api_key: Linear API key. If None, reads from LINEAR_API_KEY env var.
+            http_client: Optional shared httpx.AsyncClient. If omitted, the client
+                         creates its own and closes it in aclose().
+            metadata_ttl: Seconds to cache teams and workflow states
+            retry_policy: Timeout/backoff policy for transient failures
+        """
+        super().__init__(api_key, metadata_ttl=metadata_ttl, retry_policy=retry_policy)
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or create_async_http_client()
+
+    async def __aenter__(self) -> 'AsyncLinearClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def _acquire(self, complexity: float) -> None:
+        """Wait for request and complexity budget without blocking the event loop."""
+        for bucket, cost in ((self.request_limiter, 1), (self.complexity_limiter, complexity)):
+            while True:
+                wait = bucket.reserve(cost)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+    async def _make_request(self, query: str, variables: Optional[Dict] = None,
+                            idempotent: Optional[bool] = None) -> Dict:
+        """
+        Make a GraphQL request to Linear API.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+            idempotent: Whether the request is safe to retry (see LinearClient._make_request)
+
+        Returns:
+            Response data
+        """
+        endpoint, idempotent = self._operation_info(query, idempotent)
+        
+        # Futures belong to one event loop, so flights are scoped per loop
+        loop = asyncio.get_running_loop()
+        key = self._flight_key(query, variables, scope=id(loop))
+        if key is None:
+            return await self._send_with_retry(query, variables, endpoint, idempotent)
+        
+        flight, leader = self._join_flight(key, endpoint, loop.create_future)
+        if not leader:
+            # shield: one waiter being cancelled must not cancel the shared request
+            return await asyncio.shield(flight)
+        try:
+            result = await self._send_with_retry(query, variables, endpoint, idempotent)
+            flight.set_result(result)
+            return result
+        except BaseException as e:
+            flight.set_exception(e)
+            flight.exception()  # Mark retrieved so an unawaited flight doesn't log a warning
+            raise
+        finally:
+            self._leave_flight(key)
+    
+    async def _send_with_retry(self, query: str, variables: Optional[Dict], endpoint: str,
+                               idempotent: bool) -> Dict:
+        return await self.retry_policy.call_async(
+            lambda: self._send(query, variables),
+            endpoint=endpoint,
+            idempotent=idempotent
+        )
+
+    async def _send(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """Send one GraphQL request, waiting out rate limits. Raises TransientHTTPError on 5xx."""
+        payload = {"query": query}
+        if variables:
+            payload["variables"] = variables
+
+        timeout = self.retry_policy.timeout
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+        complexity = self._complexity_cost(query, variables)
+        for attempt in range(self.max_rate_limit_waits + 1):
+            await self._acquire(complexity)
+
+            response = await self.http_client.post(
+                self.base_url,
+                headers=self.headers,
+                json=payload,
+                timeout=timeout
+            )
+
+            record_response(query, len(response.content), response.headers.get('X-Complexity'))
+            reset_at = self._update_rate_limits(response)
+            if not self._is_rate_limited(response) or attempt == self.max_rate_limit_waits:
+                break
+            self._throttle_reset(response, reset_at)
+
+        return self._parse_response(response)
+
+    async def _send_client_id_mutation(self, mutation: str, variables: Dict) -> Optional[Dict]:
+        """
+        Send a mutation that creates records under client-generated ids, retrying transient failures.
+
+        See LinearClient._send_client_id_mutation: a retry rejected because the
+        id already exists counts as success and returns None.
+        """
+        endpoint, _ = self._operation_info(mutation, True)
+        attempts = 0
+
+        async def send() -> Optional[Dict]:
+            nonlocal attempts
+            attempts += 1
+            try:
+                return await self._send(mutation, variables)
+            except Exception as e:
+                if attempts > 1 and self._is_duplicate_id(e):
+                    return None
+                raise
+
+        return await self.retry_policy.call_async(send, endpoint=endpoint, idempotent=True)
+
+    async def get_issue_by_identifier(self, identifier: str, projection: str = 'execute') -> Dict:
+        """
+        Fetch issue by identifier (e.g., 'TRA-56').
+
+        Args:
+            identifier: Issue identifier
+            projection: Fields to select (see linear_queries.PROJECTIONS)
+
+        Returns:
+            Issue data dictionary, or {} if not found
+        """
+        team_key, issue_number = self._parse_identifier(identifier)
+
+        issue_uuid = self._indexed_uuid(identifier)
+        if issue_uuid:
+            try:
+                data = await self._make_request(issue_query('GetIssueById', projection).document, {"id": issue_uuid})
+            except Exception as e:
+                if not self._is_not_found(e):
+                    raise
+                data = {}
+            issue = data.get('issue') or {}
+            if issue.get('identifier') == identifier:
+                return issue
+            # Stale index entry (issue moved or deleted) - fall through to a fresh lookup
+            self._forget_identifier(identifier)
+
+        data = await self._make_request(issue_query('GetIssueByNumber', projection).document,
+                                        {"teamKey": team_key, "number": issue_number})
+        issues = data.get('issues', {}).get('nodes', [])
+        self._index_issues(issues)
+
+        for issue in issues:
+            if issue.get('identifier') == identifier:
+                return issue
+
+        return {}  # Not found
+
+    async def get_teams(self, refresh: bool = False) -> List[Dict]:
+        """
+        Get all teams in the workspace (cached).
+
+        Args:
+            refresh: Bypass the cache and refetch
+
+        Returns:
+            List of team dictionaries with id, key and name
+        """
+        teams = None if refresh else self.metadata.get('teams')
+        if teams is None:
+            data = await self._make_request(TEAMS_QUERY.document)
+            teams = data.get('teams', {}).get('nodes', [])
+            self.metadata.set('teams', teams)
+        return teams
+
+    async def get_workflow_states(self, team_id: str, refresh: bool = False) -> List[Dict]:
+        """
+        Get workflow states for a team (cached).
+
+        Args:
+            team_id: Linear team UUID
+            refresh: Bypass the cache and refetch
+
+        Returns:
+            List of state dictionaries with id, name and type
+        """
+        cache_key = f"states:{team_id}"
+        states = None if refresh else self.metadata.get(cache_key)
+        if states is None:
+            data = await self._make_request(TEAM_STATES_QUERY.document, {"teamId": team_id})
+            states = (data.get('team') or {}).get('states', {}).get('nodes', [])
+            self.metadata.set(cache_key, states)
+        return states
+
+    async def update_issue_status(self, issue_id: str, status_name: str) -> Dict:
+        """
+        Update issue status.
+
+        Args:
+            issue_id: Issue identifier
+            status_name: Status name (e.g., 'In Review', 'In Progress', 'Done')
+
+        Returns:
+            Updated issue data
+        """
+        issue = await self.get_issue_by_identifier(issue_id, projection='lookup')
+        if not issue:
+            raise ValueError(f"Issue {issue_id} not found")
+
+        target_state = None
+        for refresh in (False, True):
+            states = await self.get_workflow_states(issue['team']['id'], refresh=refresh)
+            target_state = self._match_state(states, status_name)
+            if target_state:
+                break
+        if not target_state:
+            raise self._state_not_found(states, status_name)
+
+        variables = {
+            "id": issue['id'],
+            "stateId": target_state['id']
+        }
+        data = await self._make_request(UPDATE_ISSUE_STATE_MUTATION.document, variables)
+        return data.get('issueUpdate', {}).get('issue', {})
+
+    async def add_comment(self, issue_id: str, comment: str) -> Dict:
+        """
+        Add comment to issue.
+
+        Args:
+            issue_id: Issue identifier
+            comment: Comment text
+
+        Returns:
+            Created comment data
+        """
+        issue = await self.get_issue_by_identifier(issue_id, projection='lookup')
+        if not issue:
+            raise ValueError(f"Issue {issue_id} not found.\n\n{ISSUE_NOT_FOUND_HELP}")
+
+        # Client-generated comment id makes the mutation safe to retry
+        variables = {
+            "id": str(uuid.uuid4()),
+            "issueId": issue['id'],
+            "body": comment
+        }
+        data = await self._send_client_id_mutation(CREATE_COMMENT_MUTATION.document, variables)
+        if data is None:
+            # Created by an attempt whose response was lost
+            return {'id': variables['id'], 'body': comment}
+        return data.get('commentCreate', {}).get('comment', {})
+
+    async def get_team_issues(self, team_key: str, limit: int = 100) -> List[Dict]:
+        """
+        Get all issues for a team.
+
+        Args:
+            team_key: Team key (e.g., 'TRA')
+            limit: Maximum number of issues to fetch
+
+        Returns:
+            List of issue dictionaries
+        """
+        return [issue async for issue in self.iter_team_issues(team_key, limit=limit)]
+
+    async def _iter_connection(self, query: str, variables: Dict, path: Tuple[str, ...],
+                               page_size: int, limit: Optional[int]) -> AsyncIterator[Dict]:
+        """
+        Page through an issue connection, following pageInfo.endCursor.
+
+        Args:
+            query: Paginated document taking $first and $after
+            variables: Remaining variables (filter, team key, ...)
+            path: Keys from the response data to the connection (e.g., ('team', 'issues'))
+            page_size: Issues per request
+            limit: Optional maximum number of issues to yield
+
+        Yields:
+            Issue dictionaries (also added to the identifier index)
+        """
+        after = None
+        yielded = 0
+        while True:
+            first = page_size if limit is None else min(page_size, limit - yielded)
+            data = await self._make_request(query, {**variables, "first": first, "after": after})
+            connection = data
+            for key in path:
+                connection = (connection or {}).get(key) or {}
+            issues = connection.get('nodes', [])
+            self._index_issues(issues)
+
+            for issue in issues:
+                yield issue
+            yielded += len(issues)
+
+            page_info = connection.get('pageInfo', {})
+            if not page_info.get('hasNextPage') or not issues:
+                return
+            if limit is not None and yielded >= limit:
+                return
+            after = page_info.get('endCursor')
+
+    async def iter_team_issues(self, team_key: str, page_size: int = 50,
+                               projection: str = 'list', issue_filter: Optional[Dict] = None,
+                               limit: Optional[int] = None,
+                               include_archived: bool = False) -> AsyncIterator[Dict]:
+        """
+        Stream a team's issues page by page (see LinearClient.iter_team_issues).
+
+        Yields:
+            Issue dictionaries
+        """
+        variables = {"teamKey": team_key, "filter": issue_filter, "includeArchived": include_archived}
+        async for issue in self._iter_connection(team_issues_query(projection).document, variables,
+                                                 ('team', 'issues'), page_size, limit):
+            yield issue
+
+    async def iter_issues(self, issue_filter: Optional[Dict] = None, page_size: int = 50,
+                          projection: str = 'list', limit: Optional[int] = None,
+                          include_archived: bool = False) -> AsyncIterator[Dict]:
+        """
+        Stream issues across the whole workspace (see LinearClient.iter_issues).
+
+        Yields:
+            Issue dictionaries
+        """
+        variables = {"filter": issue_filter, "includeArchived": include_archived}
+        async for issue in self._iter_connection(issues_query(projection).document, variables,
+                                                 ('issues',), page_size, limit):
+            yield issue
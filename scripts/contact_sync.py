@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+Bulk ActiveCampaign contact import and export.
+
+Imports stream rows from a CSV (or any iterable of dicts) in chunks of 250
+through AC's bulk import endpoint, poll each batch until AC has processed
+it, and record progress in a JSON file so an interrupted run resumes at the
+first unfinished chunk. Exports page through /api/3/contacts and stream
+rows into a Parquet file (when pyarrow is installed) or CSV, so neither
+direction holds the full contact list in memory.
+
+Usage:
+    sync = ContactSync(ActiveCampaignClient())
+    summary = sync.import_csv('contacts.csv')
+    count = sync.export_contacts('contacts.parquet')
+
+    python contact_sync.py import contacts.csv [--job NAME] [--no-wait]
+    python contact_sync.py export contacts.parquet [--format csv]
+    python contact_sync.py status BATCH_ID
+"""
+
+import csv
+import hashlib
+import json
+import os
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from activecampaign_client import ActiveCampaignClient, BULK_IMPORT_MAX_CONTACTS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+DEFAULT_PROGRESS_DIR = Path(__file__).parent.parent / ".cache" / "contact_sync"
+DEFAULT_POLL_INTERVAL = 5  # Seconds between bulk import status checks
+DEFAULT_IMPORT_TIMEOUT = 3600  # Seconds to wait for queued batches before giving up
+EXPORT_BATCH_ROWS = 10000  # Rows buffered per Parquet row group / CSV flush
+EXPORT_MAX_PAGES_AHEAD = 8  # Upper bound on contact pages fetched ahead of the writer
+
+# Columns written by export_contacts, in order
+EXPORT_FIELDS = ['id', 'email', 'firstName', 'lastName', 'phone', 'orgname', 'cdate', 'udate']
+
+# CSV header -> bulk import field (headers are matched case-insensitively)
+IMPORT_COLUMNS = {
+    'email': 'email',
+    'first_name': 'first_name',
+    'firstname': 'first_name',
+    'last_name': 'last_name',
+    'lastname': 'last_name',
+    'phone': 'phone',
+    'orgname': 'customer_acct_name',
+    'customer_acct_name': 'customer_acct_name',
+}
+
+
+def contact_from_row(row: Dict) -> Optional[Dict]:
+    """
+    Convert a CSV row into a bulk import contact.
+
+    Recognized columns are email, first_name, last_name, phone and orgname;
+    'tags' holds ';'-separated tag names and 'field:<id>' columns set custom
+    field values. Other columns are ignored.
+
+    Args:
+        row: CSV row dictionary
+
+    Returns:
+        Contact dictionary, or None if the row has no email
+    """
+    contact = {}
+    fields = []
+    for column, value in row.items():
+        if column is None or value in (None, ''):
+            continue
+        key = column.strip().lower()
+        if key in IMPORT_COLUMNS:
+            contact[IMPORT_COLUMNS[key]] = value.strip()
+        elif key == 'tags':
+            contact['tags'] = [tag.strip() for tag in value.split(';') if tag.strip()]
+        elif key.startswith('field:'):
+            fields.append({'id': int(key.split(':', 1)[1]), 'value': value})
+    if fields:
+        contact['fields'] = fields
+    return contact if contact.get('email') else None
+
+
+def iter_chunks(contacts: Iterable[Dict], size: int = BULK_IMPORT_MAX_CONTACTS) -> Iterator[List[Dict]]:
+    """Yield lists of up to `size` contacts without materializing the input."""
+    iterator = iter(contacts)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ImportProgress:
+    """Per-job record of submitted and finished import chunks, persisted as JSON."""
+
+    def __init__(self, path: Path, source: str):
+        """
+        Load progress for a job, starting over if the source has changed.
+
+        Args:
+            path: Progress file path
+            source: Fingerprint of the import source (e.g., file path + size + mtime)
+        """
+        self.path = Path(path)
+        self.state = {'source': source, 'chunks': {}}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    saved = json.load(f)
+            except (OSError, ValueError):
+                saved = {}
+            if saved.get('source') == source:
+                self.state = saved
+            elif saved:
+                print(f"⚠️  Import source changed since the last run; starting {self.path.stem} over")
+
+    def chunk(self, index: int) -> Optional[Dict]:
+        """Get the record for a chunk, or None if it was never submitted."""
+        return self.state['chunks'].get(str(index))
+
+    def update(self, index: int, **values) -> None:
+        """Merge values into a chunk record and save."""
+        self.state['chunks'].setdefault(str(index), {}).update(values)
+        self.save()
+
+    def pending(self) -> Dict[str, Dict]:
+        """Chunks submitted but not yet reported finished by AC."""
+        return {index: chunk for index, chunk in self.state['chunks'].items()
+                if chunk.get('batch_id') and chunk.get('status') != 'completed'}
+
+    def save(self) -> None:
+        """Write progress atomically so a crash never leaves a truncated file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class ContactSync:
+    """Chunked, resumable contact import and streaming export for ActiveCampaign."""
+
+    def __init__(self, client: ActiveCampaignClient, progress_dir: Path = DEFAULT_PROGRESS_DIR,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Initialize contact sync.
+
+        Args:
+            client: ActiveCampaign client (shares its rate limiter and session)
+            progress_dir: Directory for per-job progress and failure files
+            poll_interval: Seconds between bulk import status checks
+        """
+        self.client = client
+        self.progress_dir = Path(progress_dir)
+        self.poll_interval = poll_interval
+
+    def import_csv(self, path: str, job: Optional[str] = None, wait: bool = True,
+                   timeout: float = DEFAULT_IMPORT_TIMEOUT) -> Dict:
+        """
+        Import contacts from a CSV file, resuming a previous run of the same job.
+
+        Args:
+            path: CSV file with a header row (see contact_from_row)
+            job: Job name for the progress file (default: CSV file name)
+            wait: Poll until AC has processed every batch
+            timeout: Seconds to wait for processing when wait is True
+
+        Returns:
+            Import summary (see import_contacts)
+        """
+        path = Path(path)
+        stat = path.stat()
+        source = f"{path.resolve()}:{stat.st_size}:{int(stat.st_mtime)}"
+        with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+            contacts = (contact for contact in map(contact_from_row, csv.DictReader(f)) if contact)
+            return self.import_contacts(contacts, job or path.stem, source=source, wait=wait, timeout=timeout)
+
+    def import_contacts(self, contacts: Iterable[Dict], job: str, source: Optional[str] = None,
+                        wait: bool = True, timeout: float = DEFAULT_IMPORT_TIMEOUT) -> Dict:
+        """
+        Import contacts in chunks of 250, skipping chunks a previous run already submitted.
+
+        Chunks are identified by position, so a resumed run must read the same
+        input in the same order. Resubmitting a chunk is harmless because AC
+        upserts contacts by email.
+
+        Args:
+            contacts: Iterable of bulk import contact dictionaries
+            job: Job name for the progress file
+            source: Fingerprint of the input; progress for a different source is discarded
+            wait: Poll until AC has processed every batch
+            timeout: Seconds to wait for processing when wait is True
+
+        Returns:
+            Dictionary with chunk, contact and failure counts, and the progress file path
+        """
+        progress = ImportProgress(self._job_path(job, '.progress.json'), source or job)
+
+        submitted = skipped = 0
+        for index, chunk in enumerate(iter_chunks(contacts)):
+            if progress.chunk(index):
+                skipped += 1
+                continue
+            response = self.client.bulk_import_contacts(chunk)
+            progress.update(index, batch_id=response.get('batchId'), count=len(chunk),
+                            status='queued', submitted_at=time.time())
+            submitted += 1
+            print(f"Queued chunk {index + 1} ({len(chunk)} contacts, batch {response.get('batchId')})")
+
+        if wait:
+            self.wait_for_imports(progress, job, timeout=timeout)
+
+        chunks = progress.state['chunks'].values()
+        return {
+            'job': job,
+            'chunks_submitted': submitted,
+            'chunks_skipped': skipped,
+            'contacts': sum(chunk.get('count', 0) for chunk in chunks),
+            'failed': sum(chunk.get('failed', 0) for chunk in chunks),
+            'pending_chunks': len(progress.pending()),
+            'progress_file': str(progress.path),
+        }
+
+    def wait_for_imports(self, progress: ImportProgress, job: str,
+                         timeout: float = DEFAULT_IMPORT_TIMEOUT) -> None:
+        """
+        Poll queued batches until AC reports them completed or the timeout passes.
+
+        Failed emails are appended to <job>.failures.txt.
+
+        Args:
+            progress: Progress record for the job
+            job: Job name (used for the failures file)
+            timeout: Seconds to keep polling
+        """
+        deadline = time.time() + timeout
+        failures_path = self._job_path(job, '.failures.txt')
+        while progress.pending():
+            for index, chunk in progress.pending().items():
+                status = self.client.get_bulk_import_status(chunk['batch_id'])
+                if status.get('status') != 'completed':
+                    continue
+                failed = status.get('failure') or []
+                if failed:
+                    with open(failures_path, 'a') as f:
+                        f.writelines(f"{email}\n" for email in failed)
+                progress.update(int(index), status='completed', failed=len(failed))
+                print(f"✅ Chunk {int(index) + 1} imported ({chunk.get('count', 0) - len(failed)} ok, {len(failed)} failed)")
+
+            if not progress.pending():
+                return
+            if time.time() >= deadline:
+                print(f"⚠️  {len(progress.pending())} chunk(s) still processing; re-run the job to resume polling")
+                return
+            time.sleep(self.poll_interval)
+
+    def export_contacts(self, path: str, file_format: str = 'auto', params: Optional[Dict] = None,
+                        concurrency: Optional[int] = None) -> int:
+        """
+        Stream every contact into a Parquet or CSV file.
+
+        Memory stays bounded regardless of the contact count: at most
+        `concurrency` pages (of MAX_PAGE_SIZE contacts) are in flight or
+        buffered ahead of the writer, plus one batch of EXPORT_BATCH_ROWS rows.
+
+        Args:
+            path: Output file path
+            file_format: 'parquet', 'csv', or 'auto' (by file extension; other
+                         extensions get Parquet when pyarrow is installed)
+            params: Extra filters for /api/3/contacts
+            concurrency: Pages fetched ahead of the writer (default: client
+                         setting, capped at EXPORT_MAX_PAGES_AHEAD)
+
+        Returns:
+            Number of contacts written
+        """
+        if file_format == 'auto':
+            suffix = Path(path).suffix.lower()
+            if suffix in ('.parquet', '.csv'):
+                file_format = suffix[1:]
+            else:
+                file_format = 'parquet' if PYARROW_AVAILABLE else 'csv'
+        if file_format == 'parquet' and not PYARROW_AVAILABLE:
+            raise ImportError(
+                "Parquet export requires pyarrow.\n\n"
+                "Next steps:\n"
+                "1. Install it: pip install pyarrow\n"
+                "2. Or export to CSV: --format csv"
+            )
+
+        read_ahead = max(1, min(concurrency or self.client.concurrency, EXPORT_MAX_PAGES_AHEAD))
+        rows = (
+            {field: contact.get(field) for field in EXPORT_FIELDS}
+            for contact in self.client.iter_contacts(params=params, concurrency=read_ahead)
+        )
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        if file_format == 'parquet':
+            return self._write_parquet(path, rows)
+        return self._write_csv(path, rows)
+
+    @staticmethod
+    def _write_parquet(path: str, rows: Iterable[Dict]) -> int:
+        """Write rows in row groups of EXPORT_BATCH_ROWS, all columns as strings."""
+        schema = pa.schema([(field, pa.string()) for field in EXPORT_FIELDS])
+        count = 0
+        with pq.ParquetWriter(str(path), schema) as writer:
+            for batch in iter_chunks(rows, EXPORT_BATCH_ROWS):
+                columns = {field: [None if row[field] is None else str(row[field]) for row in batch]
+                           for field in EXPORT_FIELDS}
+                writer.write_table(pa.table(columns, schema=schema))
+                count += len(batch)
+        return count
+
+    @staticmethod
+    def _write_csv(path: str, rows: Iterable[Dict]) -> int:
+        """Write rows to CSV with a header row."""
+        count = 0
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+            for batch in iter_chunks(rows, EXPORT_BATCH_ROWS):
+                writer.writerows(batch)
+                count += len(batch)
+        return count
+
+    def _job_path(self, job: str, suffix: str) -> Path:
+        """Progress-dir path for a job, safe for any job name."""
+        safe = ''.join(c if c.isalnum() or c in '-_' else '_' for c in job)
+        if safe != job:
+            safe = f"{safe}-{hashlib.sha256(job.encode('utf-8')).hexdigest()[:8]}"
+        return self.progress_dir / f"{safe}{suffix}"
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Bulk import or export ActiveCampaign contacts')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = subparsers.add_parser('import', help='Import contacts from a CSV file')
+    import_parser.add_argument('csv_path', help='CSV with email, first_name, last_name, phone, tags columns')
+    import_parser.add_argument('--job', help='Job name for resumable progress (default: file name)')
+    import_parser.add_argument('--no-wait', action='store_true', help='Queue batches without waiting for AC to process them')
+
+    export_parser = subparsers.add_parser('export', help='Export all contacts to Parquet or CSV')
+    export_parser.add_argument('output_path', help='Output file (.parquet or .csv)')
+    export_parser.add_argument('--format', choices=['auto', 'parquet', 'csv'], default='auto')
+
+    status_parser = subparsers.add_parser('status', help='Show the status of a bulk import batch')
+    status_parser.add_argument('batch_id')
+
+    args = parser.parse_args()
+    sync = ContactSync(ActiveCampaignClient())
+
+    if args.command == 'import':
+        summary = sync.import_csv(args.csv_path, job=args.job, wait=not args.no_wait)
+        print(f"\n✅ {summary['contacts']} contacts in {summary['chunks_submitted'] + summary['chunks_skipped']} chunk(s) "
+              f"({summary['chunks_skipped']} resumed), {summary['failed']} failed, "
+              f"{summary['pending_chunks']} still processing")
+        print(f"Progress: {summary['progress_file']}")
+    elif args.command == 'export':
+        count = sync.export_contacts(args.output_path, file_format=args.format)
+        print(f"✅ Exported {count} contacts to {args.output_path}")
+    else:
+        print(json.dumps(sync.client.get_bulk_import_status(args.batch_id), indent=2))
@@ -0,0 +1,282 @@
+"""
+Compile Markdown into a single Google Docs batchUpdate request list.
+
+The whole document is inserted with one insertText; headings, lists, bold,
+italic, inline code and links are then applied as style requests whose
+indexes are all computed up front, in one pass. Adjacent ranges with the
+same style are merged, so even a long SOP document goes out as one
+batchUpdate with a few requests per styled run instead of one per line.
+
+Indexes are counted in UTF-16 code units, as the Docs API expects, so
+emoji outside the Basic Multilingual Plane (e.g. 🚀, which takes two units)
+don't shift later ranges.
+
+Supported Markdown: ATX headings (#..######), paragraphs, bulleted and
+numbered lists (nested by indentation), fenced code blocks, blockquotes,
+**bold**, *italic*, `code` and [links](url). Table rows are kept as plain
+text lines and horizontal rules are dropped.
+
+Usage:
+    requests = markdown_to_requests(open('task-execution-guides/TRA-54-SOP-manual.md').read())
+    docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests}).execute()
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+CODE_FONT = 'Roboto Mono'
+BLOCKQUOTE_INDENT = {'magnitude': 36, 'unit': 'PT'}
+BULLET_PRESET = 'BULLET_DISC_CIRCLE_SQUARE'
+NUMBERED_PRESET = 'NUMBERED_DECIMAL_ALPHA_ROMAN'
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*?)(?:\s+#+)?\s*$')
+LIST_ITEM_PATTERN = re.compile(r'^(\s*)([-*+]|\d+[.)])\s+(.*)$')
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+RULE_PATTERN = re.compile(r'^\s*([-*_])(?:\s*\1){2,}\s*$')
+QUOTE_PATTERN = re.compile(r'^\s*>\s?(.*)$')
+TABLE_SEPARATOR_PATTERN = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+INLINE_PATTERN = re.compile(
+    r'`(?P<code>[^`]+)`'
+    r'|\[(?P<link_text>[^\]]+)\]\((?P<url>[^)\s]+)\)'
+    r'|\*\*\*(?P<bold_italic>.+?)\*\*\*'
+    r'|\*\*(?P<bold>.+?)\*\*'
+    r'|(?<!\w)__(?P<bold_underscore>.+?)__(?!\w)'
+    r'|\*(?P<italic>[^*\s](?:.*?[^*\s])?)\*'
+    r'|(?<!\w)_(?P<italic_underscore>[^_\s](?:.*?[^_\s])?)_(?!\w)'
+)
+
+Segment = Tuple[str, Dict]  # (text, updateTextStyle textStyle - empty for plain text)
+
+
+def utf16_len(text: str) -> int:
+    """Length of text in UTF-16 code units (the unit of Docs API indexes)."""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def parse_inline(text: str, style: Optional[Dict] = None) -> List[Segment]:
+    """
+    Split a line of Markdown into (text, textStyle) segments.
+
+    Args:
+        text: Markdown text without block syntax (no '#', '-', '>' prefix)
+        style: Style inherited from an enclosing span
+
+    Returns:
+        Segments in order; plain text has an empty style
+    """
+    style = style or {}
+    segments: List[Segment] = []
+    position = 0
+    for match in INLINE_PATTERN.finditer(text):
+        if match.start() > position:
+            segments.append((text[position:match.start()], style))
+        kind = match.lastgroup
+        if kind == 'code':
+            segments.append((match.group('code'), {**style, 'weightedFontFamily': {'fontFamily': CODE_FONT}}))
+        elif kind == 'url':
+            segments.extend(parse_inline(match.group('link_text'), {**style, 'link': {'url': match.group('url')}}))
+        elif kind == 'bold_italic':
+            segments.extend(parse_inline(match.group(kind), {**style, 'bold': True, 'italic': True}))
+        elif kind in ('bold', 'bold_underscore'):
+            segments.extend(parse_inline(match.group(kind), {**style, 'bold': True}))
+        else:
+            segments.extend(parse_inline(match.group(kind), {**style, 'italic': True}))
+        position = match.end()
+    if position < len(text):
+        segments.append((text[position:], style))
+    return segments
+
+
+def parse_blocks(markdown: str) -> List[Dict]:
+    """
+    Split Markdown into paragraphs.
+
+    Each paragraph is a dictionary with 'kind' ('heading', 'item', 'code',
+    'quote', 'row', 'text' or 'blank') and 'text'; headings also carry 'level',
+    list items 'level' (nesting depth) and 'ordered'.
+
+    Args:
+        markdown: Markdown source
+
+    Returns:
+        Paragraph dictionaries in document order
+    """
+    paragraphs: List[Dict] = []
+    in_code = False
+    list_indents: List[int] = []
+
+    def add(paragraph: Dict) -> None:
+        previous = paragraphs[-1] if paragraphs else None
+        if paragraph['kind'] == 'blank':
+            # Collapse runs of blank lines; none at the start or right after a heading
+            if previous is None or previous['kind'] in ('blank', 'heading'):
+                return
+        elif previous and previous['kind'] == 'blank':
+            before = paragraphs[-2]
+            # A blank line between list items (a "loose" list) doesn't split the list
+            if paragraph['kind'] == 'item' and before['kind'] == 'item':
+                paragraphs.pop()
+        paragraphs.append(paragraph)
+
+    for line in markdown.replace('\r\n', '\n').split('\n'):
+        if FENCE_PATTERN.match(line):
+            in_code = not in_code
+            list_indents = []
+            continue
+        if in_code:
+            paragraphs.append({'kind': 'code', 'text': line.rstrip()})
+            continue
+
+        stripped = line.strip()
+        if not stripped or RULE_PATTERN.match(line):
+            add({'kind': 'blank', 'text': ''})
+            continue
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            list_indents = []
+            add({'kind': 'heading', 'level': len(heading.group(1)), 'text': heading.group(2)})
+            continue
+
+        item = LIST_ITEM_PATTERN.match(line)
+        if item:
+            indent = len(item.group(1).expandtabs(4))
+            while list_indents and indent < list_indents[-1]:
+                list_indents.pop()
+            if not list_indents or indent > list_indents[-1]:
+                list_indents.append(indent)
+            add({'kind': 'item', 'level': len(list_indents) - 1,
+                 'ordered': item.group(2)[0].isdigit(), 'text': item.group(3).strip()})
+            continue
+
+        previous = paragraphs[-1] if paragraphs else None
+        if list_indents and previous and previous['kind'] == 'item':
+            # Continuation line of a list item
+            previous['text'] += ' ' + stripped
+            continue
+        list_indents = []
+
+        quote = QUOTE_PATTERN.match(line)
+        if quote:
+            if previous and previous['kind'] == 'quote':
+                previous['text'] += ' ' + quote.group(1).strip()
+            else:
+                add({'kind': 'quote', 'text': quote.group(1).strip()})
+        elif stripped.startswith('|'):
+            # Table rows stay one paragraph per row; the |---| separator row is dropped
+            if not TABLE_SEPARATOR_PATTERN.match(line):
+                add({'kind': 'row', 'text': stripped})
+        elif previous and previous['kind'] == 'text':
+            previous['text'] += ' ' + stripped
+        else:
+            add({'kind': 'text', 'text': stripped})
+
+    while paragraphs and paragraphs[-1]['kind'] == 'blank':
+        paragraphs.pop()
+    return paragraphs
+
+
+def _merge_ranges(ranges: List[Tuple[int, int, Dict]], newlines: set) -> List[Tuple[int, int, Dict]]:
+    """Merge same-style ranges that touch or are separated only by a paragraph break."""
+    merged: List[Tuple[int, int, Dict]] = []
+    for start, end, style in ranges:
+        if merged:
+            last_start, last_end, last_style = merged[-1]
+            if last_style == style and (start == last_end or (start == last_end + 1 and last_end in newlines)):
+                merged[-1] = (last_start, end, style)
+                continue
+        merged.append((start, end, style))
+    return merged
+
+
+def markdown_to_requests(markdown: str, start_index: int = 1) -> List[Dict]:
+    """
+    Compile Markdown into Docs batchUpdate requests.
+
+    Request order matters and is handled here: one insertText, then
+    paragraph styles, then text styles, then list bullets from the end of
+    the document backwards (createParagraphBullets deletes the leading tabs
+    that encode nesting, which shifts everything after the list).
+
+    Args:
+        markdown: Markdown source
+        start_index: Index to insert at (1 = start of an empty document body)
+
+    Returns:
+        List of batchUpdate requests (empty if the Markdown has no content)
+    """
+    paragraphs = parse_blocks(markdown)
+    if not paragraphs:
+        return []
+
+    pieces: List[str] = []
+    newlines = set()
+    paragraph_styles: List[Tuple[int, int, Dict]] = []
+    text_styles: List[Tuple[int, int, Dict]] = []
+    lists: List[Tuple[int, int, bool]] = []  # (start, end, ordered) per run of consecutive items
+    position = start_index
+
+    for paragraph in paragraphs:
+        kind = paragraph['kind']
+        if kind == 'code':
+            segments = [(paragraph['text'], {'weightedFontFamily': {'fontFamily': CODE_FONT}})]
+        elif kind == 'blank':
+            segments = []
+        else:
+            segments = parse_inline(paragraph['text'])
+        if kind == 'item':
+            # Leading tabs set the nesting level when bullets are created
+            segments.insert(0, ('\t' * paragraph['level'], {}))
+
+        paragraph_start = position
+        for text, style in segments:
+            length = utf16_len(text)
+            if not length:
+                continue
+            pieces.append(text)
+            if style:
+                text_styles.append((position, position + length, style))
+            position += length
+        paragraph_end = position
+
+        if paragraph_end > paragraph_start:
+            if kind == 'heading':
+                paragraph_styles.append((paragraph_start, paragraph_end,
+                                         {'namedStyleType': f"HEADING_{paragraph['level']}"}))
+            elif kind == 'quote':
+                paragraph_styles.append((paragraph_start, paragraph_end,
+                                         {'indentStart': BLOCKQUOTE_INDENT, 'indentFirstLine': BLOCKQUOTE_INDENT}))
+            elif kind == 'item':
+                continues = lists and lists[-1][1] == paragraph_start - 1
+                if continues and (paragraph['level'] or lists[-1][2] == paragraph['ordered']):
+                    lists[-1] = (lists[-1][0], paragraph_end, lists[-1][2])
+                else:
+                    lists.append((paragraph_start, paragraph_end, paragraph['ordered']))
+
+        pieces.append('\n')
+        newlines.add(position)
+        position += 1
+
+    # The document body already ends with a newline - reuse it for the last paragraph
+    pieces.pop()
+
+    requests: List[Dict] = [{'insertText': {'location': {'index': start_index}, 'text': ''.join(pieces)}}]
+    for start, end, style in _merge_ranges(paragraph_styles, newlines):
+        requests.append({'updateParagraphStyle': {
+            'range': {'startIndex': start, 'endIndex': end},
+            'paragraphStyle': style,
+            'fields': ','.join(style)
+        }})
+    for start, end, style in _merge_ranges(text_styles, newlines):
+        requests.append({'updateTextStyle': {
+            'range': {'startIndex': start, 'endIndex': end},
+            'textStyle': style,
+            'fields': ','.join(style)
+        }})
+    for start, end, ordered in reversed(lists):
+        requests.append({'createParagraphBullets': {
+            'range': {'startIndex': start, 'endIndex': end},
+            'bulletPreset': NUMBERED_PRESET if ordered else BULLET_PRESET
+        }})
+    return requests
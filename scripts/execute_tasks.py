@@ -17,6 +17,8 @@ import argparse
 import json
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
+from retry_policy import format_retry_stats
+from linear_queries import format_query_stats
 
 # Load environment variables
 # Try loading from workspace root (parent directory of scripts/)
@@ -167,27 +169,20 @@ class TaskExecutor:
             # 3. Create Google Doc with structure
             try:
                 doc_title = "Contact Lifecycle States Documentation"
-                doc_id = self.google_docs.create_document(doc_title)
-                
-                # Add content structure
-                content = [
-                    {'insertText': {'location': {'index': 1}, 'text': 'Contact Lifecycle States Documentation\n\n'}},
-                    {'insertText': {'location': {'index': 2}, 'text': '## Overview\n\n'}},
-                    {'insertText': {'location': {'index': 3}, 'text': 'This document describes all lifecycle states in the ActiveCampaign system.\n\n'}},
-                    {'insertText': {'location': {'index': 4}, 'text': '## Lifecycle States\n\n'}},
-                    {'insertText': {'location': {'index': 5}, 'text': 'To be populated with lifecycle state definitions.\n\n'}},
-                ]
-                self.google_docs.docs_service.documents().batchUpdate(
-                    documentId=doc_id,
-                    body={'requests': content}
-                ).execute()
+                content = (
+                    "# Contact Lifecycle States Documentation\n\n"
+                    "## Overview\n\n"
+                    "This document describes all lifecycle states in the ActiveCampaign system.\n\n"
+                    "## Lifecycle States\n\n"
+                    "To be populated with lifecycle state definitions.\n"
+                )
+                doc_id = self.google_docs.create_document_from_markdown(doc_title, content)
                 
                 doc_url = self.google_docs.get_document_url(doc_id)
                 
                 # 4. Update Linear issue
                 comment = f"✅ Lifecycle states documentation created.\n\n**Document:** {doc_url}\n\n**Status:** Document structure created. Ready for lifecycle state definitions to be populated.\n\n**Next Steps:**\n1. Extract lifecycle state definitions from ActiveCampaign\n2. Populate the document with state details\n3. Add state transitions and business rules"
-                self.linear.add_comment('TRA-56', comment)
-                self.linear.update_issue_status('TRA-56', 'In Review')
+                self.linear.update_issue('TRA-56', comment=comment, status='In Review')
                 
                 return {
                     'success': True,
@@ -225,36 +220,21 @@ class TaskExecutor:
             issue = self.linear.get_issue_by_identifier('TRA-54')
             full_description = issue.get('description', '') if issue else ''
             
-            # Create Google Doc with full SOP structure
-            doc_title = "Trade Ideas - ActiveCampaign Operations SOP Manual"
-            doc_id = self.google_docs.create_document(doc_title)
-            
-            # Format the content for Google Docs
             # Extract the main structure (everything before "### Subtasks")
             content_text = full_description
             subtasks_start = content_text.find('### Subtasks')
             if subtasks_start != -1:
                 content_text = content_text[:subtasks_start].strip()
             
-            # Insert the full SOP structure
-            requests = [{
-                'insertText': {
-                    'location': {'index': 1},
-                    'text': content_text + '\n\n'
-                }
-            }]
-            
-            self.google_docs.docs_service.documents().batchUpdate(
-                documentId=doc_id,
-                body={'requests': requests}
-            ).execute()
+            # Create Google Doc with the full SOP structure (Markdown headings, lists and emphasis kept)
+            doc_title = "Trade Ideas - ActiveCampaign Operations SOP Manual"
+            doc_id = self.google_docs.create_document_from_markdown(doc_title, content_text)
             
             doc_url = self.google_docs.get_document_url(doc_id)
             
             # Update Linear issue
             comment = f"✅ AC Operations SOP Manual created in Google Docs.\n\n**Document:** {doc_url}\n\n**Status:** Full SOP manual structure created with all sections:\n- System Overview\n- Naming Conventions\n- Tag Taxonomy\n- Automation Documentation\n- Campaign Management\n- List Hygiene & Deliverability\n- Reporting & Analytics\n- Troubleshooting\n- Change Log\n\n**Next Steps:** Populate each section with detailed content and procedures."
-            self.linear.add_comment('TRA-54', comment)
-            self.linear.update_issue_status('TRA-54', 'In Review')
+            self.linear.update_issue('TRA-54', comment=comment, status='In Review')
             
             return {
                 'success': True,
@@ -287,27 +267,13 @@ class TaskExecutor:
             
             # Create Google Doc with the structure
             doc_title = "SOP Manual Structure"
-            doc_id = self.google_docs.create_document(doc_title)
-            
-            # Insert the structure text
-            requests = [{
-                'insertText': {
-                    'location': {'index': 1},
-                    'text': structure_text + '\n\n'
-                }
-            }]
-            
-            self.google_docs.docs_service.documents().batchUpdate(
-                documentId=doc_id,
-                body={'requests': requests}
-            ).execute()
+            doc_id = self.google_docs.create_document_from_markdown(doc_title, structure_text)
             
             doc_url = self.google_docs.get_document_url(doc_id)
             
             # Update Linear issue
             comment = f"✅ SOP structure pasted into Google Doc.\n\n**Document:** {doc_url}\n\n**Status:** Structure copied from TRA-54 and pasted into document."
-            self.linear.add_comment('TRA-109', comment)
-            self.linear.update_issue_status('TRA-109', 'In Review')
+            self.linear.update_issue('TRA-109', comment=comment, status='In Review')
             
             return {
                 'success': True,
@@ -324,114 +290,30 @@ class TaskExecutor:
             if not self.clients_initialized:
                 return {'success': False, 'error': 'API clients not initialized'}
             
-            # Create Google Sheet
             sheet_title = "Trade Ideas - Email Marketing Analytics"
-            sheet_id = self.google_sheets.create_spreadsheet(sheet_title)
             
             # Define all tabs and their headers
             tabs_config = {
                 # Raw Data Tabs
-                'Raw - Contacts': [
-                    ['email', 'first_name', 'last_name', 'created_date', 'tags', 'last_open', 'last_click']
-                ],
-                'Raw - Automations': [
-                    ['automation_id', 'automation_name', 'contact_email', 'entered_date', 'exited_date', 'status']
-                ],
-                'Raw - Campaigns': [
-                    ['campaign_id', 'campaign_name', 'contact_email', 'sent_date', 'opened', 'clicked', 'bounced']
-                ],
-                'Raw - Stripe': [
-                    ['customer_email', 'subscription_id', 'plan_name', 'status', 'mrr', 'billing_interval', 'created_date', 'canceled_date']
-                ],
+                'Raw - Contacts': ['email', 'first_name', 'last_name', 'created_date', 'tags', 'last_open', 'last_click'],
+                'Raw - Automations': ['automation_id', 'automation_name', 'contact_email', 'entered_date', 'exited_date', 'status'],
+                'Raw - Campaigns': ['campaign_id', 'campaign_name', 'contact_email', 'sent_date', 'opened', 'clicked', 'bounced'],
+                'Raw - Stripe': ['customer_email', 'subscription_id', 'plan_name', 'status', 'mrr', 'billing_interval', 'created_date', 'canceled_date'],
                 # Processed Data Tabs
-                'Contacts': [
-                    ['email', 'first_name', 'last_name', 'created_date', 'engagement_tag', 'customer_tag', 
-                     'product_tag', 'intent_tags', 'interest_tags', 'suppress_tags', 'last_open', 'last_click',
-                     'stripe_status', 'stripe_mrr', 'stripe_plan']
-                ],
-                'Events': [
-                    ['event_id', 'email', 'event_type', 'event_date', 'source', 'source_name', 'details']
-                ],
-                'Subscriptions': [
-                    ['email', 'subscription_id', 'plan_name', 'status', 'mrr', 'billing_interval', 
-                     'created_date', 'canceled_date', 'cancel_reason']
-                ]
+                'Contacts': ['email', 'first_name', 'last_name', 'created_date', 'engagement_tag', 'customer_tag',
+                             'product_tag', 'intent_tags', 'interest_tags', 'suppress_tags', 'last_open', 'last_click',
+                             'stripe_status', 'stripe_mrr', 'stripe_plan'],
+                'Events': ['event_id', 'email', 'event_type', 'event_date', 'source', 'source_name', 'details'],
+                'Subscriptions': ['email', 'subscription_id', 'plan_name', 'status', 'mrr', 'billing_interval',
+                                  'created_date', 'canceled_date', 'cancel_reason']
             }
             
-            # Get the spreadsheet service
-            sheets_service = self.google_sheets.sheets_service
-            
-            # Delete default "Sheet1" if it exists
-            try:
-                spreadsheet = sheets_service.spreadsheets().get(spreadsheetId=sheet_id).execute()
-                default_sheets = [s for s in spreadsheet.get('sheets', []) if s['properties']['title'] == 'Sheet1']
-                if default_sheets:
-                    requests = [{
-                        'deleteSheet': {
-                            'sheetId': default_sheets[0]['properties']['sheetId']
-                        }
-                    }]
-                    sheets_service.spreadsheets().batchUpdate(
-                        spreadsheetId=sheet_id,
-                        body={'requests': requests}
-                    ).execute()
-            except:
-                pass
-            
-            # Create all tabs with headers
-            created_tabs = []
-            for tab_name, headers in tabs_config.items():
-                # Add new sheet
-                add_sheet_request = {
-                    'addSheet': {
-                        'properties': {
-                            'title': tab_name
-                        }
-                    }
-                }
-                
-                result = sheets_service.spreadsheets().batchUpdate(
-                    spreadsheetId=sheet_id,
-                    body={'requests': [add_sheet_request]}
-                ).execute()
-                
-                new_sheet_id = result['replies'][0]['addSheet']['properties']['sheetId']
-                
-                # Add headers
-                range_name = f"{tab_name}!A1"
-                body = {
-                    'values': headers
-                }
-                sheets_service.spreadsheets().values().update(
-                    spreadsheetId=sheet_id,
-                    range=range_name,
-                    valueInputOption='RAW',
-                    body=body
-                ).execute()
-                
-                # Format header row (bold)
-                format_request = {
-                    'repeatCell': {
-                        'range': {
-                            'sheetId': new_sheet_id,
-                            'startRowIndex': 0,
-                            'endRowIndex': 1
-                        },
-                        'cell': {
-                            'userEnteredFormat': {
-                                'textFormat': {'bold': True},
-                                'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
-                            }
-                        },
-                        'fields': 'userEnteredFormat(textFormat,backgroundColor)'
-                    }
-                }
-                sheets_service.spreadsheets().batchUpdate(
-                    spreadsheetId=sheet_id,
-                    body={'requests': [format_request]}
-                ).execute()
-                
-                created_tabs.append(tab_name)
+            # Create the sheet with every tab, bold header row and frozen headers in one request
+            scaffold = self.google_sheets.scaffold_spreadsheet(sheet_title, [
+                {'title': tab_name, 'headers': headers} for tab_name, headers in tabs_config.items()
+            ])
+            sheet_id = scaffold['spreadsheet_id']
+            created_tabs = list(scaffold['sheet_ids'])
             
             sheet_url = self.google_sheets.get_spreadsheet_url(sheet_id)
             
@@ -452,8 +334,7 @@ class TaskExecutor:
             comment += "3. Add formulas to Processed tabs to transform raw data\n"
             comment += "4. Set up weekly refresh process"
             
-            self.linear.add_comment('TRA-41', comment)
-            self.linear.update_issue_status('TRA-41', 'In Review')
+            self.linear.update_issue('TRA-41', comment=comment, status='In Review')
             
             return {
                 'success': True,
@@ -553,25 +434,12 @@ class TaskExecutor:
             
             print(f"Found {len(tag_list)} tags to create")
             
-            # Step 2: Get existing tags from ActiveCampaign
-            existing_tags = self.ac.list_tags(limit=1000)
-            existing_tag_names = {tag.get('tag', '').lower(): tag for tag in existing_tags}
-            
-            # Step 3: Create tags (skip existing ones)
-            created = []
-            skipped = []
-            
-            for tag_name in tag_list:
-                # Check if tag already exists (case-insensitive)
-                if tag_name.lower() in existing_tag_names:
-                    skipped.append({'name': tag_name, 'reason': 'Already exists'})
-                else:
-                    try:
-                        tag = self.ac.create_tag(tag_name, tag_type='contact')
-                        created.append(tag)
-                        print(f"Created: {tag_name}")
-                    except Exception as e:
-                        skipped.append({'name': tag_name, 'reason': str(e)})
+            # Steps 2-3: Create missing tags in parallel (existing ones are skipped)
+            batch = self.ac.create_tags_batch(tag_list, tag_type='contact')
+            created = batch['created']
+            skipped = batch['skipped']
+            for tag in created:
+                print(f"Created: {tag.get('tag')}")
             
             # Step 4: Update Linear issue
             comment = f"✅ Tag creation completed.\n\n"
@@ -596,9 +464,8 @@ class TaskExecutor:
                     comment += f"... and {len(skipped) - 10} more\n"
             
             try:
-                self.linear.add_comment('TRA-59', comment)
-                if len(created) > 0:
-                    self.linear.update_issue_status('TRA-59', 'In Review')
+                self.linear.update_issue('TRA-59', comment=comment,
+                                         status='In Review' if len(created) > 0 else None)
             except Exception as e:
                 print(f"Warning: Could not update Linear issue: {e}")
             
@@ -621,7 +488,7 @@ class TaskExecutor:
                 return {'success': False, 'error': 'API clients not initialized'}
             
             # Get all tags from ActiveCampaign
-            all_tags = self.ac.list_tags(limit=1000)
+            all_tags = self.ac.list_tags()
             
             # Check which tags follow bracket naming convention
             bracket_tags = []
@@ -664,9 +531,8 @@ class TaskExecutor:
                 comment += "Tags will group alphabetically by category in ActiveCampaign.\n"
             
             try:
-                self.linear.add_comment('TRA-60', comment)
-                if non_bracket_count == 0:
-                    self.linear.update_issue_status('TRA-60', 'In Review')
+                self.linear.update_issue('TRA-60', comment=comment,
+                                         status='In Review' if non_bracket_count == 0 else None)
             except Exception as e:
                 print(f"Warning: Could not update Linear issue: {e}")
             
@@ -688,7 +554,7 @@ class TaskExecutor:
                 return {'success': False, 'error': 'API clients not initialized'}
             
             # Fetch task details
-            issue = self.linear.get_issue_by_identifier('TRA-63')
+            issue = self.linear.get_issue_by_identifier('TRA-63', projection='detail')
             description = issue.get('description', '')
             
             # The task says "copy already written" but we need to find where it is
@@ -773,7 +639,7 @@ class TaskExecutor:
                     tag_created = True
                 except Exception as e:
                     # If creation fails, check if it exists now (race condition)
-                    existing_tag = self.ac.get_tag_by_name(upgrade_tag_name)
+                    existing_tag = self.ac.get_tag_by_name(upgrade_tag_name, refresh=True)
                     if not existing_tag:
                         # If still doesn't exist and error is not 422 (duplicate), return error
                         error_str = str(e)
@@ -881,8 +747,7 @@ class TaskExecutor:
                 comment += f"Goal is now configured in the automation workflow."
             
             try:
-                self.linear.add_comment('TRA-65', comment)
-                self.linear.update_issue_status('TRA-65', 'In Review')
+                self.linear.update_issue('TRA-65', comment=comment, status='In Review')
             except Exception as e:
                 print(f"Warning: Could not update Linear issue: {e}")
             
@@ -958,6 +823,19 @@ def main():
         print(json.dumps(all_results, indent=2))
     else:
         parser.print_help()
+    
+    retry_summary = format_retry_stats()
+    if retry_summary:
+        print(f"\n{retry_summary}")
+    
+    query_summary = format_query_stats()
+    if query_summary:
+        print(f"\n{query_summary}")
+    
+    if API_CLIENTS_AVAILABLE:
+        coalesced = sum(c['hits'] for c in LinearClient.get_coalescing_stats().values())
+        if coalesced:
+            print(f"\nLinear requests coalesced (served by an identical in-flight query): {coalesced}")
 
 
 if __name__ == '__main__':
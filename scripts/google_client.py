@@ -1,6 +1,10 @@
 """
 Google Docs and Sheets API Client.
 
+Both clients draw credentials and service objects from the process-wide
+registry in google_services, so constructing a second client (or the same
+client again) doesn't re-read credentials or rebuild services.
+
 Usage:
     docs_client = GoogleDocsClient(credentials_path)
     doc_id = docs_client.create_document('My Document', content)
@@ -10,17 +14,162 @@ Usage:
 """
 
 import os
-from typing import Dict, List, Optional
-from google.oauth2.credentials import Credentials
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+import time
+from typing import Dict, Iterable, List, Optional, Sequence
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+from docs_markdown import markdown_to_requests
+from google_services import GOOGLE_SCOPES, get_registry
+from retry_policy import RetryPolicy, is_transient
+
+
+# Shared timeout/backoff policy for every Google API call
+GOOGLE_RETRY_POLICY = RetryPolicy(timeout=60)
+
+BATCH_LIMIT = 100  # Maximum calls Google accepts in one HTTP batch request
+
+DOCUMENT_MIME_TYPE = 'application/vnd.google-apps.document'
+SPREADSHEET_MIME_TYPE = 'application/vnd.google-apps.spreadsheet'
+
+# Default header row format for scaffolded sheets (bold on light grey)
+HEADER_FORMAT = {
+    'textFormat': {'bold': True},
+    'backgroundColor': {'red': 0.9, 'green': 0.9, 'blue': 0.9}
+}
+
+
+def a1_sheet_name(title: str) -> str:
+    """Quote a sheet title for A1 notation (e.g., 'Raw - Contacts' -> "'Raw - Contacts'")."""
+    return "'" + title.replace("'", "''") + "'"
+
+
+def execute_request(request: HttpRequest, idempotent: bool = True,
+                    policy: Optional[RetryPolicy] = None):
+    """
+    Execute a Google API request, retrying transient failures.
+    
+    Args:
+        request: Prepared googleapiclient request (e.g., files().get(...))
+        idempotent: Whether the call is safe to repeat. Creates and text
+                    insertions are not; reads, moves and formatting are.
+        policy: Optional retry policy (defaults to GOOGLE_RETRY_POLICY)
+        
+    Returns:
+        Response body
+    """
+    policy = policy or GOOGLE_RETRY_POLICY
+    endpoint = getattr(request, 'methodId', None) or request.uri.split('?')[0]
+    return policy.call(request.execute, endpoint=f"google:{endpoint}", idempotent=idempotent)
+
+
+def execute_batch(service, requests: Dict[str, HttpRequest], idempotent: bool = True,
+                  policy: Optional[RetryPolicy] = None, batch_size: int = BATCH_LIMIT) -> Dict[str, Dict]:
+    """
+    Execute independent requests as multipart HTTP batches (up to 100 calls per round-trip).
+    
+    Each call succeeds or fails on its own. When the calls are idempotent,
+    items that fail transiently (429, 5xx) are re-batched with backoff.
+    
+    Args:
+        service: Service the requests belong to (e.g., drive_service)
+        requests: Request key -> prepared request. Keys come back in the result.
+        idempotent: Whether the calls are safe to repeat
+        policy: Optional retry policy (defaults to GOOGLE_RETRY_POLICY)
+        batch_size: Calls per HTTP batch (Google allows at most 100)
+        
+    Returns:
+        Dictionary mapping each key to {'response': dict or None, 'error': Exception or None}
+    """
+    policy = policy or GOOGLE_RETRY_POLICY
+    results: Dict[str, Dict] = {}
+    pending = dict(requests)
+    attempt = 1
+    
+    while pending:
+        retry = {}
+        
+        def callback(request_id, response, exception):
+            if exception is not None and idempotent and is_transient(exception) and attempt < policy.max_attempts:
+                retry[request_id] = pending[request_id]
+            else:
+                results[request_id] = {'response': response, 'error': exception}
+        
+        keys = list(pending)
+        for start in range(0, len(keys), batch_size):
+            batch = service.new_batch_http_request(callback=callback)
+            for key in keys[start:start + batch_size]:
+                batch.add(pending[key], request_id=key)
+            endpoint = getattr(pending[keys[start]], 'methodId', None) or 'batch'
+            policy.call(batch.execute, endpoint=f"google:batch:{endpoint}", idempotent=idempotent)
+        
+        if retry:
+            delay = policy.backoff(attempt)
+            print(f"Warning: {len(retry)} batched Google call(s) failed transiently; retrying in {delay:.1f}s")
+            time.sleep(delay)
+        pending = retry
+        attempt += 1
+    
+    return results
+
+
+def drive_create_request(drive_service, title: str, mime_type: str, folder_id: Optional[str] = None) -> HttpRequest:
+    """
+    Prepare a Drive files.create for an empty Google Docs/Sheets file.
+    
+    With a folder, the file is placed there at creation time, so it never
+    needs a get-parents + update move afterwards.
+    
+    Args:
+        drive_service: Drive v3 service
+        title: File name
+        mime_type: Google Workspace MIME type (DOCUMENT_MIME_TYPE or SPREADSHEET_MIME_TYPE)
+        folder_id: Optional parent folder ID
+        
+    Returns:
+        Prepared request (response body has the new file's 'id')
+    """
+    body = {'name': title, 'mimeType': mime_type}
+    if folder_id:
+        body['parents'] = [folder_id]
+    return drive_service.files().create(body=body, fields='id', supportsAllDrives=True)
+
+
+def create_drive_file(drive_service, title: str, mime_type: str, folder_id: Optional[str] = None) -> str:
+    """
+    Create an empty Google Docs/Sheets file through Drive, optionally inside a folder.
+    
+    Args:
+        drive_service: Drive v3 service
+        title: File name
+        mime_type: Google Workspace MIME type (DOCUMENT_MIME_TYPE or SPREADSHEET_MIME_TYPE)
+        folder_id: Optional parent folder ID
+        
+    Returns:
+        File ID
+    """
+    try:
+        file = execute_request(drive_create_request(drive_service, title, mime_type, folder_id), idempotent=False)
+    except HttpError as drive_error:
+        drive_error_str = str(drive_error)
+        if 'storageQuotaExceeded' in drive_error_str or 'quota' in drive_error_str.lower():
+            # Service account has no quota - provide helpful error
+            raise Exception(
+                "Google Drive storage quota exceeded. Service account has 0 GB quota.\n\n"
+                "Solutions:\n"
+                "1. Use OAuth 2.0 credentials instead of service account\n"
+                "2. Request quota increase for service account\n"
+                "3. Use domain-wide delegation (Google Workspace)\n"
+                "4. Create documents manually in Google Drive\n\n"
+                "See GOOGLE-DRIVE-QUOTA-SOLUTION.md for details."
+            )
+        raise
+    return file['id']
 
 
 class GoogleDocsClient:
     """Client for Google Docs API."""
     
-    SCOPES = ['https://www.googleapis.com/auth/documents', 'https://www.googleapis.com/auth/drive']
+    SCOPES = GOOGLE_SCOPES  # Same scope set as GoogleSheetsClient so both share one registry
     
     def __init__(self, credentials_path: Optional[str] = None, project_id: Optional[str] = None):
         """
@@ -31,83 +180,11 @@ class GoogleDocsClient:
                              If None, reads from GOOGLE_CREDENTIALS_PATH env var.
             project_id: Google Cloud project ID. If None, uses default from credentials.
         """
-        creds_path = credentials_path or os.getenv('GOOGLE_CREDENTIALS_PATH')
         self.project_id = project_id or os.getenv('GOOGLE_CLOUD_PROJECT_ID')
-        if not creds_path:
-            raise ValueError(
-                "Google credentials path required.\n\n"
-                "Next steps:\n"
-                "1. Get credentials from: https://console.cloud.google.com/\n"
-                "2. Configure in team: python scripts/setup_team.py\n"
-                "   Or set GOOGLE_CREDENTIALS_PATH environment variable\n"
-                "Note: Google APIs are optional - skip if not needed"
-            )
-        
-        # Try service account first, then OAuth
-        try:
-            self.credentials = service_account.Credentials.from_service_account_file(
-                creds_path, scopes=self.SCOPES
-            )
-        except Exception as service_account_error:
-            # Check if it's an OAuth client secret file or authorized user file
-            import json
-            try:
-                with open(creds_path, 'r') as f:
-                    creds_data = json.load(f)
-            except Exception as json_error:
-                raise Exception(
-                    f"Failed to load credentials file {creds_path}.\n"
-                    f"Service account error: {service_account_error}\n"
-                    f"JSON parse error: {json_error}"
-                )
-            
-            # If it has 'installed' or 'web' key, it's a client secret file
-            if 'installed' in creds_data or 'web' in creds_data:
-                # This is a client secret file - need to do OAuth flow
-                from google_auth_oauthlib.flow import InstalledAppFlow
-                import pickle
-                
-                # Check for existing token
-                token_path = creds_path.replace('.json', '_token.pickle')
-                if os.path.exists(token_path):
-                    try:
-                        with open(token_path, 'rb') as token_file:
-                            self.credentials = pickle.load(token_file)
-                        # Verify credentials are valid
-                        if not self.credentials.valid:
-                            # Try to refresh if expired
-                            from google.auth.transport.requests import Request
-                            if self.credentials.expired and self.credentials.refresh_token:
-                                self.credentials.refresh(Request())
-                    except Exception as e:
-                        raise Exception(
-                            f"Failed to load OAuth token from {token_path}: {e}\n\n"
-                            "Please run authorization again:\n"
-                            "  python3 scripts/quick_oauth.py\n"
-                        )
-                else:
-                    # Token file doesn't exist - need OAuth authorization
-                    raise Exception(
-                        "OAuth token not found. Please run authorization first:\n\n"
-                        "  python3 scripts/quick_oauth.py\n\n"
-                        "This will generate an authorization URL for you to visit."
-                    )
-            else:
-                # Try as authorized user file
-                try:
-                    self.credentials = Credentials.from_authorized_user_file(creds_path, self.SCOPES)
-                except Exception as e:
-                    raise Exception(
-                        f"Failed to load credentials from {creds_path}.\n"
-                        f"Error: {e}\n\n"
-                        "Expected either:\n"
-                        "  - Service account JSON file\n"
-                        "  - OAuth client secret JSON file (with 'web' or 'installed' key)\n"
-                        "  - Authorized user JSON file (with 'client_id', 'refresh_token', etc.)"
-                    )
-        
-        self.docs_service = build('docs', 'v1', credentials=self.credentials)
-        self.drive_service = build('drive', 'v3', credentials=self.credentials)
+        self.registry = get_registry(credentials_path, timeout=GOOGLE_RETRY_POLICY.timeout, scopes=self.SCOPES)
+        self.credentials = self.registry.credentials
+        self.docs_service = self.registry.service('docs', 'v1')
+        self.drive_service = self.registry.service('drive', 'v3')
     
     def create_document(self, title: str, content: Optional[List[Dict]] = None, folder_id: Optional[str] = None) -> str:
         """
@@ -124,70 +201,27 @@ class GoogleDocsClient:
         try:
             target_folder = folder_id or os.getenv('GOOGLE_DRIVE_FOLDER_ID')
             
-            # Check if we're using a service account with no quota
-            # If quota error, provide helpful message
-            try:
-                # Try creating via Docs API first (preferred method)
-                doc = self.docs_service.documents().create(body={'title': title}).execute()
-                doc_id = doc.get('documentId')
-                
-                # Move document to specified folder if provided
-                if target_folder:
-                    try:
-                        # Get current parents
-                        file = self.drive_service.files().get(fileId=doc_id, fields='parents').execute()
-                        previous_parents = ','.join(file.get('parents', []))
-                        
-                        # Move to target folder
-                        self.drive_service.files().update(
-                            fileId=doc_id,
-                            addParents=target_folder,
-                            removeParents=previous_parents,
-                            fields='id, parents'
-                        ).execute()
-                    except Exception as e:
-                        print(f"Warning: Could not move document to folder {target_folder}: {e}")
-            except HttpError as docs_error:
-                error_str = str(docs_error)
-                # If Docs API fails, try creating via Drive API
-                if '403' in error_str or 'permission' in error_str.lower():
-                    # Create via Drive API as fallback
-                    file_metadata = {
-                        'name': title,
-                        'mimeType': 'application/vnd.google-apps.document'
-                    }
-                    if target_folder:
-                        file_metadata['parents'] = [target_folder]
-                    
-                    try:
-                        file = self.drive_service.files().create(
-                            body=file_metadata,
-                            fields='id'
-                        ).execute()
-                        doc_id = file.get('id')
-                    except HttpError as drive_error:
-                        drive_error_str = str(drive_error)
-                        if 'storageQuotaExceeded' in drive_error_str or 'quota' in drive_error_str.lower():
-                            # Service account has no quota - provide helpful error
-                            raise Exception(
-                                "Google Drive storage quota exceeded. Service account has 0 GB quota.\n\n"
-                                "Solutions:\n"
-                                "1. Use OAuth 2.0 credentials instead of service account\n"
-                                "2. Request quota increase for service account\n"
-                                "3. Use domain-wide delegation (Google Workspace)\n"
-                                "4. Create documents manually in Google Drive\n\n"
-                                "See GOOGLE-DRIVE-QUOTA-SOLUTION.md for details."
-                            )
+            if target_folder:
+                # Create straight into the folder - no get-parents/update move afterwards
+                doc_id = create_drive_file(self.drive_service, title, DOCUMENT_MIME_TYPE, target_folder)
+            else:
+                try:
+                    doc = execute_request(self.docs_service.documents().create(body={'title': title}), idempotent=False)
+                    doc_id = doc.get('documentId')
+                except HttpError as docs_error:
+                    error_str = str(docs_error)
+                    # If Docs API fails, try creating via Drive API
+                    if '403' in error_str or 'permission' in error_str.lower():
+                        doc_id = create_drive_file(self.drive_service, title, DOCUMENT_MIME_TYPE)
+                    else:
                         raise
-                else:
-                    raise
             
             # Add content if provided
             if content:
-                self.docs_service.documents().batchUpdate(
+                execute_request(self.docs_service.documents().batchUpdate(
                     documentId=doc_id,
                     body={'requests': content}
-                ).execute()
+                ), idempotent=False)
             
             return doc_id
         except HttpError as error:
@@ -196,6 +230,78 @@ class GoogleDocsClient:
                 raise Exception(f"Google Drive storage quota exceeded. Please free up space in the shared folder.")
             raise Exception(f"Error creating document: {error}")
     
+    def create_document_from_markdown(self, title: str, markdown: str, folder_id: Optional[str] = None) -> str:
+        """
+        Create a Google Doc from Markdown (headings, lists, bold/italic, code, links).
+        
+        The Markdown is compiled into one batchUpdate (see docs_markdown), so
+        the document costs two requests however long it is.
+        
+        Args:
+            title: Document title
+            markdown: Markdown content (e.g., an SOP or a Linear issue description)
+            folder_id: Optional folder ID (from GOOGLE_DRIVE_FOLDER_ID env var if not provided)
+            
+        Returns:
+            Document ID
+        """
+        return self.create_document(title, markdown_to_requests(markdown), folder_id)
+    
+    def create_documents(self, titles: List[str], folder_id: Optional[str] = None,
+                         content: Optional[Dict[str, List[Dict]]] = None) -> List[Dict]:
+        """
+        Create several Google Docs using batched API calls.
+        
+        Creation (directly inside the folder when one is set) and any initial
+        content each go out as HTTP batches, so N documents cost two
+        round-trips instead of two to four per document.
+        
+        Args:
+            titles: Document titles
+            folder_id: Optional folder ID (from GOOGLE_DRIVE_FOLDER_ID env var if not provided)
+            content: Optional title -> batchUpdate requests to apply after creation
+                     (e.g., from docs_markdown.markdown_to_requests)
+            
+        Returns:
+            One dictionary per title, in order: {'title', 'document_id', 'error'}
+        """
+        target_folder = folder_id or os.getenv('GOOGLE_DRIVE_FOLDER_ID')
+        keys = [str(i) for i in range(len(titles))]
+        results = {key: {'title': title, 'document_id': None, 'error': None} for key, title in zip(keys, titles)}
+        
+        if target_folder:
+            # Drive creates each document directly inside the folder
+            created = execute_batch(self.drive_service, {
+                key: drive_create_request(self.drive_service, title, DOCUMENT_MIME_TYPE, target_folder)
+                for key, title in zip(keys, titles)
+            }, idempotent=False)
+            id_field = 'id'
+        else:
+            created = execute_batch(self.docs_service, {
+                key: self.docs_service.documents().create(body={'title': title})
+                for key, title in zip(keys, titles)
+            }, idempotent=False)
+            id_field = 'documentId'
+        for key, outcome in created.items():
+            if outcome['error']:
+                results[key]['error'] = str(outcome['error'])
+            else:
+                results[key]['document_id'] = outcome['response'][id_field]
+        doc_ids = {key: r['document_id'] for key, r in results.items() if r['document_id']}
+        
+        if content:
+            updates = execute_batch(self.docs_service, {
+                key: self.docs_service.documents().batchUpdate(
+                    documentId=doc_id, body={'requests': content[results[key]['title']]}
+                )
+                for key, doc_id in doc_ids.items() if content.get(results[key]['title'])
+            }, idempotent=False)
+            for key, outcome in updates.items():
+                if outcome['error']:
+                    results[key]['error'] = f"Created, but adding content failed: {outcome['error']}"
+        
+        return [results[key] for key in keys]
+    
     def insert_text(self, document_id: str, text: str, index: int = 1) -> None:
         """
         Insert text into document.
@@ -212,10 +318,10 @@ class GoogleDocsClient:
             }
         }]
         
-        self.docs_service.documents().batchUpdate(
+        execute_request(self.docs_service.documents().batchUpdate(
             documentId=document_id,
             body={'requests': requests}
-        ).execute()
+        ), idempotent=False)
     
     def format_heading(self, document_id: str, start_index: int, end_index: int, level: int = 1) -> None:
         """
@@ -240,10 +346,10 @@ class GoogleDocsClient:
             }
         }]
         
-        self.docs_service.documents().batchUpdate(
+        execute_request(self.docs_service.documents().batchUpdate(
             documentId=document_id,
             body={'requests': requests}
-        ).execute()
+        ))
     
     def create_table(self, document_id: str, rows: int, columns: int, start_index: int = 1) -> Dict:
         """
@@ -266,10 +372,10 @@ class GoogleDocsClient:
             }
         }]
         
-        result = self.docs_service.documents().batchUpdate(
+        result = execute_request(self.docs_service.documents().batchUpdate(
             documentId=document_id,
             body={'requests': requests}
-        ).execute()
+        ), idempotent=False)
         
         return result
     
@@ -288,10 +394,39 @@ class GoogleDocsClient:
             'emailAddress': email
         }
         
-        self.drive_service.permissions().create(
+        execute_request(self.drive_service.permissions().create(
             fileId=document_id,
             body=permission
-        ).execute()
+        ))
+    
+    def share_documents(self, document_ids: List[str], emails: List[str], role: str = 'writer') -> Dict[str, Dict[str, Optional[str]]]:
+        """
+        Share several documents with several users using batched API calls.
+        
+        Drive applies only one of several concurrent permission changes on the
+        same file, so each batch carries at most one permission per document
+        (one batch per email, covering every document).
+        
+        Args:
+            document_ids: Document IDs
+            emails: Email addresses to share with
+            role: Permission role ('reader', 'writer', 'commenter')
+            
+        Returns:
+            Dictionary mapping document ID -> email -> error message (None on success)
+        """
+        results = {document_id: {} for document_id in document_ids}
+        for email in emails:
+            outcomes = execute_batch(self.drive_service, {
+                document_id: self.drive_service.permissions().create(
+                    fileId=document_id,
+                    body={'type': 'user', 'role': role, 'emailAddress': email}
+                )
+                for document_id in document_ids
+            })
+            for document_id, outcome in outcomes.items():
+                results[document_id][email] = str(outcome['error']) if outcome['error'] else None
+        return results
     
     def get_document_url(self, document_id: str) -> str:
         """Get shareable URL for document."""
@@ -301,7 +436,7 @@ class GoogleDocsClient:
 class GoogleSheetsClient:
     """Client for Google Sheets API."""
     
-    SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
+    SCOPES = GOOGLE_SCOPES
     
     def __init__(self, credentials_path: Optional[str] = None, project_id: Optional[str] = None):
         """
@@ -312,83 +447,11 @@ class GoogleSheetsClient:
                              If None, reads from GOOGLE_CREDENTIALS_PATH env var.
             project_id: Google Cloud project ID. If None, uses default from credentials.
         """
-        creds_path = credentials_path or os.getenv('GOOGLE_CREDENTIALS_PATH')
         self.project_id = project_id or os.getenv('GOOGLE_CLOUD_PROJECT_ID')
-        if not creds_path:
-            raise ValueError(
-                "Google credentials path required.\n\n"
-                "Next steps:\n"
-                "1. Get credentials from: https://console.cloud.google.com/\n"
-                "2. Configure in team: python scripts/setup_team.py\n"
-                "   Or set GOOGLE_CREDENTIALS_PATH environment variable\n"
-                "Note: Google APIs are optional - skip if not needed"
-            )
-        
-        # Try service account first, then OAuth
-        try:
-            self.credentials = service_account.Credentials.from_service_account_file(
-                creds_path, scopes=self.SCOPES
-            )
-        except Exception as service_account_error:
-            # Check if it's an OAuth client secret file or authorized user file
-            import json
-            try:
-                with open(creds_path, 'r') as f:
-                    creds_data = json.load(f)
-            except Exception as json_error:
-                raise Exception(
-                    f"Failed to load credentials file {creds_path}.\n"
-                    f"Service account error: {service_account_error}\n"
-                    f"JSON parse error: {json_error}"
-                )
-            
-            # If it has 'installed' or 'web' key, it's a client secret file
-            if 'installed' in creds_data or 'web' in creds_data:
-                # This is a client secret file - need to do OAuth flow
-                from google_auth_oauthlib.flow import InstalledAppFlow
-                import pickle
-                
-                # Check for existing token
-                token_path = creds_path.replace('.json', '_token.pickle')
-                if os.path.exists(token_path):
-                    try:
-                        with open(token_path, 'rb') as token_file:
-                            self.credentials = pickle.load(token_file)
-                        # Verify credentials are valid
-                        if not self.credentials.valid:
-                            # Try to refresh if expired
-                            from google.auth.transport.requests import Request
-                            if self.credentials.expired and self.credentials.refresh_token:
-                                self.credentials.refresh(Request())
-                    except Exception as e:
-                        raise Exception(
-                            f"Failed to load OAuth token from {token_path}: {e}\n\n"
-                            "Please run authorization again:\n"
-                            "  python3 scripts/quick_oauth.py\n"
-                        )
-                else:
-                    # Token file doesn't exist - need OAuth authorization
-                    raise Exception(
-                        "OAuth token not found. Please run authorization first:\n\n"
-                        "  python3 scripts/quick_oauth.py\n\n"
-                        "This will generate an authorization URL for you to visit."
-                    )
-            else:
-                # Try as authorized user file
-                try:
-                    self.credentials = Credentials.from_authorized_user_file(creds_path, self.SCOPES)
-                except Exception as e:
-                    raise Exception(
-                        f"Failed to load credentials from {creds_path}.\n"
-                        f"Error: {e}\n\n"
-                        "Expected either:\n"
-                        "  - Service account JSON file\n"
-                        "  - OAuth client secret JSON file (with 'web' or 'installed' key)\n"
-                        "  - Authorized user JSON file (with 'client_id', 'refresh_token', etc.)"
-                    )
-        
-        self.sheets_service = build('sheets', 'v4', credentials=self.credentials)
-        self.drive_service = build('drive', 'v3', credentials=self.credentials)
+        self.registry = get_registry(credentials_path, timeout=GOOGLE_RETRY_POLICY.timeout, scopes=self.SCOPES)
+        self.credentials = self.registry.credentials
+        self.sheets_service = self.registry.service('sheets', 'v4')
+        self.drive_service = self.registry.service('drive', 'v3')
     
     def create_spreadsheet(self, title: str, folder_id: Optional[str] = None) -> str:
         """
@@ -401,39 +464,121 @@ class GoogleSheetsClient:
         Returns:
             Spreadsheet ID
         """
+        target_folder = folder_id or os.getenv('GOOGLE_DRIVE_FOLDER_ID')
+        if target_folder:
+            # Create straight into the folder - no get-parents/update move afterwards
+            return create_drive_file(self.drive_service, title, SPREADSHEET_MIME_TYPE, target_folder)
+        
         spreadsheet = {
             'properties': {
                 'title': title
             }
         }
         
-        spreadsheet = self.sheets_service.spreadsheets().create(
+        spreadsheet = execute_request(self.sheets_service.spreadsheets().create(
             body=spreadsheet,
             fields='spreadsheetId'
-        ).execute()
+        ), idempotent=False)
         
-        sheet_id = spreadsheet.get('spreadsheetId')
+        return spreadsheet.get('spreadsheetId')
+    
+    def scaffold_spreadsheet(self, title: str, tabs: List[Dict], folder_id: Optional[str] = None) -> Dict:
+        """
+        Create a spreadsheet with its tabs, headers, formatting and frozen rows in one go.
         
-        # Move spreadsheet to specified folder if provided
+        Without a folder, tabs, header cells, header formatting and freeze
+        settings go into a single spreadsheets.create (as inline sheets and grid
+        data, so there is no default Sheet1 to delete). With a folder, Drive
+        creates the file inside it and one spreadsheets.batchUpdate turns
+        Sheet1 into the first tab and adds the rest. Optional data rows follow
+        in one values.batchUpdate.
+        
+        Args:
+            title: Spreadsheet title
+            tabs: Tab specs, in order. Each is a dictionary with:
+                  - 'title': Tab name (required)
+                  - 'headers': Header row values
+                  - 'rows': Data rows written below the headers (formulas allowed)
+                  - 'header_format': userEnteredFormat for header cells (default: bold, grey)
+                  - 'freeze_rows': Rows to freeze (default: 1 when there are headers)
+                  - 'freeze_columns': Columns to freeze (default: 0)
+            folder_id: Optional folder ID (from GOOGLE_DRIVE_FOLDER_ID env var if not provided)
+            
+        Returns:
+            Dictionary with 'spreadsheet_id', 'sheet_ids' (tab title -> sheetId) and 'url'
+        """
         target_folder = folder_id or os.getenv('GOOGLE_DRIVE_FOLDER_ID')
+        
+        sheets = []
+        data = []
+        for index, tab in enumerate(tabs):
+            headers = tab.get('headers') or []
+            grid_properties = {
+                'frozenRowCount': tab.get('freeze_rows', 1 if headers else 0),
+                'frozenColumnCount': tab.get('freeze_columns', 0),
+            }
+            sheet = {'properties': {'sheetId': index, 'title': tab['title'], 'index': index,
+                                    'gridProperties': grid_properties}}
+            if headers:
+                header_format = tab.get('header_format', HEADER_FORMAT)
+                sheet['data'] = [{
+                    'startRow': 0,
+                    'startColumn': 0,
+                    'rowData': [{'values': [
+                        {'userEnteredValue': {'stringValue': str(header)}, 'userEnteredFormat': header_format}
+                        for header in headers
+                    ]}]
+                }]
+            sheets.append(sheet)
+            
+            if tab.get('rows'):
+                data.append({'range': f"{a1_sheet_name(tab['title'])}!A{2 if headers else 1}",
+                             'values': tab['rows']})
+        
         if target_folder:
-            try:
-                # Get current parents
-                file = self.drive_service.files().get(fileId=sheet_id, fields='parents').execute()
-                previous_parents = ','.join(file.get('parents', []))
-                
-                # Move to target folder
-                self.drive_service.files().update(
-                    fileId=sheet_id,
-                    addParents=target_folder,
-                    removeParents=previous_parents,
-                    fields='id, parents'
-                ).execute()
-            except Exception as e:
-                print(f"Warning: Could not move spreadsheet to folder {target_folder}: {e}")
-                # Continue anyway - spreadsheet was created
-        
-        return sheet_id
+            spreadsheet_id = create_drive_file(self.drive_service, title, SPREADSHEET_MIME_TYPE, target_folder)
+            requests = []
+            for sheet in sheets:
+                if sheet['properties']['sheetId'] == 0:
+                    # The Drive-created file already has Sheet1 (sheetId 0) - it becomes the first tab
+                    requests.append({'updateSheetProperties': {
+                        'properties': sheet['properties'],
+                        'fields': 'title,index,gridProperties.frozenRowCount,gridProperties.frozenColumnCount'
+                    }})
+                else:
+                    requests.append({'addSheet': {'properties': sheet['properties']}})
+                for grid in sheet.get('data', []):
+                    requests.append({'updateCells': {
+                        'start': {'sheetId': sheet['properties']['sheetId'],
+                                  'rowIndex': grid['startRow'], 'columnIndex': grid['startColumn']},
+                        'rows': grid['rowData'],
+                        'fields': 'userEnteredValue,userEnteredFormat'
+                    }})
+            if requests:
+                execute_request(self.sheets_service.spreadsheets().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body={'requests': requests}
+                ), idempotent=False)
+            sheet_ids = {sheet['properties']['title']: sheet['properties']['sheetId'] for sheet in sheets}
+        else:
+            spreadsheet = execute_request(self.sheets_service.spreadsheets().create(
+                body={'properties': {'title': title}, 'sheets': sheets},
+                fields='spreadsheetId,sheets.properties(sheetId,title)'
+            ), idempotent=False)
+            spreadsheet_id = spreadsheet['spreadsheetId']
+            sheet_ids = {s['properties']['title']: s['properties']['sheetId'] for s in spreadsheet.get('sheets', [])}
+        
+        if data:
+            execute_request(self.sheets_service.spreadsheets().values().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={'valueInputOption': 'USER_ENTERED', 'data': data}
+            ))
+        
+        return {
+            'spreadsheet_id': spreadsheet_id,
+            'sheet_ids': sheet_ids,
+            'url': self.get_spreadsheet_url(spreadsheet_id),
+        }
     
     def create_sheet(self, spreadsheet_id: str, sheet_name: str) -> None:
         """
@@ -451,14 +596,14 @@ class GoogleSheetsClient:
             }
         }]
         
-        self.sheets_service.spreadsheets().batchUpdate(
+        execute_request(self.sheets_service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
             body={'requests': requests}
-        ).execute()
+        ), idempotent=False)
     
     def write_values(self, spreadsheet_id: str, range_name: str, values: List[List]) -> None:
         """
-        Write values to sheet.
+        Write values to sheet in one request (use write_rows for large imports).
         
         Args:
             spreadsheet_id: Spreadsheet ID
@@ -469,12 +614,30 @@ class GoogleSheetsClient:
             'values': values
         }
         
-        self.sheets_service.spreadsheets().values().update(
+        execute_request(self.sheets_service.spreadsheets().values().update(
             spreadsheetId=spreadsheet_id,
             range=range_name,
             valueInputOption='USER_ENTERED',
             body=body
-        ).execute()
+        ))
+    
+    def write_rows(self, spreadsheet_id: str, sheet_title: str, rows: Iterable[Sequence], **kwargs) -> Dict:
+        """
+        Stream rows into a tab in size-bounded chunks written concurrently.
+        
+        For imports too large for one write_values call (e.g., 'Raw - Contacts').
+        
+        Args:
+            spreadsheet_id: Spreadsheet ID
+            sheet_title: Tab name
+            rows: Row iterator (csv.reader, generator, DB cursor, ...)
+            **kwargs: Passed to SheetsStreamWriter.write_rows (start_row, mode, value_input_option, ...)
+            
+        Returns:
+            Throughput stats (rows, chunks, bytes, seconds, rows_per_second, bytes_per_second)
+        """
+        from sheets_stream import SheetsStreamWriter  # sheets_stream imports this module
+        return SheetsStreamWriter(self.registry).write_rows(spreadsheet_id, sheet_title, rows, **kwargs)
     
     def set_formula(self, spreadsheet_id: str, cell: str, formula: str) -> None:
         """
@@ -504,10 +667,10 @@ class GoogleSheetsClient:
         }]
         
         # This is simplified - need proper cell parsing
-        self.sheets_service.spreadsheets().batchUpdate(
+        execute_request(self.sheets_service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
             body={'requests': requests}
-        ).execute()
+        ))
     
     def format_header_row(self, spreadsheet_id: str, sheet_id: int, row: int = 0) -> None:
         """
@@ -541,10 +704,10 @@ class GoogleSheetsClient:
             }
         }]
         
-        self.sheets_service.spreadsheets().batchUpdate(
+        execute_request(self.sheets_service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
             body={'requests': requests}
-        ).execute()
+        ))
     
     def freeze_rows(self, spreadsheet_id: str, sheet_id: int, rows: int = 1) -> None:
         """
@@ -567,10 +730,10 @@ class GoogleSheetsClient:
             }
         }]
         
-        self.sheets_service.spreadsheets().batchUpdate(
+        execute_request(self.sheets_service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id,
             body={'requests': requests}
-        ).execute()
+        ))
     
     def get_spreadsheet_url(self, spreadsheet_id: str) -> str:
         """Get shareable URL for spreadsheet."""
@@ -0,0 +1,394 @@
+"""
+Process-wide registry of Google credentials and API service objects.
+
+GoogleDocsClient and GoogleSheetsClient used to each read the credentials
+file, unpickle/refresh the OAuth token and build their own Drive service.
+The registry does that once per (credentials path, scopes): credentials
+are loaded once, each service is built once from a local discovery
+document (no network round-trip), and a background thread refreshes the
+access token before it expires so API calls never stall on a refresh.
+
+Usage:
+    registry = GoogleServiceRegistry.for_credentials(creds_path)
+    docs = registry.service('docs', 'v1')
+    drive = registry.service('drive', 'v3')
+"""
+
+import json
+import os
+import pickle
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import google_auth_httplib2
+import httplib2
+from google.auth.transport.requests import Request
+from google.oauth2 import service_account
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import V2_DISCOVERY_URI, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+
+
+# Scopes granted by the OAuth authorization scripts (quick_oauth.py etc.)
+GOOGLE_SCOPES = [
+    'https://www.googleapis.com/auth/documents',
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+]
+
+DEFAULT_DISCOVERY_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "google_discovery"
+DISCOVERY_MAX_AGE = 7 * 24 * 3600  # Seconds a local discovery document is trusted before a background refresh
+DISCOVERY_REVISION_PATTERN = re.compile(r'"revision"\s*:\s*"(\d{8})"')
+REFRESH_MARGIN = 300  # Seconds before expiry at which the access token is refreshed
+REFRESH_RETRY_INTERVAL = 60  # Seconds between attempts after a failed refresh
+
+_discovery_refreshes = set()  # Cache paths already being refreshed by this process
+_discovery_refresh_lock = threading.Lock()
+
+
+def load_credentials(creds_path: str, scopes: Sequence[str]):
+    """
+    Load Google credentials from a service account, OAuth client or authorized user file.
+
+    OAuth client secret files need a token pickled next to them
+    (<name>_token.pickle, written by quick_oauth.py).
+
+    Args:
+        creds_path: Path to the credentials JSON file
+        scopes: OAuth scopes to request
+
+    Returns:
+        google.auth credentials
+    """
+    # Try service account first, then OAuth
+    try:
+        return service_account.Credentials.from_service_account_file(creds_path, scopes=list(scopes))
+    except Exception as service_account_error:
+        # Check if it's an OAuth client secret file or authorized user file
+        try:
+            with open(creds_path, 'r') as f:
+                creds_data = json.load(f)
+        except Exception as json_error:
+            raise Exception(
+                f"Failed to load credentials file {creds_path}.\n"
+                f"Service account error: {service_account_error}\n"
+                f"JSON parse error: {json_error}"
+            )
+
+    # If it has 'installed' or 'web' key, it's a client secret file
+    if 'installed' in creds_data or 'web' in creds_data:
+        token_path = creds_path.replace('.json', '_token.pickle')
+        if not os.path.exists(token_path):
+            # Token file doesn't exist - need OAuth authorization
+            raise Exception(
+                "OAuth token not found. Please run authorization first:\n\n"
+                "  python3 scripts/quick_oauth.py\n\n"
+                "This will generate an authorization URL for you to visit."
+            )
+        try:
+            with open(token_path, 'rb') as token_file:
+                credentials = pickle.load(token_file)
+            # Refresh an expired token now; later refreshes happen in the background
+            if not credentials.valid and credentials.expired and credentials.refresh_token:
+                credentials.refresh(Request())
+            return credentials
+        except Exception as e:
+            raise Exception(
+                f"Failed to load OAuth token from {token_path}: {e}\n\n"
+                "Please run authorization again:\n"
+                "  python3 scripts/quick_oauth.py\n"
+            )
+
+    # Try as authorized user file
+    try:
+        return Credentials.from_authorized_user_file(creds_path, list(scopes))
+    except Exception as e:
+        raise Exception(
+            f"Failed to load credentials from {creds_path}.\n"
+            f"Error: {e}\n\n"
+            "Expected either:\n"
+            "  - Service account JSON file\n"
+            "  - OAuth client secret JSON file (with 'web' or 'installed' key)\n"
+            "  - Authorized user JSON file (with 'client_id', 'refresh_token', etc.)"
+        )
+
+
+def _document_revision(document: str) -> Optional[float]:
+    """Timestamp of a discovery document's 'revision' date (YYYYMMDD), or None if absent."""
+    match = DISCOVERY_REVISION_PATTERN.search(document)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(1), '%Y%m%d').timestamp()
+    except ValueError:
+        return None
+
+
+def _fetch_discovery_document(name: str, version: str, cache_path: Path, timeout: float) -> str:
+    """Download a discovery document and store it in the disk cache."""
+    url = V2_DISCOVERY_URI.format(api=name, apiVersion=version)
+    response, content = httplib2.Http(timeout=timeout).request(url)
+    if response.status != 200:
+        raise Exception(f"HTTP {response.status}")
+    content = content.decode('utf-8')
+    json.loads(content)  # Don't cache an error page
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(content)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not cache Google discovery document: {e}")
+    return content
+
+
+def _refresh_in_background(name: str, version: str, cache_path: Path, timeout: float) -> None:
+    """Fetch a newer discovery document into the disk cache without blocking (once per process)."""
+    with _discovery_refresh_lock:
+        if cache_path in _discovery_refreshes:
+            return
+        _discovery_refreshes.add(cache_path)
+
+    def run() -> None:
+        try:
+            _fetch_discovery_document(name, version, cache_path, timeout)
+        except Exception as e:
+            print(f"Warning: Could not refresh Google {name} {version} discovery document: {e}")
+
+    threading.Thread(target=run, name=f"discovery-{name}-{version}", daemon=True).start()
+
+
+def load_discovery_document(name: str, version: str, cache_dir: Path = DEFAULT_DISCOVERY_CACHE_DIR,
+                            max_age: float = DISCOVERY_MAX_AGE, timeout: float = 30) -> str:
+    """
+    Get an API discovery document, avoiding a blocking network fetch whenever possible.
+
+    Sources, in order: a disk-cached copy younger than max_age, then the
+    document bundled with google-api-python-client (or a stale disk copy, if
+    its revision is newer). When that document is older than max_age (by
+    its revision date) it is still used, and a background thread fetches a
+    current one into the disk cache for the next run. Only when no local
+    copy exists at all is the document fetched before returning.
+
+    Args:
+        name: API name (e.g., 'docs')
+        version: API version (e.g., 'v1')
+        cache_dir: Directory for cached discovery documents
+        max_age: Seconds a local document is trusted before it is refreshed
+        timeout: Socket timeout for the network fetch
+
+    Returns:
+        Discovery document JSON
+    """
+    cache_path = Path(cache_dir) / f"{name}.{version}.json"
+    cached = None
+    try:
+        cached = cache_path.read_text()
+        if time.time() - cache_path.stat().st_mtime <= max_age:
+            return cached
+    except OSError:
+        pass
+
+    local = get_static_doc(name, version)
+    if cached and (not local or (_document_revision(cached) or 0) >= (_document_revision(local) or 0)):
+        local = cached
+    if local:
+        revision = _document_revision(local)
+        if local is cached or revision is None or time.time() - revision > max_age:
+            _refresh_in_background(name, version, cache_path, timeout)
+        return local
+
+    try:
+        return _fetch_discovery_document(name, version, cache_path, timeout)
+    except Exception as e:
+        raise Exception(
+            f"Could not load the Google {name} {version} discovery document: {e}\n\n"
+            "Next steps:\n"
+            "1. Check your network connection\n"
+            "2. Upgrade google-api-python-client (bundles discovery documents)\n"
+            f"3. Or place the document at {cache_path}"
+        )
+
+
+class GoogleServiceRegistry:
+    """Credentials and built API services for one credentials file and scope set."""
+
+    _instances: Dict[Tuple[str, Tuple[str, ...]], 'GoogleServiceRegistry'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, creds_path: str, scopes: Sequence[str] = GOOGLE_SCOPES,
+                 timeout: float = 60, discovery_cache_dir: Path = DEFAULT_DISCOVERY_CACHE_DIR,
+                 auto_refresh: bool = True):
+        """
+        Load credentials and prepare the service cache.
+
+        Args:
+            creds_path: Path to the credentials JSON file
+            scopes: OAuth scopes to request
+            timeout: Socket timeout for API requests, in seconds
+            discovery_cache_dir: Directory for cached discovery documents
+            auto_refresh: Refresh the access token in a background thread
+        """
+        self.creds_path = creds_path
+        self.scopes = tuple(scopes)
+        self.timeout = timeout
+        self.discovery_cache_dir = Path(discovery_cache_dir)
+        self.credentials = load_credentials(creds_path, scopes)
+        self._services: Dict[Tuple[str, str], object] = {}
+        self._thread_local = threading.local()
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+        if auto_refresh:
+            self.start_refresher()
+
+    @classmethod
+    def for_credentials(cls, creds_path: str, scopes: Sequence[str] = GOOGLE_SCOPES,
+                        timeout: float = 60) -> 'GoogleServiceRegistry':
+        """
+        Get the process-wide registry for a credentials file and scope set.
+
+        Args:
+            creds_path: Path to the credentials JSON file
+            scopes: OAuth scopes to request
+            timeout: Socket timeout used when the registry is first created
+
+        Returns:
+            Shared GoogleServiceRegistry instance
+        """
+        key = (os.path.abspath(creds_path), tuple(sorted(scopes)))
+        with cls._instances_lock:
+            registry = cls._instances.get(key)
+            if registry is None:
+                registry = cls(creds_path, scopes, timeout=timeout)
+                cls._instances[key] = registry
+            return registry
+
+    @classmethod
+    def clear(cls) -> None:
+        """Stop every refresher thread and forget all registries (e.g., after re-authorizing)."""
+        with cls._instances_lock:
+            for registry in cls._instances.values():
+                registry.stop_refresher()
+            cls._instances.clear()
+
+    def authorized_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Build a new authorized HTTP transport using the shared credentials."""
+        return google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=self.timeout))
+
+    def service(self, name: str, version: str):
+        """
+        Get an API service, building it on first use.
+
+        Args:
+            name: API name (e.g., 'docs', 'drive', 'sheets')
+            version: API version (e.g., 'v1', 'v3', 'v4')
+
+        Returns:
+            googleapiclient Resource
+        """
+        with self._lock:
+            service = self._services.get((name, version))
+            if service is None:
+                document = load_discovery_document(name, version, self.discovery_cache_dir)
+                service = build_from_document(document, http=self.authorized_http())
+                self._services[(name, version)] = service
+            return service
+
+    def thread_service(self, name: str, version: str):
+        """
+        Get an API service private to the calling thread.
+
+        Services from service() share one httplib2 transport, which isn't
+        thread-safe. Worker threads that call Google concurrently use this
+        instead: each thread gets its own transport over the shared credentials.
+
+        Args:
+            name: API name (e.g., 'sheets')
+            version: API version (e.g., 'v4')
+
+        Returns:
+            googleapiclient Resource for this thread only
+        """
+        services = self._thread_local.__dict__.setdefault('services', {})
+        service = services.get((name, version))
+        if service is None:
+            document = load_discovery_document(name, version, self.discovery_cache_dir)
+            service = build_from_document(document, http=self.authorized_http())
+            services[(name, version)] = service
+        return service
+
+    def refresh(self) -> None:
+        """Refresh the access token now."""
+        with self._refresh_lock:
+            self.credentials.refresh(Request())
+
+    def seconds_until_refresh(self) -> float:
+        """Seconds until the token enters the refresh margin (0 if it already has)."""
+        expiry: Optional[datetime] = getattr(self.credentials, 'expiry', None)
+        if not self.credentials.token or expiry is None:
+            return 0.0
+        # google-auth stores expiry as naive UTC
+        remaining = (expiry - datetime.utcnow()).total_seconds()
+        return max(remaining - REFRESH_MARGIN, 0.0)
+
+    def start_refresher(self) -> None:
+        """Start the background token refresher (daemon thread, idempotent)."""
+        if self._refresher and self._refresher.is_alive():
+            return
+        if not getattr(self.credentials, 'refresh_token', None) and not isinstance(
+                self.credentials, service_account.Credentials):
+            return  # Nothing to refresh with
+        self._stop.clear()
+        self._refresher = threading.Thread(target=self._refresh_loop, name='google-token-refresh', daemon=True)
+        self._refresher.start()
+
+    def stop_refresher(self) -> None:
+        """Stop the background token refresher."""
+        self._stop.set()
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.is_set():
+            wait = self.seconds_until_refresh()
+            if wait > 0:
+                self._stop.wait(wait)
+                continue
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Warning: Could not refresh Google access token: {e}")
+                self._stop.wait(REFRESH_RETRY_INTERVAL)
+
+
+def get_registry(credentials_path: Optional[str] = None, timeout: Union[float, Tuple[float, float]] = 60,
+                 scopes: Sequence[str] = GOOGLE_SCOPES) -> GoogleServiceRegistry:
+    """
+    Get the shared registry for a credentials path (default: GOOGLE_CREDENTIALS_PATH).
+
+    Args:
+        credentials_path: Path to service account JSON or OAuth credentials
+        timeout: Request timeout in seconds, or (connect, read) tuple
+        scopes: OAuth scopes to request
+
+    Returns:
+        Shared GoogleServiceRegistry instance
+    """
+    creds_path = credentials_path or os.getenv('GOOGLE_CREDENTIALS_PATH')
+    if not creds_path:
+        raise ValueError(
+            "Google credentials path required.\n\n"
+            "Next steps:\n"
+            "1. Get credentials from: https://console.cloud.google.com/\n"
+            "2. Configure in team: python scripts/setup_team.py\n"
+            "   Or set GOOGLE_CREDENTIALS_PATH environment variable\n"
+            "Note: Google APIs are optional - skip if not needed"
+        )
+    if isinstance(timeout, tuple):
+        timeout = timeout[-1]
+    return GoogleServiceRegistry.for_credentials(creds_path, scopes, timeout=timeout)
@@ -0,0 +1,71 @@
+"""
+Shared HTTP session factory for API clients.
+
+Usage:
+    session = create_session(pool_size=20)
+    client_a = LinearClient(api_key_a, session=session)
+    client_b = LinearClient(api_key_b, session=session)
+
+    http_client = create_async_http_client(max_connections=20)  # requires httpx
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import brotli  # noqa: F401 - urllib3 decodes 'br' when brotli is importable
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+
+DEFAULT_POOL_SIZE = 10
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE, pool_connections: int = 4) -> requests.Session:
+    """
+    Create a connection-pooled, keep-alive HTTP session.
+
+    Connections are reused across requests (and across clients sharing the
+    session), so only the first call to a host pays for the TCP+TLS handshake.
+    Responses are requested compressed and decoded transparently.
+
+    Args:
+        pool_size: Maximum number of connections kept open per host
+        pool_connections: Number of distinct hosts to keep pools for
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive',
+    })
+    return session
+
+
+def create_async_http_client(max_connections: int = 20, timeout: float = 60):
+    """
+    Create a pooled keep-alive httpx client that several async API clients can share.
+
+    Args:
+        max_connections: Maximum open connections
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        httpx.AsyncClient (caller closes it with `await client.aclose()`)
+    """
+    import httpx  # Optional dependency - only the async clients need it
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        timeout=timeout
+    )
@@ -0,0 +1,147 @@
+"""
+Workspace metadata cache for the Linear API client.
+
+Teams, workflow states and labels change rarely but were fetched on every
+status update and lookup. This cache keeps them per API key with a TTL and
+an optional on-disk snapshot so a cold CLI start can reuse them.
+
+Usage:
+    cache = LinearMetadataCache.for_api_key(api_key)
+    teams = cache.get('teams')
+    if teams is None:
+        teams = fetch_teams()
+        cache.set('teams', teams)
+"""
+
+import json
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+DEFAULT_TTL = 3600  # Seconds - workspace metadata is refreshed at most once per hour
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "linear_metadata"
+
+
+class LinearMetadataCache:
+    """TTL cache for Linear workspace metadata, keyed by API key."""
+
+    _instances: Dict[str, 'LinearMetadataCache'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, api_key: str, ttl: float = DEFAULT_TTL,
+                 snapshot_dir: Optional[Path] = DEFAULT_CACHE_DIR):
+        """
+        Initialize metadata cache.
+
+        Args:
+            api_key: Linear API key the cached data belongs to
+            ttl: Seconds before an entry is considered stale
+            snapshot_dir: Directory for on-disk snapshots. None disables persistence.
+        """
+        self.key = hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+        self.ttl = ttl
+        self.snapshot_path = Path(snapshot_dir) / f"{self.key}.json" if snapshot_dir else None
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._load_snapshot()
+
+    @classmethod
+    def for_api_key(cls, api_key: str, ttl: float = DEFAULT_TTL,
+                    snapshot_dir: Optional[Path] = DEFAULT_CACHE_DIR) -> 'LinearMetadataCache':
+        """
+        Get the process-wide cache for an API key, creating it on first use.
+
+        Args:
+            api_key: Linear API key
+            ttl: Seconds before an entry is considered stale
+            snapshot_dir: Directory for on-disk snapshots. None disables persistence.
+
+        Returns:
+            Shared LinearMetadataCache instance
+        """
+        key = hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+        with cls._instances_lock:
+            cache = cls._instances.get(key)
+            if cache is None:
+                cache = cls(api_key, ttl=ttl, snapshot_dir=snapshot_dir)
+                cls._instances[key] = cache
+            return cache
+
+    def get(self, name: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            name: Entry name (e.g., 'teams', 'states:<team_id>')
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if not entry:
+                return None
+            if time.time() - entry['fetched_at'] > self.ttl:
+                del self._entries[name]
+                return None
+            return entry['value']
+
+    def set(self, name: str, value: Any) -> None:
+        """
+        Store a value and update the on-disk snapshot.
+
+        Args:
+            name: Entry name
+            value: JSON-serializable value
+        """
+        with self._lock:
+            self._entries[name] = {'fetched_at': time.time(), 'value': value}
+            self._save_snapshot()
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """
+        Drop one entry, or everything when name is None.
+
+        Args:
+            name: Entry name to drop. Entries starting with '<name>:' are dropped too.
+        """
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                for entry_name in list(self._entries):
+                    if entry_name == name or entry_name.startswith(f"{name}:"):
+                        del self._entries[entry_name]
+            self._save_snapshot()
+
+    def _load_snapshot(self) -> None:
+        """Load unexpired entries from disk, ignoring missing or corrupt snapshots."""
+        if not self.snapshot_path or not self.snapshot_path.exists():
+            return
+        try:
+            with open(self.snapshot_path, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        self._entries = {
+            name: entry for name, entry in entries.items()
+            if now - entry.get('fetched_at', 0) <= self.ttl
+        }
+
+    def _save_snapshot(self) -> None:
+        """Write entries to disk atomically. Caller must hold the lock."""
+        if not self.snapshot_path:
+            return
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            print(f"Warning: Could not save Linear metadata cache: {e}")
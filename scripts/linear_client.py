@@ -8,20 +8,83 @@ Usage:
 """
 
 import os
+import json
+import time
+import uuid
+import threading
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+from http_session import create_session, DEFAULT_POOL_SIZE
+from linear_cache import LinearMetadataCache, DEFAULT_TTL
+from rate_limiter import TokenBucket
+from retry_policy import RetryPolicy, TransientHTTPError
+from linear_queries import (
+    TEAMS_QUERY,
+    TEAM_STATES_QUERY,
+    LABELS_QUERY,
+    VIEWER_QUERY,
+    UPDATE_ISSUE_STATE_MUTATION,
+    CREATE_COMMENT_MUTATION,
+    QUERIES,
+    issue_query,
+    issues_query,
+    team_issues_query,
+    estimate_complexity,
+    is_mutation,
+    operation_name,
+    record_response,
+)
 
 
-class LinearClient:
-    """Client for interacting with Linear API."""
+class _Flight:
+    """An in-flight request that concurrent identical callers wait on."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict] = None
+        self.error: Optional[BaseException] = None
+    
+    def wait(self) -> Dict:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+ISSUE_NOT_FOUND_HELP = (
+    "Next steps:\n"
+    "1. Verify issue ID is correct (format: TEAM-NUMBER, e.g., TRA-56)\n"
+    "2. Check issue exists in Linear\n"
+    "3. Verify you have access to the team/project"
+)
+
+
+class LinearClientBase:
+    """Configuration, rate limiting and response handling shared by the sync and async clients."""
+    
+    max_rate_limit_waits = 3  # Times to wait out a throttled window before failing
     
-    def __init__(self, api_key: Optional[str] = None):
+    # (API key tag, identifier e.g. 'TRA-56') -> issue UUID, shared by all clients in the
+    # process. Keyed per API key because two workspaces can both have a TRA team.
+    # Populated as a side effect of any team listing so later lookups are O(1).
+    _identifier_index: Dict[Tuple[str, str], str] = {}
+    
+    # Single-flight: identical queries (same API key, document and variables) that are
+    # already in flight are shared instead of sent again. Mutations are never coalesced.
+    _inflight: Dict[Tuple, object] = {}
+    _inflight_lock = threading.Lock()
+    _coalescing_stats: Dict[str, Dict[str, int]] = {}
+    
+    def __init__(self, api_key: Optional[str] = None, metadata_ttl: float = DEFAULT_TTL,
+                 retry_policy: Optional[RetryPolicy] = None):
         """
-        Initialize Linear API client.
+        Initialize shared client state.
         
         Args:
             api_key: Linear API key. If None, reads from LINEAR_API_KEY env var.
+            metadata_ttl: Seconds to cache teams and workflow states
+            retry_policy: Timeout/backoff policy for transient failures
         """
         self.api_key = api_key or os.getenv('LINEAR_API_KEY')
         if not self.api_key:
@@ -38,48 +101,160 @@ class LinearClient:
             "Authorization": self.api_key,
             "Content-Type": "application/json",
         }
-        self.rate_limit_remaining = 1500  # Linear allows 1500 requests/hour
+        self.metadata = LinearMetadataCache.for_api_key(self.api_key, ttl=metadata_ttl)
+        self.retry_policy = retry_policy or RetryPolicy()
+        
+        # Linear allows 1500 requests and 250k complexity points per hour per API key.
+        # Buckets are shared by every client (and process) using the same key and
+        # resynchronized from the X-RateLimit-* headers on each response.
+        key_tag = TokenBucket.key_hash(self.api_key)
+        self._key_tag = key_tag
+        self.request_limiter = TokenBucket.shared(f"linear-requests-{key_tag}", capacity=1500, period=3600)
+        self.complexity_limiter = TokenBucket.shared(f"linear-complexity-{key_tag}", capacity=250000, period=3600)
     
-    def _make_request(self, query: str, variables: Optional[Dict] = None) -> Dict:
+    @classmethod
+    def get_coalescing_stats(cls) -> Dict[str, Dict[str, int]]:
         """
-        Make a GraphQL request to Linear API.
+        Get single-flight counters for this process.
         
-        Args:
-            query: GraphQL query string
-            variables: Query variables
-            
         Returns:
-            Response data
+            Dictionary mapping operation (e.g., 'linear:GetTeams') to hits
+            (callers served by another caller's request) and misses (requests sent)
         """
-        if self.rate_limit_remaining <= 0:
-            raise Exception(
-                "Rate limit exceeded. Wait before making more requests.\n\n"
-                "Next steps:\n"
-                "1. Wait 1 hour for rate limit to reset (1500 requests/hour)\n"
-                "2. Use --limit to work on fewer tasks at once\n"
-                "3. Consider cloud execution for large batches"
-            )
+        with cls._inflight_lock:
+            return {endpoint: dict(counters) for endpoint, counters in cls._coalescing_stats.items()}
+    
+    def _flight_key(self, query: str, variables: Optional[Dict], scope: object = None) -> Optional[Tuple]:
+        """Key identifying identical queries, or None for mutations (never coalesced)."""
+        if is_mutation(query):
+            return None
+        return (self._key_tag, scope, query, json.dumps(variables or {}, sort_keys=True, default=str))
+    
+    def _join_flight(self, key: Tuple, endpoint: str, new_flight) -> Tuple[object, bool]:
+        """
+        Register as leader for a key, or find the flight already running it.
         
-        payload = {"query": query}
-        if variables:
-            payload["variables"] = variables
+        Returns:
+            (flight, is_leader)
+        """
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = new_flight()
+                self._inflight[key] = flight
+            counters = self._coalescing_stats.setdefault(endpoint, {'hits': 0, 'misses': 0})
+            counters['misses' if leader else 'hits'] += 1
+        return flight, leader
+    
+    def _leave_flight(self, key: Tuple) -> None:
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+    
+    @property
+    def rate_limit_remaining(self) -> int:
+        """Requests left in the current window, as last reported by Linear."""
+        return int(self.request_limiter.tokens)
+    
+    def _update_rate_limits(self, response) -> Optional[float]:
+        """
+        Feed Linear's rate-limit headers into the shared buckets.
         
-        response = requests.post(
-            self.base_url,
-            headers=self.headers,
-            json=payload
+        Returns:
+            Epoch seconds when the request budget resets, if reported
+        """
+        headers = response.headers
+        
+        def header_float(name: str) -> Optional[float]:
+            value = headers.get(name)
+            try:
+                return float(value) if value is not None else None
+            except ValueError:
+                return None
+        
+        # Reset headers are epoch milliseconds
+        requests_reset = header_float('X-RateLimit-Requests-Reset')
+        requests_reset = requests_reset / 1000 if requests_reset else None
+        complexity_reset = header_float('X-RateLimit-Complexity-Reset')
+        complexity_reset = complexity_reset / 1000 if complexity_reset else None
+        
+        self.request_limiter.update_from_server(
+            remaining=header_float('X-RateLimit-Requests-Remaining'),
+            limit=header_float('X-RateLimit-Requests-Limit'),
+            reset_at=requests_reset
         )
+        self.complexity_limiter.update_from_server(
+            remaining=header_float('X-RateLimit-Complexity-Remaining'),
+            limit=header_float('X-RateLimit-Complexity-Limit'),
+            reset_at=complexity_reset
+        )
+        return requests_reset or complexity_reset
+    
+    @staticmethod
+    def _is_rate_limited(response) -> bool:
+        """Linear signals throttling with HTTP 429 or a RATELIMITED GraphQL error."""
+        if response.status_code == 429:
+            return True
+        if response.status_code in (200, 400):
+            try:
+                errors = response.json().get('errors') or []
+            except ValueError:
+                return False
+            return any((error.get('extensions') or {}).get('code') == 'RATELIMITED' for error in errors)
+        return False
+    
+    def _throttle_reset(self, response, reset_at: Optional[float]) -> float:
+        """Pause every client sharing this key after a throttled response; return when to resume."""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            reset_at = time.time() + int(retry_after)
+        if not reset_at or reset_at <= time.time():
+            reset_at = time.time() + 60
+        self.request_limiter.block_until(reset_at)
+        return reset_at
+    
+    def _complexity_cost(self, query: str, variables: Optional[Dict] = None) -> float:
+        """
+        Estimated complexity points to reserve before sending a document.
         
-        self.rate_limit_remaining -= 1
+        A `first` variable is the actual page size; otherwise a registered
+        document uses its precomputed QuerySpec.complexity (which assumes the
+        page size it was registered with).
+        """
+        first = (variables or {}).get('first')
+        if isinstance(first, int) and first > 0:
+            estimate = estimate_complexity(query, first)
+        else:
+            spec = QUERIES.get(operation_name(query))
+            estimate = spec.complexity if spec and spec.document == query else estimate_complexity(query)
+        return min(estimate, self.complexity_limiter.capacity)
+    
+    @staticmethod
+    def _operation_info(query: str, idempotent: Optional[bool]) -> Tuple[str, bool]:
+        """
+        Get the retry-counter endpoint name and idempotency for a GraphQL document.
+        
+        Queries are idempotent by default, mutations are not unless the caller
+        says so (e.g., the mutation carries a client-generated id).
+        """
+        if idempotent is None:
+            idempotent = not is_mutation(query)
+        return f"linear:{operation_name(query)}", idempotent
+    
+    @staticmethod
+    def _parse_response(response) -> Dict:
+        """Extract GraphQL data from a response. Raises TransientHTTPError on 5xx."""
+        if response.status_code >= 500:
+            raise TransientHTTPError(response.status_code, f"HTTP {response.status_code}: {response.text[:500]}")
         
         if response.status_code != 200:
             error_text = response.text
             try:
                 error_json = response.json()
-                if 'errors' in error_json:
-                    raise Exception(f"Linear API errors: {error_json['errors']}")
-            except:
-                pass
+            except ValueError:
+                error_json = {}
+            if 'errors' in error_json:
+                raise Exception(f"Linear API errors: {error_json['errors']}")
             raise Exception(f"HTTP {response.status_code}: {error_text[:500]}")
         
         data = response.json()
@@ -89,171 +264,325 @@ class LinearClient:
         
         return data.get('data', {})
     
-    def get_issue(self, issue_id: str) -> Dict:
+    @staticmethod
+    def _is_duplicate_id(error: Exception) -> bool:
+        """Whether a Linear error rejects a client-generated id because it already exists."""
+        message = str(error).lower()
+        return any(marker in message for marker in ('already exists', 'duplicate', 'unique constraint'))
+    
+    @staticmethod
+    def _merge_updates(updates: List[Dict]) -> List[Dict]:
         """
-        Fetch issue details by ID.
+        Combine several updates for the same issue into one, keeping first-seen order.
+        
+        Comments are joined (blank line between), the last status wins, and
+        label adds/removes are unioned with later operations overriding earlier
+        ones for the same label.
+        """
+        merged: Dict[str, Dict] = {}
+        for update in updates:
+            identifier = update['issue_id']
+            target = merged.setdefault(identifier, {'issue_id': identifier, 'comment': None, 'status': None,
+                                                    'add_labels': [], 'remove_labels': []})
+            if update.get('comment'):
+                target['comment'] = f"{target['comment']}\n\n{update['comment']}" if target['comment'] else update['comment']
+            if update.get('status'):
+                target['status'] = update['status']
+            for label in update.get('add_labels') or []:
+                if label in target['remove_labels']:
+                    target['remove_labels'].remove(label)
+                if label not in target['add_labels']:
+                    target['add_labels'].append(label)
+            for label in update.get('remove_labels') or []:
+                if label in target['add_labels']:
+                    target['add_labels'].remove(label)
+                if label not in target['remove_labels']:
+                    target['remove_labels'].append(label)
+        return list(merged.values())
+    
+    @staticmethod
+    def _parse_identifier(identifier: str) -> Tuple[str, int]:
+        """Split 'TRA-56' into ('TRA', 56)."""
+        parts = identifier.split('-')
+        if len(parts) != 2 or not parts[1].isdigit():
+            raise ValueError(f"Invalid identifier format: {identifier}. Expected format: TEAM-NUMBER")
+        return parts[0], int(parts[1])
+    
+    def _index_issues(self, issues: List[Dict]) -> None:
+        """Record identifier -> UUID for any issues seen in a listing."""
+        for issue in issues:
+            identifier = issue.get('identifier')
+            if identifier and issue.get('id'):
+                self._identifier_index[(self._key_tag, identifier)] = issue['id']
+    
+    def _indexed_uuid(self, identifier: str) -> Optional[str]:
+        """UUID recorded for an identifier in this client's workspace, if any."""
+        return self._identifier_index.get((self._key_tag, identifier))
+    
+    def _forget_identifier(self, identifier: str) -> None:
+        """Drop a stale index entry (issue moved, archived or deleted)."""
+        self._identifier_index.pop((self._key_tag, identifier), None)
+    
+    @staticmethod
+    def _is_not_found(error: Exception) -> bool:
+        """Whether a Linear error means the requested entity doesn't exist (any more)."""
+        return 'entity not found' in str(error).lower()
+    
+    @staticmethod
+    def _match_state(states: List[Dict], status_name: str) -> Optional[Dict]:
+        """Find a workflow state by name (case-insensitive)."""
+        for state in states:
+            if state['name'].lower() == status_name.lower():
+                return state
+        return None
+    
+    @staticmethod
+    def _state_not_found(states: List[Dict], status_name: str) -> ValueError:
+        """Build the error raised when a status name matches no workflow state."""
+        available = [s['name'] for s in states]
+        return ValueError(
+            f"Status '{status_name}' not found.\n\n"
+            f"Available statuses: {', '.join(available)}\n\n"
+            "Next steps:\n"
+            "1. Check status name spelling (case-sensitive)\n"
+            "2. Use one of the available statuses listed above\n"
+            "3. Common statuses: 'In Review', 'In Progress', 'Done', 'Todo'"
+        )
+
+
+class LinearClient(LinearClientBase):
+    """Client for interacting with Linear API."""
+    
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None,
+                 pool_size: int = DEFAULT_POOL_SIZE, metadata_ttl: float = DEFAULT_TTL,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """
+        Initialize Linear API client.
         
         Args:
-            issue_id: Issue identifier (e.g., 'TRA-56')
+            api_key: Linear API key. If None, reads from LINEAR_API_KEY env var.
+            session: Optional shared HTTP session. Pass the same session to several
+                     clients (e.g., one per team) to reuse warm connections.
+            pool_size: Connection pool size when the client creates its own session
+            metadata_ttl: Seconds to cache teams and workflow states
+            retry_policy: Timeout/backoff policy for transient failures
+        """
+        super().__init__(api_key, metadata_ttl=metadata_ttl, retry_policy=retry_policy)
+        self.session = session or create_session(pool_size=pool_size)
+    
+    def _make_request(self, query: str, variables: Optional[Dict] = None,
+                      idempotent: Optional[bool] = None) -> Dict:
+        """
+        Make a GraphQL request to Linear API.
+        
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+            idempotent: Whether the request is safe to retry. Defaults to True for
+                        queries and False for mutations; pass True for mutations
+                        that carry an idempotency marker (e.g., a client-generated id).
             
         Returns:
-            Issue data dictionary
+            Response data
         """
-        query = """
-        query GetIssue($id: String!) {
-            issue(id: $id) {
-                id
-                identifier
-                title
-                description
-                state {
-                    id
-                    name
-                    type
-                }
-                priority
-                assignee {
-                    id
-                    name
-                    email
-                }
-                labels {
-                    nodes {
-                        id
-                        name
-                    }
-                }
-                attachments {
-                    nodes {
-                        id
-                        title
-                        url
-                    }
-                }
-                comments {
-                    nodes {
-                        id
-                        body
-                        createdAt
-                        user {
-                            name
-                        }
-                    }
-                }
-                relations {
-                    nodes {
-                        id
-                        type
-                        relatedIssue {
-                            id
-                            identifier
-                            title
-                        }
-                    }
-                }
-                createdAt
-                updatedAt
-            }
-        }
+        endpoint, idempotent = self._operation_info(query, idempotent)
+        
+        key = self._flight_key(query, variables)
+        if key is None:
+            return self._send_with_retry(query, variables, endpoint, idempotent)
+        
+        flight, leader = self._join_flight(key, endpoint, _Flight)
+        if not leader:
+            return flight.wait()
+        try:
+            flight.result = self._send_with_retry(query, variables, endpoint, idempotent)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            self._leave_flight(key)
+            flight.done.set()
+    
+    def _send_with_retry(self, query: str, variables: Optional[Dict], endpoint: str, idempotent: bool) -> Dict:
+        return self.retry_policy.call(
+            lambda: self._send(query, variables),
+            endpoint=endpoint,
+            idempotent=idempotent
+        )
+    
+    def _send(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """Send one GraphQL request, waiting out rate limits. Raises TransientHTTPError on 5xx."""
+        payload = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        
+        complexity = self._complexity_cost(query, variables)
+        for attempt in range(self.max_rate_limit_waits + 1):
+            self.request_limiter.acquire()
+            self.complexity_limiter.acquire(complexity)
+            
+            response = self.session.post(
+                self.base_url,
+                headers=self.headers,
+                json=payload,
+                timeout=self.retry_policy.timeout
+            )
+            
+            record_response(query, len(response.content), response.headers.get('X-Complexity'))
+            reset_at = self._update_rate_limits(response)
+            if not self._is_rate_limited(response) or attempt == self.max_rate_limit_waits:
+                break
+            self._throttle_reset(response, reset_at)
+        
+        return self._parse_response(response)
+    
+    def _send_client_id_mutation(self, mutation: str, variables: Dict) -> Optional[Dict]:
+        """
+        Send a mutation that creates records under client-generated ids, retrying transient failures.
+        
+        If a retry is rejected because an id already exists, an earlier attempt
+        was applied and only its response was lost. That counts as success:
+        None is returned and the caller rebuilds the result.
+        
+        Args:
+            mutation: GraphQL mutation document
+            variables: Mutation variables (including the client-generated ids)
+            
+        Returns:
+            Response data, or None when a retry found the write already applied
+        """
+        endpoint, _ = self._operation_info(mutation, True)
+        attempts = 0
+        
+        def send() -> Optional[Dict]:
+            nonlocal attempts
+            attempts += 1
+            try:
+                return self._send(mutation, variables)
+            except Exception as e:
+                if attempts > 1 and self._is_duplicate_id(e):
+                    return None
+                raise
+        
+        return self.retry_policy.call(send, endpoint=endpoint, idempotent=True)
+    
+    def get_issue(self, issue_id: str) -> Dict:
         """
+        Fetch issue details by ID, including attachments, comments and relations.
         
-        # Linear uses team key + issue number format
-        # Need to find the issue by identifier
+        Args:
+            issue_id: Issue UUID or identifier (e.g., 'TRA-56')
+            
+        Returns:
+            Issue data dictionary
+        """
         variables = {"id": issue_id}
-        data = self._make_request(query, variables)
+        data = self._make_request(issue_query('GetIssueById', 'detail').document, variables)
         return data.get('issue', {})
     
-    def get_issue_by_identifier(self, identifier: str) -> Dict:
+    def get_issue_by_identifier(self, identifier: str, projection: str = 'execute') -> Dict:
         """
         Fetch issue by identifier (e.g., 'TRA-56').
         
+        Resolves the identifier in a single query: by UUID when the identifier
+        is already in the local index, otherwise by team key + issue number.
+        
         Args:
             identifier: Issue identifier
+            projection: Fields to select (see linear_queries.PROJECTIONS): 'lookup'
+                        for id/team/state only, 'execute' adds description and labels,
+                        'detail' adds attachments, comments and relations
             
         Returns:
             Issue data dictionary
         """
-        # Extract team key and issue number from identifier (e.g., 'TRA-56' -> 'TRA', '56')
-        parts = identifier.split('-')
-        if len(parts) != 2:
-            raise ValueError(f"Invalid identifier format: {identifier}. Expected format: TEAM-NUMBER")
-        
-        team_key = parts[0]
-        issue_number = parts[1]
-        
-        # First, get the team ID
-        teams_query = """
-        query {
-            teams {
-                nodes {
-                    id
-                    key
-                    name
-                }
-            }
-        }
-        """
-        
-        teams_data = self._make_request(teams_query)
-        teams = teams_data.get('teams', {}).get('nodes', [])
-        
-        team_id = None
-        for team in teams:
-            if team.get('key') == team_key:
-                team_id = team.get('id')
-                break
+        team_key, issue_number = self._parse_identifier(identifier)
         
-        if not team_id:
-            raise ValueError(
-                f"Team '{team_key}' not found in Linear workspace.\n\n"
-                "Next steps:\n"
-                "1. Verify team key is correct (case-sensitive)\n"
-                "2. Check team exists in your Linear workspace\n"
-                "3. List available teams: python scripts/agent_workflow.py --list-teams"
-            )
-        
-        # Now get issues for this team and find the one matching the identifier
-        # Simplified query to avoid complexity limits - fetch basic info first
-        query = """query GetTeamIssues($teamId: String!, $first: Int!) {
-  team(id: $teamId) {
-    issues(first: $first) {
-      nodes {
-        id
-        identifier
-        title
-        description
-        state {
-          id
-          name
-          type
-        }
-        priority
-        assignee {
-          id
-          name
-        }
-        createdAt
-        updatedAt
-      }
-    }
-  }
-}"""
+        issue_uuid = self._indexed_uuid(identifier)
+        if issue_uuid:
+            try:
+                data = self._make_request(issue_query('GetIssueById', projection).document, {"id": issue_uuid})
+            except Exception as e:
+                if not self._is_not_found(e):
+                    raise
+                data = {}
+            issue = data.get('issue') or {}
+            if issue.get('identifier') == identifier:
+                return issue
+            # Stale index entry (issue moved or deleted) - fall through to a fresh lookup
+            self._forget_identifier(identifier)
         
         variables = {
-            "teamId": team_id,
-            "first": 250  # Get up to 250 issues to find the one we need (Linear allows up to 250 per query)
+            "teamKey": team_key,
+            "number": issue_number
         }
         
-        data = self._make_request(query, variables)
-        issues = data.get('team', {}).get('issues', {}).get('nodes', [])
+        data = self._make_request(issue_query('GetIssueByNumber', projection).document, variables)
+        issues = data.get('issues', {}).get('nodes', [])
+        self._index_issues(issues)
         
-        # Find the issue with matching identifier
         for issue in issues:
             if issue.get('identifier') == identifier:
                 return issue
         
         return {}  # Not found
     
+    def get_viewer(self) -> Dict:
+        """
+        Get the user the API key belongs to (cheap connectivity check).
+        
+        Returns:
+            Dictionary with id, name and email
+        """
+        data = self._make_request(VIEWER_QUERY.document)
+        return data.get('viewer') or {}
+    
+    def get_teams(self, refresh: bool = False) -> List[Dict]:
+        """
+        Get all teams in the workspace (cached).
+        
+        Args:
+            refresh: Bypass the cache and refetch
+            
+        Returns:
+            List of team dictionaries with id, key and name
+        """
+        teams = None if refresh else self.metadata.get('teams')
+        if teams is None:
+            data = self._make_request(TEAMS_QUERY.document)
+            teams = data.get('teams', {}).get('nodes', [])
+            self.metadata.set('teams', teams)
+        return teams
+    
+    def get_workflow_states(self, team_id: str, refresh: bool = False) -> List[Dict]:
+        """
+        Get workflow states for a team (cached).
+        
+        Args:
+            team_id: Linear team UUID
+            refresh: Bypass the cache and refetch
+            
+        Returns:
+            List of state dictionaries with id, name and type
+        """
+        cache_key = f"states:{team_id}"
+        states = None if refresh else self.metadata.get(cache_key)
+        if states is None:
+            data = self._make_request(TEAM_STATES_QUERY.document, {"teamId": team_id})
+            states = (data.get('team') or {}).get('states', {}).get('nodes', [])
+            self.metadata.set(cache_key, states)
+        return states
+    
+    def invalidate_metadata(self, name: Optional[str] = None) -> None:
+        """
+        Drop cached workspace metadata.
+        
+        Args:
+            name: 'teams', 'states' (all teams) or None for everything
+        """
+        self.metadata.invalidate(name)
+    
     def update_issue_status(self, issue_id: str, status_name: str) -> Dict:
         """
         Update issue status.
@@ -265,69 +594,31 @@ class LinearClient:
         Returns:
             Updated issue data
         """
-        # First, get available states
-        states_query = """
-        query {
-            workflowStates {
-                nodes {
-                    id
-                    name
-                    type
-                }
-            }
-        }
-        """
-        
-        states_data = self._make_request(states_query)
-        states = states_data.get('workflowStates', {}).get('nodes', [])
-        
-        # Find state by name
-        target_state = None
-        for state in states:
-            if state['name'].lower() == status_name.lower():
-                target_state = state
-                break
-        
-        if not target_state:
-            available = [s['name'] for s in states]
-            raise ValueError(
-                f"Status '{status_name}' not found.\n\n"
-                f"Available statuses: {', '.join(available)}\n\n"
-                "Next steps:\n"
-                "1. Check status name spelling (case-sensitive)\n"
-                "2. Use one of the available statuses listed above\n"
-                "3. Common statuses: 'In Review', 'In Progress', 'Done', 'Todo'"
-            )
-        
-        # Get issue ID first
-        issue = self.get_issue_by_identifier(issue_id)
+        # Get issue first - its team determines which workflow states apply
+        issue = self.get_issue_by_identifier(issue_id, projection='lookup')
         if not issue:
             raise ValueError(f"Issue {issue_id} not found")
         
-        # Update issue
-        update_query = """
-        mutation UpdateIssue($id: String!, $stateId: String!) {
-            issueUpdate(id: $id, input: { stateId: $stateId }) {
-                success
-                issue {
-                    id
-                    identifier
-                    state {
-                        name
-                    }
-                }
-            }
-        }
-        """
+        target_state = self._find_state(issue['team']['id'], status_name)
         
+        # Update issue
         variables = {
             "id": issue['id'],
             "stateId": target_state['id']
         }
         
-        data = self._make_request(update_query, variables)
+        data = self._make_request(UPDATE_ISSUE_STATE_MUTATION.document, variables)
         return data.get('issueUpdate', {}).get('issue', {})
     
+    def _find_state(self, team_id: str, status_name: str) -> Dict:
+        """Find a team's workflow state by name, refreshing once on a cache miss."""
+        for refresh in (False, True):
+            states = self.get_workflow_states(team_id, refresh=refresh)
+            state = self._match_state(states, status_name)
+            if state:
+                return state
+        raise self._state_not_found(states, status_name)
+    
     def add_comment(self, issue_id: str, comment: str) -> Dict:
         """
         Add comment to issue.
@@ -339,37 +630,188 @@ class LinearClient:
         Returns:
             Created comment data
         """
-        issue = self.get_issue_by_identifier(issue_id)
+        issue = self.get_issue_by_identifier(issue_id, projection='lookup')
         if not issue:
-            raise ValueError(
-                f"Issue {issue_id} not found.\n\n"
-                "Next steps:\n"
-                "1. Verify issue ID is correct (format: TEAM-NUMBER, e.g., TRA-56)\n"
-                "2. Check issue exists in Linear\n"
-                "3. Verify you have access to the team/project"
-            )
-        
-        query = """
-        mutation CreateComment($issueId: String!, $body: String!) {
-            commentCreate(input: { issueId: $issueId, body: $body }) {
-                success
-                comment {
-                    id
-                    body
-                    createdAt
-                }
-            }
-        }
-        """
+            raise ValueError(f"Issue {issue_id} not found.\n\n{ISSUE_NOT_FOUND_HELP}")
         
+        # Client-generated comment id makes the mutation safe to retry
         variables = {
+            "id": str(uuid.uuid4()),
             "issueId": issue['id'],
             "body": comment
         }
         
-        data = self._make_request(query, variables)
+        data = self._send_client_id_mutation(CREATE_COMMENT_MUTATION.document, variables)
+        if data is None:
+            # Created by an attempt whose response was lost
+            return {'id': variables['id'], 'body': comment}
         return data.get('commentCreate', {}).get('comment', {})
     
+    def get_issue_labels(self, team_id: str, refresh: bool = False) -> List[Dict]:
+        """
+        Get labels usable on a team's issues: team labels plus workspace labels (cached).
+        
+        Args:
+            team_id: Linear team UUID
+            refresh: Bypass the cache and refetch
+            
+        Returns:
+            List of label dictionaries with id and name
+        """
+        labels = None if refresh else self.metadata.get('labels')
+        if labels is None:
+            labels = []
+            after = None
+            while True:
+                data = self._make_request(LABELS_QUERY.document, {"first": 250, "after": after})
+                connection = data.get('issueLabels') or {}
+                page = connection.get('nodes', [])
+                labels.extend(page)
+                page_info = connection.get('pageInfo', {})
+                if not page_info.get('hasNextPage') or not page:
+                    break
+                after = page_info.get('endCursor')
+            self.metadata.set('labels', labels)
+        return [label for label in labels
+                if not label.get('team') or label['team'].get('id') == team_id]
+    
+    def _find_label_ids(self, team_id: str, label_names: List[str]) -> List[str]:
+        """Resolve label names (case-insensitive) to IDs, refreshing once on a cache miss."""
+        wanted = {name.lower(): name for name in label_names}
+        for refresh in (False, True):
+            by_name = {label['name'].lower(): label['id']
+                       for label in self.get_issue_labels(team_id, refresh=refresh)}
+            if all(name in by_name for name in wanted):
+                return [by_name[name] for name in wanted]
+        
+        missing = [original for name, original in wanted.items() if name not in by_name]
+        raise ValueError(
+            f"Label(s) not found: {', '.join(missing)}\n\n"
+            "Next steps:\n"
+            "1. Check label spelling\n"
+            "2. Create the label in Linear (team or workspace level)"
+        )
+    
+    def update_issue(self, issue_id: str, comment: Optional[str] = None,
+                     status: Optional[str] = None, add_labels: Optional[List[str]] = None,
+                     remove_labels: Optional[List[str]] = None) -> Dict:
+        """
+        Comment on, transition and relabel an issue in a single GraphQL mutation.
+        
+        Args:
+            issue_id: Issue identifier (e.g., 'TRA-56')
+            comment: Optional comment body
+            status: Optional status name (e.g., 'In Review')
+            add_labels: Optional label names to add
+            remove_labels: Optional label names to remove
+            
+        Returns:
+            Dictionary with 'comment' and/or 'issue' results
+        """
+        results = self.update_issues([{
+            'issue_id': issue_id,
+            'comment': comment,
+            'status': status,
+            'add_labels': add_labels,
+            'remove_labels': remove_labels,
+        }])
+        return results[issue_id]
+    
+    def update_issues(self, updates: List[Dict]) -> Dict[str, Dict]:
+        """
+        Apply comment/status/label writes to several issues in one GraphQL request.
+        
+        Each update is a dict with 'issue_id' and any of 'comment', 'status',
+        'add_labels', 'remove_labels' (same meaning as update_issue). Updates
+        for the same issue are merged first (see _merge_updates), then all
+        writes go out as aliased mutations in a single document.
+        
+        Args:
+            updates: List of update dictionaries
+            
+        Returns:
+            Dictionary mapping issue identifier to its 'comment' and/or 'issue' results
+        """
+        declarations = []
+        fields = []
+        variables = {}
+        aliases = {}
+        
+        comments = {}
+        
+        for i, update in enumerate(self._merge_updates(updates)):
+            identifier = update['issue_id']
+            issue = self.get_issue_by_identifier(identifier, projection='lookup')
+            if not issue:
+                raise ValueError(f"Issue {identifier} not found.\n\n{ISSUE_NOT_FOUND_HELP}")
+            team_id = issue['team']['id']
+            aliases[identifier] = {}
+            
+            issue_input = {}
+            if update.get('status'):
+                issue_input['stateId'] = self._find_state(team_id, update['status'])['id']
+            if update.get('add_labels'):
+                issue_input['addedLabelIds'] = self._find_label_ids(team_id, update['add_labels'])
+            if update.get('remove_labels'):
+                issue_input['removedLabelIds'] = self._find_label_ids(team_id, update['remove_labels'])
+            
+            if update.get('comment'):
+                declarations.append(f"$comment{i}: CommentCreateInput!")
+                fields.append(
+                    f"c{i}: commentCreate(input: $comment{i}) "
+                    "{ success comment { id body createdAt } }"
+                )
+                # Client-generated comment id makes the whole document safe to retry
+                variables[f"comment{i}"] = {
+                    'id': str(uuid.uuid4()),
+                    'issueId': issue['id'],
+                    'body': update['comment']
+                }
+                aliases[identifier]['comment'] = f"c{i}"
+                comments[f"c{i}"] = variables[f"comment{i}"]
+            
+            if issue_input:
+                declarations.append(f"$issue{i}: String!")
+                variables[f"issue{i}"] = issue['id']
+                declarations.append(f"$input{i}: IssueUpdateInput!")
+                fields.append(
+                    f"u{i}: issueUpdate(id: $issue{i}, input: $input{i}) "
+                    "{ success issue { id identifier state { name } labels { nodes { name } } } }"
+                )
+                variables[f"input{i}"] = issue_input
+                aliases[identifier]['issue'] = f"u{i}"
+        
+        if not fields:
+            return {identifier: {} for identifier in aliases}
+        
+        mutation = "mutation BatchIssueWrite({}) {{\n  {}\n}}".format(
+            ', '.join(declarations), '\n  '.join(fields)
+        )
+        data = self._send_client_id_mutation(mutation, variables)
+        if data is None:
+            # A retry found the comments already created (the first response was lost).
+            # Issue updates are idempotent, so re-send just those to get their results.
+            data = {alias: {'comment': {'id': comment['id'], 'body': comment['body']}}
+                    for alias, comment in comments.items()}
+            update_fields = [field for field in fields if field.startswith('u')]
+            if update_fields:
+                update_declarations = [d for d in declarations if not d.startswith('$comment')]
+                update_variables = {name: value for name, value in variables.items() if not name.startswith('comment')}
+                data.update(self._make_request(
+                    "mutation BatchIssueUpdate({}) {{\n  {}\n}}".format(
+                        ', '.join(update_declarations), '\n  '.join(update_fields)),
+                    update_variables, idempotent=True
+                ))
+        
+        results = {}
+        for identifier, issue_aliases in aliases.items():
+            results[identifier] = {}
+            if 'comment' in issue_aliases:
+                results[identifier]['comment'] = (data.get(issue_aliases['comment']) or {}).get('comment', {})
+            if 'issue' in issue_aliases:
+                results[identifier]['issue'] = (data.get(issue_aliases['issue']) or {}).get('issue', {})
+        return results
+    
     def get_team_issues(self, team_key: str, limit: int = 100) -> List[Dict]:
         """
         Get all issues for a team.
@@ -381,32 +823,88 @@ class LinearClient:
         Returns:
             List of issue dictionaries
         """
-        query = """
-        query GetTeamIssues($teamKey: String!, $first: Int!) {
-            team(key: $teamKey) {
-                issues(first: $first) {
-                    nodes {
-                        id
-                        identifier
-                        title
-                        state {
-                            name
-                        }
-                    }
-                }
-            }
-        }
+        return list(self.iter_team_issues(team_key, limit=limit))
+    
+    def _iter_connection(self, query: str, variables: Dict, path: Tuple[str, ...],
+                         page_size: int, limit: Optional[int]) -> Iterator[Dict]:
         """
+        Page through an issue connection, following pageInfo.endCursor.
         
-        variables = {
-            "teamKey": team_key,
-            "first": limit
-        }
+        Args:
+            query: Paginated document taking $first and $after
+            variables: Remaining variables (filter, team key, ...)
+            path: Keys from the response data to the connection (e.g., ('team', 'issues'))
+            page_size: Issues per request
+            limit: Optional maximum number of issues to yield
+        
+        Yields:
+            Issue dictionaries (also added to the identifier index)
+        """
+        after = None
+        yielded = 0
+        while True:
+            first = page_size if limit is None else min(page_size, limit - yielded)
+            data = self._make_request(query, {**variables, "first": first, "after": after})
+            connection = data
+            for key in path:
+                connection = (connection or {}).get(key) or {}
+            issues = connection.get('nodes', [])
+            self._index_issues(issues)
+            
+            for issue in issues:
+                yield issue
+            yielded += len(issues)
+            
+            page_info = connection.get('pageInfo', {})
+            if not page_info.get('hasNextPage') or not issues:
+                return
+            if limit is not None and yielded >= limit:
+                return
+            after = page_info.get('endCursor')
+    
+    def iter_team_issues(self, team_key: str, page_size: int = 50,
+                         projection: str = 'list', issue_filter: Optional[Dict] = None,
+                         limit: Optional[int] = None, include_archived: bool = False) -> Iterator[Dict]:
+        """
+        Stream a team's issues page by page, following pageInfo.endCursor.
         
-        data = self._make_request(query, variables)
-        team = data.get('team', {})
-        issues = team.get('issues', {}).get('nodes', [])
-        return issues
+        Only one page is held in memory at a time, so callers can process
+        arbitrarily large backlogs incrementally.
+        
+        Args:
+            team_key: Team key (e.g., 'TRA')
+            page_size: Issues per request (Linear allows up to 250)
+            projection: Fields to select per issue (see linear_queries.PROJECTIONS)
+            issue_filter: Optional Linear IssueFilter (e.g., {'state': {'type': {'neq': 'completed'}}})
+            limit: Optional maximum number of issues to yield
+            include_archived: Also return archived issues (the 'sync' projection selects archivedAt)
+            
+        Yields:
+            Issue dictionaries
+        """
+        variables = {"teamKey": team_key, "filter": issue_filter, "includeArchived": include_archived}
+        yield from self._iter_connection(team_issues_query(projection).document, variables,
+                                         ('team', 'issues'), page_size, limit)
+    
+    def iter_issues(self, issue_filter: Optional[Dict] = None, page_size: int = 50,
+                    projection: str = 'list', limit: Optional[int] = None,
+                    include_archived: bool = False) -> Iterator[Dict]:
+        """
+        Stream issues across the whole workspace, page by page.
+        
+        Args:
+            issue_filter: Optional Linear IssueFilter (e.g., {'team': {'key': {'neq': 'TRA'}}})
+            page_size: Issues per request (Linear allows up to 250)
+            projection: Fields to select per issue (see linear_queries.PROJECTIONS)
+            limit: Optional maximum number of issues to yield
+            include_archived: Also return archived issues
+            
+        Yields:
+            Issue dictionaries
+        """
+        variables = {"filter": issue_filter, "includeArchived": include_archived}
+        yield from self._iter_connection(issues_query(projection).document, variables,
+                                         ('issues',), page_size, limit)
 
 
 if __name__ == '__main__':
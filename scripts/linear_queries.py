@@ -0,0 +1,529 @@
+"""
+Registry of Linear GraphQL documents.
+
+Every query and mutation the scripts send lives here, built from named
+fragments so each use case selects only what it reads:
+
+    lookup      id, identifier, team and state - enough to update an issue
+    execute     lookup + title, description, priority, assignee, labels, project
+    detail      execute + attachments, comments and relations
+    categorize  the fields TaskAnalyzer categorizes on
+    sync        categorize + relations and archivedAt (local mirror)
+    list        id, identifier, title and state name
+
+Each registered query carries a complexity estimate (Linear's model: 0.1
+per scalar field, 1 per object, connections multiplied by their page size)
+that the client charges against its complexity budget, and responses are
+counted per operation so bytes transferred per query can be compared.
+
+Usage:
+    spec = issue_query('GetIssueByNumber', 'lookup')
+    data = client._make_request(spec.document, {...})
+    print(format_query_stats())
+"""
+
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Optional
+
+
+DEFAULT_CONNECTION_SIZE = 50  # Linear's default page size for connections without `first`
+
+FRAGMENTS = {
+    'IssueRef': """fragment IssueRef on Issue {
+  id
+  identifier
+  team {
+    id
+    key
+  }
+  state {
+    id
+    name
+    type
+  }
+}""",
+    'IssueListItem': """fragment IssueListItem on Issue {
+  id
+  identifier
+  title
+  state {
+    name
+  }
+}""",
+    'IssueExecute': """fragment IssueExecute on Issue {
+  ...IssueRef
+  title
+  description
+  priority
+  assignee {
+    id
+    name
+    email
+  }
+  labels(first: 25) {
+    nodes {
+      id
+      name
+    }
+  }
+  project {
+    id
+    name
+  }
+  createdAt
+  updatedAt
+}""",
+    'IssueDetail': """fragment IssueDetail on Issue {
+  ...IssueExecute
+  attachments(first: 25) {
+    nodes {
+      id
+      title
+      url
+    }
+  }
+  comments(first: 50) {
+    nodes {
+      id
+      body
+      createdAt
+      user {
+        name
+      }
+    }
+  }
+  relations(first: 25) {
+    nodes {
+      id
+      type
+      relatedIssue {
+        id
+        identifier
+        title
+      }
+    }
+  }
+}""",
+    'IssueCategorize': """fragment IssueCategorize on Issue {
+  id
+  identifier
+  title
+  description
+  state {
+    id
+    name
+    type
+  }
+  priority
+  assignee {
+    id
+    name
+    email
+  }
+  project {
+    id
+    name
+  }
+  labels(first: 25) {
+    nodes {
+      id
+      name
+    }
+  }
+  createdAt
+  updatedAt
+}""",
+    'IssueSync': """fragment IssueSync on Issue {
+  ...IssueCategorize
+  team {
+    id
+    key
+  }
+  relations(first: 25) {
+    nodes {
+      id
+      type
+      relatedIssue {
+        id
+        identifier
+      }
+    }
+  }
+  archivedAt
+}""",
+}
+
+# Use case -> fragment selected for each issue
+PROJECTIONS = {
+    'lookup': 'IssueRef',
+    'execute': 'IssueExecute',
+    'detail': 'IssueDetail',
+    'categorize': 'IssueCategorize',
+    'sync': 'IssueSync',
+    'list': 'IssueListItem',
+}
+
+
+class QuerySpec:
+    """A registered GraphQL document with its fragments and complexity estimate."""
+
+    def __init__(self, name: str, document: str, page_size: int = DEFAULT_CONNECTION_SIZE):
+        """
+        Initialize query spec.
+
+        Args:
+            name: Operation name (used for retry, coalescing and bytes counters)
+            document: Operation text; fragments it spreads are appended automatically
+            page_size: Assumed value of a `$first` variable when estimating complexity
+        """
+        self.name = name
+        self.document = with_fragments(document)
+        self.complexity = estimate_complexity(self.document, page_size)
+
+    def __repr__(self) -> str:
+        return f"QuerySpec({self.name!r}, complexity={self.complexity})"
+
+
+QUERIES: Dict[str, QuerySpec] = {}
+
+
+def register(name: str, document: str, page_size: int = DEFAULT_CONNECTION_SIZE) -> QuerySpec:
+    """Add a document to the registry (idempotent per name)."""
+    spec = QUERIES.get(name)
+    if spec is None:
+        spec = QuerySpec(name, document, page_size)
+        QUERIES[name] = spec
+    return spec
+
+
+def with_fragments(document: str) -> str:
+    """Append the definitions of every fragment the document spreads, transitively."""
+    needed = []
+    pending = re.findall(r'\.\.\.\s*(\w+)', document)
+    while pending:
+        name = pending.pop(0)
+        if name in needed or name not in FRAGMENTS or f"fragment {name} " in document:
+            continue
+        needed.append(name)
+        pending.extend(re.findall(r'\.\.\.\s*(\w+)', FRAGMENTS[name]))
+    return '\n'.join([document] + [FRAGMENTS[name] for name in needed])
+
+
+def operation_name(document: str) -> str:
+    """Get the operation name of a GraphQL document ('anonymous' if unnamed)."""
+    match = re.match(r'\s*(?:query|mutation)\s+(\w+)', document)
+    return match.group(1) if match else 'anonymous'
+
+
+def is_mutation(document: str) -> bool:
+    """True if the document is a mutation."""
+    return bool(re.match(r'\s*mutation\b', document))
+
+
+@lru_cache(maxsize=256)
+def estimate_complexity(document: str, page_size: int = DEFAULT_CONNECTION_SIZE) -> float:
+    """
+    Estimate Linear complexity points for a document.
+
+    Scalars cost 0.1, objects 1, and a connection (a field selecting `nodes`)
+    multiplies its children by its `first` argument (a `$variable` counts as
+    page_size, no argument as 50). Fragment spreads are inlined.
+
+    Args:
+        document: GraphQL document including fragment definitions
+        page_size: Assumed value for `first: $variable`
+
+    Returns:
+        Estimated complexity points (at least 1)
+    """
+    fragments = {}
+    for match in re.finditer(r'fragment\s+(\w+)\s+on\s+\w+\s*\{', document):
+        body, _ = _extract_block(document, match.end())
+        fragments[match.group(1)] = body
+
+    operation = re.sub(r'fragment\s+\w+\s+on\s+\w+\s*\{', '', document)
+    start = operation.find('{')
+    if start == -1:
+        return 1.0
+    body, _ = _extract_block(operation, start + 1)
+
+    # Inline spreads until none remain (fragments may spread other fragments)
+    for _ in range(10):
+        expanded = re.sub(r'\.\.\.\s*(\w+)', lambda m: fragments.get(m.group(1), ''), body)
+        if expanded == body:
+            break
+        body = expanded
+
+    tokens = re.findall(r'\.\.\.|[{}():,]|"[^"]*"|\$?\w+', body)
+    cost, _ = _selection_cost(tokens, 0, page_size)
+    return round(max(cost, 1.0), 1)
+
+
+def _extract_block(text: str, start: int):
+    """Return the text between a '{' (just before start) and its matching '}'."""
+    depth = 1
+    i = start
+    while i < len(text) and depth:
+        if text[i] == '{':
+            depth += 1
+        elif text[i] == '}':
+            depth -= 1
+        i += 1
+    return text[start:i - 1], i
+
+
+def _selection_cost(tokens, i: int, page_size: int):
+    """Cost of a selection set starting at tokens[i]; returns (cost, index after closing brace)."""
+    cost = 0.0
+    while i < len(tokens) and tokens[i] != '}':
+        token = tokens[i]
+        i += 1
+        if token in (',', '...'):
+            continue
+        if i < len(tokens) and tokens[i] == ':':  # alias
+            i += 2
+
+        first = None
+        if i < len(tokens) and tokens[i] == '(':
+            depth = 1
+            i += 1
+            while i < len(tokens) and depth:
+                if tokens[i] == '(':
+                    depth += 1
+                elif tokens[i] == ')':
+                    depth -= 1
+                elif tokens[i] == 'first' and tokens[i + 1] == ':':
+                    value = tokens[i + 2]
+                    first = page_size if value.startswith('$') else int(value) if value.isdigit() else None
+                i += 1
+
+        if i < len(tokens) and tokens[i] == '{':
+            child_cost, i = _selection_cost(tokens, i + 1, page_size)
+            if 'nodes' in _direct_fields(tokens, i):
+                child_cost *= first or DEFAULT_CONNECTION_SIZE
+            cost += 1 + child_cost
+        else:
+            cost += 0.1
+    return cost, i + 1
+
+
+def _direct_fields(tokens, end: int):
+    """Names selected directly inside the block that closed just before tokens[end]."""
+    depth = 0
+    names = set()
+    i = end - 2
+    while i >= 0:
+        token = tokens[i]
+        if token == '}':
+            depth += 1
+        elif token == '{':
+            if depth == 0:
+                break
+            depth -= 1
+        elif depth == 0 and re.match(r'\w+$', token):
+            names.add(token)
+        i -= 1
+    return names
+
+
+# --- Per-operation response accounting ---------------------------------------
+
+_stats: Dict[str, Dict[str, float]] = {}
+_stats_lock = threading.Lock()
+
+
+def record_response(document: str, size: int, complexity: Optional[str] = None) -> None:
+    """
+    Count one response for an operation.
+
+    Args:
+        document: GraphQL document that was sent
+        size: Response body size in bytes (as transferred, before JSON parsing)
+        complexity: Value of Linear's X-Complexity header, if present
+    """
+    name = operation_name(document)
+    with _stats_lock:
+        stats = _stats.setdefault(name, {
+            'calls': 0,
+            'bytes': 0,
+            'estimated_complexity': estimate_complexity(document),
+            'reported_complexity': 0.0,
+        })
+        stats['calls'] += 1
+        stats['bytes'] += size
+        try:
+            stats['reported_complexity'] += float(complexity)
+        except (TypeError, ValueError):
+            pass
+
+
+def get_query_stats() -> Dict[str, Dict[str, float]]:
+    """
+    Get per-operation response counters for this process.
+
+    Returns:
+        Dictionary mapping operation name to calls, bytes, average bytes,
+        estimated complexity and total complexity reported by Linear
+    """
+    with _stats_lock:
+        return {
+            name: dict(stats, avg_bytes=stats['bytes'] / stats['calls'] if stats['calls'] else 0)
+            for name, stats in _stats.items()
+        }
+
+
+def format_query_stats() -> str:
+    """Format per-operation bytes and complexity, largest transfer first."""
+    stats = get_query_stats()
+    if not stats:
+        return ''
+    lines = ["Linear queries (operation: calls / KB / avg KB / est. complexity):"]
+    for name, s in sorted(stats.items(), key=lambda item: item[1]['bytes'], reverse=True):
+        lines.append(
+            f"  {name}: {s['calls']} / {s['bytes'] / 1024:.1f} / {s['avg_bytes'] / 1024:.1f} / {s['estimated_complexity']}"
+        )
+    return '\n'.join(lines)
+
+
+# --- Registered documents ----------------------------------------------------
+
+def _operation_suffix(projection: str) -> str:
+    return projection[0].upper() + projection[1:]
+
+
+def issue_query(operation: str, projection: str) -> QuerySpec:
+    """
+    Get an issue lookup query for a use case.
+
+    Args:
+        operation: 'GetIssueById' or 'GetIssueByNumber'
+        projection: Key of PROJECTIONS (e.g., 'lookup', 'execute')
+
+    Returns:
+        Registered QuerySpec
+    """
+    return QUERIES[f"{operation}{_operation_suffix(projection)}"]
+
+
+def team_issues_query(projection: str) -> QuerySpec:
+    """Get the paginated team-issues query for a use case."""
+    return QUERIES[f"IterTeamIssues{_operation_suffix(projection)}"]
+
+
+def issues_query(projection: str) -> QuerySpec:
+    """Get the paginated workspace-wide issues query for a use case."""
+    return QUERIES[f"IterIssues{_operation_suffix(projection)}"]
+
+
+for _projection, _fragment in PROJECTIONS.items():
+    _suffix = _operation_suffix(_projection)
+    register(f"GetIssueById{_suffix}", f"""query GetIssueById{_suffix}($id: String!) {{
+  issue(id: $id) {{
+    ...{_fragment}
+  }}
+}}""")
+    register(f"GetIssueByNumber{_suffix}", f"""query GetIssueByNumber{_suffix}($teamKey: String!, $number: Float!) {{
+  issues(first: 1, filter: {{ team: {{ key: {{ eq: $teamKey }} }}, number: {{ eq: $number }} }}) {{
+    nodes {{
+      ...{_fragment}
+    }}
+  }}
+}}""")
+    register(f"IterTeamIssues{_suffix}", f"""query IterTeamIssues{_suffix}($teamKey: String!, $first: Int!, $after: String,
+                          $filter: IssueFilter, $includeArchived: Boolean) {{
+  team(key: $teamKey) {{
+    issues(first: $first, after: $after, filter: $filter, includeArchived: $includeArchived) {{
+      nodes {{
+        ...{_fragment}
+      }}
+      pageInfo {{
+        hasNextPage
+        endCursor
+      }}
+    }}
+  }}
+}}""", page_size=100)
+    register(f"IterIssues{_suffix}", f"""query IterIssues{_suffix}($first: Int!, $after: String, $filter: IssueFilter,
+                      $includeArchived: Boolean) {{
+  issues(first: $first, after: $after, filter: $filter, includeArchived: $includeArchived) {{
+    nodes {{
+      ...{_fragment}
+    }}
+    pageInfo {{
+      hasNextPage
+      endCursor
+    }}
+  }}
+}}""", page_size=100)
+
+VIEWER_QUERY = register('GetViewer', """query GetViewer {
+  viewer {
+    id
+    name
+    email
+  }
+}""")
+
+TEAMS_QUERY = register('GetTeams', """query GetTeams {
+  teams {
+    nodes {
+      id
+      key
+      name
+    }
+  }
+}""")
+
+TEAM_STATES_QUERY = register('GetTeamStates', """query GetTeamStates($teamId: String!) {
+  team(id: $teamId) {
+    states {
+      nodes {
+        id
+        name
+        type
+      }
+    }
+  }
+}""")
+
+LABELS_QUERY = register('GetIssueLabels', """query GetIssueLabels($first: Int!, $after: String) {
+  issueLabels(first: $first, after: $after) {
+    nodes {
+      id
+      name
+      team {
+        id
+      }
+    }
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
+  }
+}""", page_size=250)
+
+UPDATE_ISSUE_STATE_MUTATION = register('UpdateIssue', """mutation UpdateIssue($id: String!, $stateId: String!) {
+  issueUpdate(id: $id, input: { stateId: $stateId }) {
+    success
+    issue {
+      id
+      identifier
+      state {
+        name
+      }
+    }
+  }
+}""")
+
+CREATE_COMMENT_MUTATION = register('CreateComment', """mutation CreateComment($id: String!, $issueId: String!, $body: String!) {
+  commentCreate(input: { id: $id, issueId: $issueId, body: $body }) {
+    success
+    comment {
+      id
+      body
+      createdAt
+    }
+  }
+}""")
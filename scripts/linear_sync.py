@@ -0,0 +1,554 @@
+#!/usr/bin/env python3
+"""
+Incremental Linear sync into a local SQLite mirror.
+
+The first sync of a team downloads its open issues; later syncs only ask
+Linear for issues whose updatedAt is past the team's watermark (including
+archived ones, which are dropped from the mirror, and issues moved to another
+team, which leave this team's rows). Workflow states, labels,
+projects and relations are mirrored from the issue payloads, so a repeat
+analysis costs one or two small requests instead of re-downloading every
+description.
+
+Usage:
+    mirror = LinearMirror()
+    sync = LinearSync(mirror)
+    sync.sync_team(client, {'id': team_id, 'key': 'TRA'})
+    issues = mirror.get_open_issues(team_id)
+
+    python linear_sync.py TRA [--full]
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+DEFAULT_MIRROR_PATH = Path(__file__).parent.parent / ".cache" / "linear_mirror.db"
+MOVED_CHECK_BATCH = 250  # Mirrored issue IDs per moved-issue query (one page each)
+WATERMARK_SKEW = timedelta(minutes=1)  # Margin for clock skew when a sync start time becomes the watermark
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+    id TEXT PRIMARY KEY,
+    key TEXT,
+    name TEXT,
+    watermark TEXT,
+    synced_at REAL
+);
+CREATE TABLE IF NOT EXISTS workflow_states (
+    id TEXT PRIMARY KEY,
+    team_id TEXT,
+    name TEXT,
+    type TEXT
+);
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    name TEXT
+);
+CREATE TABLE IF NOT EXISTS labels (
+    id TEXT PRIMARY KEY,
+    name TEXT
+);
+CREATE TABLE IF NOT EXISTS issues (
+    id TEXT PRIMARY KEY,
+    team_id TEXT NOT NULL,
+    identifier TEXT NOT NULL,
+    title TEXT,
+    description TEXT,
+    state_id TEXT,
+    priority INTEGER,
+    assignee_id TEXT,
+    assignee_name TEXT,
+    assignee_email TEXT,
+    project_id TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS issues_team ON issues (team_id);
+CREATE INDEX IF NOT EXISTS issues_identifier ON issues (identifier);
+CREATE TABLE IF NOT EXISTS issue_labels (
+    issue_id TEXT,
+    label_id TEXT,
+    PRIMARY KEY (issue_id, label_id)
+);
+CREATE TABLE IF NOT EXISTS issue_relations (
+    id TEXT PRIMARY KEY,
+    issue_id TEXT,
+    related_issue_id TEXT,
+    related_identifier TEXT,
+    type TEXT
+);
+CREATE INDEX IF NOT EXISTS issue_relations_issue ON issue_relations (issue_id);
+CREATE TABLE IF NOT EXISTS issue_comments (
+    id TEXT PRIMARY KEY,
+    issue_id TEXT,
+    body TEXT,
+    user_id TEXT,
+    user_name TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS issue_comments_issue ON issue_comments (issue_id);
+"""
+
+
+class LinearMirror:
+    """SQLite mirror of Linear issues and the metadata they reference."""
+
+    def __init__(self, path: Optional[Path] = DEFAULT_MIRROR_PATH):
+        """
+        Open (and create if needed) the mirror database.
+
+        Args:
+            path: SQLite file. None keeps the mirror in memory.
+        """
+        if path:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(path) if path else ':memory:', timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        if path:
+            self.conn.execute('PRAGMA journal_mode=WAL')  # Readers don't block a concurrent sync
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def get_watermark(self, team_id: str) -> Optional[str]:
+        """
+        Get the updatedAt watermark of the last completed sync.
+
+        Args:
+            team_id: Linear team UUID
+
+        Returns:
+            ISO-8601 timestamp, or None if the team was never synced
+        """
+        with self._lock:
+            row = self.conn.execute('SELECT watermark FROM teams WHERE id = ?', (team_id,)).fetchone()
+        return row['watermark'] if row else None
+
+    def set_watermark(self, team: Dict, watermark: Optional[str]) -> None:
+        """
+        Record a completed sync.
+
+        Args:
+            team: Team dictionary with id, key and name
+            watermark: Highest updatedAt applied (None keeps the previous value)
+        """
+        with self._lock, self.conn:
+            self.conn.execute(
+                """INSERT INTO teams (id, key, name, watermark, synced_at) VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(id) DO UPDATE SET key = excluded.key, name = excluded.name,
+                       watermark = COALESCE(excluded.watermark, teams.watermark),
+                       synced_at = excluded.synced_at""",
+                (team['id'], team.get('key'), team.get('name'), watermark, time.time())
+            )
+
+    def reset_team(self, team_id: str) -> None:
+        """Forget a team's issues and watermark so the next sync starts over."""
+        with self._lock, self.conn:
+            issue_ids = [row['id'] for row in self.conn.execute('SELECT id FROM issues WHERE team_id = ?', (team_id,))]
+            self._delete_issues(issue_ids)
+            self.conn.execute('UPDATE teams SET watermark = NULL WHERE id = ?', (team_id,))
+
+    def upsert_issues(self, team_id: str, issues: Iterable[Dict]) -> Optional[str]:
+        """
+        Apply a batch of issue payloads in one transaction.
+
+        Archived issues are removed; everything else is inserted or replaced,
+        along with its state, project, labels and relations.
+
+        Args:
+            team_id: Linear team UUID the issues belong to
+            issues: Issue dictionaries selected with the 'sync' projection
+
+        Returns:
+            Highest updatedAt in the batch, or None if it was empty
+        """
+        latest = None
+        with self._lock, self.conn:
+            archived = []
+            for issue in issues:
+                updated_at = issue.get('updatedAt')
+                if updated_at and (latest is None or updated_at > latest):
+                    latest = updated_at
+                if issue.get('archivedAt'):
+                    archived.append(issue['id'])
+                    continue
+                self._upsert_issue(team_id, issue)
+            self._delete_issues(archived)
+        return latest
+
+    def delete_issues(self, issue_ids: List[str]) -> None:
+        """Remove issues (and their labels, relations and comments) from the mirror."""
+        with self._lock, self.conn:
+            self._delete_issues(issue_ids)
+
+    def remove_from_team(self, team_id: str, issue_ids: List[str]) -> int:
+        """
+        Drop issues that left a team, leaving rows another team's sync already re-homed.
+
+        Args:
+            team_id: Linear team UUID the issues were mirrored under
+            issue_ids: Linear issue UUIDs now belonging to another team
+
+        Returns:
+            Number of rows removed
+        """
+        with self._lock, self.conn:
+            stale = [issue_id for issue_id in issue_ids if self.conn.execute(
+                'SELECT 1 FROM issues WHERE id = ? AND team_id = ?', (issue_id, team_id)).fetchone()]
+            self._delete_issues(stale)
+        return len(stale)
+
+    def get_issue_ids(self, team_id: str) -> List[str]:
+        """List the UUIDs of the issues mirrored under a team."""
+        with self._lock:
+            return [row['id'] for row in self.conn.execute('SELECT id FROM issues WHERE team_id = ?', (team_id,))]
+
+    def get_open_issues(self, team_id: str, project_id: Optional[str] = None) -> List[Dict]:
+        """
+        Read a team's not-completed issues from the mirror.
+
+        Args:
+            team_id: Linear team UUID
+            project_id: Optional project filter
+
+        Returns:
+            Issue dictionaries shaped like the Linear API response
+        """
+        where = "i.team_id = ? AND COALESCE(s.type, '') != 'completed'"
+        params: Tuple = (team_id,)
+        if project_id:
+            where += ' AND i.project_id = ?'
+            params += (project_id,)
+        return self._select_issues(where, params)
+
+    def get_issue(self, issue_id: str) -> Optional[Dict]:
+        """
+        Read one issue from the mirror.
+
+        Args:
+            issue_id: Linear issue UUID
+
+        Returns:
+            Issue dictionary, or None if it is not mirrored
+        """
+        issues = self._select_issues('i.id = ?', (issue_id,))
+        return issues[0] if issues else None
+
+    def upsert_comment(self, comment: Dict) -> None:
+        """
+        Store or replace a comment.
+
+        Args:
+            comment: Comment dictionary with id, issueId (or issue.id), body, user and timestamps
+        """
+        user = comment.get('user') or {}
+        issue_id = comment.get('issueId') or (comment.get('issue') or {}).get('id')
+        with self._lock, self.conn:
+            self.conn.execute(
+                """INSERT OR REPLACE INTO issue_comments (id, issue_id, body, user_id, user_name, created_at, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (comment['id'], issue_id, comment.get('body'), user.get('id') or comment.get('userId'),
+                 user.get('name'), comment.get('createdAt'), comment.get('updatedAt'))
+            )
+
+    def delete_comment(self, comment_id: str) -> None:
+        """Remove a comment from the mirror."""
+        with self._lock, self.conn:
+            self.conn.execute('DELETE FROM issue_comments WHERE id = ?', (comment_id,))
+
+    def get_comments(self, issue_id: str) -> List[Dict]:
+        """
+        Read an issue's mirrored comments, oldest first.
+
+        Args:
+            issue_id: Linear issue UUID
+
+        Returns:
+            Comment dictionaries with id, body, user and timestamps
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                'SELECT * FROM issue_comments WHERE issue_id = ? ORDER BY created_at', (issue_id,)
+            ).fetchall()
+        return [{
+            'id': row['id'],
+            'body': row['body'],
+            'user': {'id': row['user_id'], 'name': row['user_name']} if row['user_id'] else None,
+            'createdAt': row['created_at'],
+            'updatedAt': row['updated_at'],
+        } for row in rows]
+
+    def _select_issues(self, where: str, params: Tuple) -> List[Dict]:
+        """Read issues matching a WHERE clause over issues i / workflow_states s, with labels and relations."""
+        joins = """FROM issues i
+                 LEFT JOIN workflow_states s ON s.id = i.state_id
+                 LEFT JOIN projects p ON p.id = i.project_id"""
+
+        with self._lock:
+            rows = self.conn.execute(
+                f"""SELECT i.*, s.name AS state_name, s.type AS state_type, p.name AS project_name
+                    {joins} WHERE {where} ORDER BY i.created_at""",
+                params
+            ).fetchall()
+            labels = self._issue_children(
+                f"""SELECT il.issue_id, l.id, l.name FROM issue_labels il
+                    JOIN labels l ON l.id = il.label_id
+                    WHERE il.issue_id IN (SELECT i.id {joins} WHERE {where})""",
+                params,
+                lambda row: {'id': row['id'], 'name': row['name']}
+            )
+            relations = self._issue_children(
+                f"""SELECT r.* FROM issue_relations r
+                    WHERE r.issue_id IN (SELECT i.id {joins} WHERE {where})""",
+                params,
+                lambda row: {
+                    'id': row['id'],
+                    'type': row['type'],
+                    'relatedIssue': {'id': row['related_issue_id'], 'identifier': row['related_identifier']}
+                }
+            )
+
+        return [self._row_to_issue(row, labels.get(row['id'], []), relations.get(row['id'], []))
+                for row in rows]
+
+    def _issue_children(self, sql: str, params: Tuple, convert) -> Dict[str, List[Dict]]:
+        children: Dict[str, List[Dict]] = {}
+        for row in self.conn.execute(sql, params):
+            children.setdefault(row['issue_id'], []).append(convert(row))
+        return children
+
+    def _upsert_issue(self, team_id: str, issue: Dict) -> None:
+        """Write one issue and the metadata it references. Caller holds the transaction."""
+        # The payload's own team wins, so an issue moved between teams is re-homed
+        team_id = (issue.get('team') or {}).get('id') or team_id
+        state = issue.get('state') or {}
+        if state.get('id') and state.get('name'):
+            self.conn.execute(
+                'INSERT OR REPLACE INTO workflow_states (id, team_id, name, type) VALUES (?, ?, ?, ?)',
+                (state['id'], team_id, state.get('name'), state.get('type'))
+            )
+
+        project = issue.get('project') or {}
+        if project.get('id') and project.get('name'):
+            self.conn.execute('INSERT OR REPLACE INTO projects (id, name) VALUES (?, ?)',
+                              (project['id'], project.get('name')))
+
+        assignee = issue.get('assignee') or {}
+        self.conn.execute(
+            """INSERT OR REPLACE INTO issues (id, team_id, identifier, title, description, state_id, priority,
+                   assignee_id, assignee_name, assignee_email, project_id, created_at, updated_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (issue['id'], team_id, issue.get('identifier'), issue.get('title'), issue.get('description'),
+             state.get('id'), issue.get('priority'), assignee.get('id'), assignee.get('name'),
+             assignee.get('email'), project.get('id'), issue.get('createdAt'), issue.get('updatedAt'))
+        )
+
+        if 'labels' in issue:
+            self.conn.execute('DELETE FROM issue_labels WHERE issue_id = ?', (issue['id'],))
+            for label in (issue.get('labels') or {}).get('nodes', []):
+                self.conn.execute('INSERT OR REPLACE INTO labels (id, name) VALUES (?, ?)',
+                                  (label['id'], label.get('name')))
+                self.conn.execute('INSERT OR IGNORE INTO issue_labels (issue_id, label_id) VALUES (?, ?)',
+                                  (issue['id'], label['id']))
+
+        if 'relations' in issue:
+            self.conn.execute('DELETE FROM issue_relations WHERE issue_id = ?', (issue['id'],))
+            for relation in (issue.get('relations') or {}).get('nodes', []):
+                related = relation.get('relatedIssue') or {}
+                self.conn.execute(
+                    """INSERT OR REPLACE INTO issue_relations (id, issue_id, related_issue_id, related_identifier, type)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    (relation['id'], issue['id'], related.get('id'), related.get('identifier'), relation.get('type'))
+                )
+
+    def _delete_issues(self, issue_ids: List[str]) -> None:
+        """Delete issues and their children. Caller holds the transaction."""
+        for issue_id in issue_ids:
+            self.conn.execute('DELETE FROM issue_labels WHERE issue_id = ?', (issue_id,))
+            self.conn.execute('DELETE FROM issue_relations WHERE issue_id = ?', (issue_id,))
+            self.conn.execute('DELETE FROM issue_comments WHERE issue_id = ?', (issue_id,))
+            self.conn.execute('DELETE FROM issues WHERE id = ?', (issue_id,))
+
+    @staticmethod
+    def _row_to_issue(row: sqlite3.Row, labels: List[Dict], relations: List[Dict]) -> Dict:
+        """Rebuild the API-shaped issue dictionary from a joined row."""
+        return {
+            'id': row['id'],
+            'identifier': row['identifier'],
+            'title': row['title'],
+            'description': row['description'],
+            'state': {'id': row['state_id'], 'name': row['state_name'], 'type': row['state_type']},
+            'priority': row['priority'],
+            'assignee': ({'id': row['assignee_id'], 'name': row['assignee_name'], 'email': row['assignee_email']}
+                         if row['assignee_id'] else None),
+            'project': {'id': row['project_id'], 'name': row['project_name']} if row['project_id'] else None,
+            'labels': {'nodes': labels},
+            'relations': {'nodes': relations},
+            'createdAt': row['created_at'],
+            'updatedAt': row['updated_at'],
+        }
+
+
+class LinearSync:
+    """Pulls changed issues from Linear into a LinearMirror."""
+
+    def __init__(self, mirror: Optional[LinearMirror] = None, page_size: int = 100):
+        """
+        Initialize sync engine.
+
+        Args:
+            mirror: Target mirror (defaults to the shared on-disk mirror)
+            page_size: Issues per request (Linear allows up to 250)
+        """
+        self.mirror = mirror or LinearMirror()
+        self.page_size = page_size
+
+    def _plan(self, team: Dict, full: bool) -> Tuple[Optional[str], Dict, bool]:
+        """Work out the watermark, issue filter and archived flag for a sync."""
+        if full:
+            self.mirror.reset_team(team['id'])
+        watermark = self.mirror.get_watermark(team['id'])
+        if watermark:
+            # Everything touched since the last sync, including issues completed or archived since
+            return watermark, {'updatedAt': {'gt': watermark}}, True
+        # First sync: open issues only; later changes keep the mirror consistent
+        return None, {'state': {'type': {'neq': 'completed'}}}, False
+
+    def _moved_filters(self, team: Dict, watermark: str) -> List[Dict]:
+        """Filters for mirrored issues of this team that changed since the watermark and moved elsewhere."""
+        issue_ids = self.mirror.get_issue_ids(team['id'])
+        return [
+            {'id': {'in': issue_ids[start:start + MOVED_CHECK_BATCH]},
+             'team': {'key': {'neq': team['key']}}, 'updatedAt': {'gt': watermark}}
+            for start in range(0, len(issue_ids), MOVED_CHECK_BATCH)
+        ]
+
+    @staticmethod
+    def _start_watermark() -> str:
+        """A sync's start time less a clock-skew margin: the highest watermark it can safely record."""
+        started = datetime.now(timezone.utc) - WATERMARK_SKEW
+        return started.strftime('%Y-%m-%dT%H:%M:%S.') + f"{started.microsecond // 1000:03d}Z"
+
+    def _apply_page(self, team: Dict, page: List[Dict], progress: Dict) -> None:
+        """Write one page to the mirror and advance the pending watermark."""
+        if not page:
+            return
+        latest = self.mirror.upsert_issues(team['id'], page)
+        if latest and (progress['watermark'] is None or latest > progress['watermark']):
+            progress['watermark'] = latest
+        progress['fetched'] += len(page)
+
+    def _finish(self, team: Dict, moved: List[str], started: str, progress: Dict) -> Dict:
+        """Drop issues that moved away and record the new watermark."""
+        progress['moved'] = self.mirror.remove_from_team(team['id'], moved) if moved else 0
+        # Never past the sync's start: an issue fetched on an early page and edited
+        # while later pages were read has an updatedAt between the two, and must be
+        # picked up next time. An empty initial sync records its start time too, so
+        # the next run is incremental.
+        if progress['watermark'] is None or progress['watermark'] > started:
+            progress['watermark'] = started
+        self.mirror.set_watermark(team, progress['watermark'])
+        return progress
+
+    def sync_team(self, client, team: Dict, full: bool = False) -> Dict:
+        """
+        Bring the mirror up to date for one team.
+
+        Each page is applied in its own transaction; the watermark only moves
+        once every page has been applied, so an interrupted sync is repeated
+        rather than leaving a gap. Incremental syncs also ask which of the
+        team's mirrored issues changed and now belong to another team (the
+        team's own issue list no longer returns them), one request per
+        MOVED_CHECK_BATCH mirrored issues, and drop them from this team's rows.
+
+        Args:
+            client: LinearClient for the team's workspace
+            team: Team dictionary with id, key and name (from client.get_teams())
+            full: Discard the team's mirror and download again
+
+        Returns:
+            Dictionary with fetched and moved counts, watermark and whether this was an initial sync
+        """
+        started = self._start_watermark()
+        watermark, issue_filter, include_archived = self._plan(team, full)
+
+        progress = {'fetched': 0, 'watermark': watermark, 'initial': watermark is None}
+        page = []
+        for issue in client.iter_team_issues(team['key'], page_size=self.page_size, projection='sync',
+                                             issue_filter=issue_filter, include_archived=include_archived):
+            page.append(issue)
+            if len(page) >= self.page_size:
+                self._apply_page(team, page, progress)
+                page = []
+        self._apply_page(team, page, progress)
+
+        moved = []
+        if watermark:
+            for issue_filter in self._moved_filters(team, watermark):
+                moved.extend(issue['id'] for issue in client.iter_issues(
+                    issue_filter, page_size=MOVED_CHECK_BATCH, projection='lookup'))
+        return self._finish(team, moved, started, progress)
+
+    async def sync_team_async(self, client, team: Dict, full: bool = False) -> Dict:
+        """
+        Async version of sync_team for AsyncLinearClient.
+
+        Args:
+            client: AsyncLinearClient for the team's workspace
+            team: Team dictionary with id, key and name
+            full: Discard the team's mirror and download again
+
+        Returns:
+            Dictionary with fetched and moved counts, watermark and whether this was an initial sync
+        """
+        started = self._start_watermark()
+        watermark, issue_filter, include_archived = self._plan(team, full)
+
+        progress = {'fetched': 0, 'watermark': watermark, 'initial': watermark is None}
+        page = []
+        async for issue in client.iter_team_issues(team['key'], page_size=self.page_size, projection='sync',
+                                                   issue_filter=issue_filter, include_archived=include_archived):
+            page.append(issue)
+            if len(page) >= self.page_size:
+                self._apply_page(team, page, progress)
+                page = []
+        self._apply_page(team, page, progress)
+
+        moved = []
+        if watermark:
+            for issue_filter in self._moved_filters(team, watermark):
+                moved.extend([issue['id'] async for issue in client.iter_issues(
+                    issue_filter, page_size=MOVED_CHECK_BATCH, projection='lookup')])
+        return self._finish(team, moved, started, progress)
+
+
+if __name__ == '__main__':
+    import argparse
+    from linear_client import LinearClient
+
+    parser = argparse.ArgumentParser(description='Sync a Linear team into the local SQLite mirror')
+    parser.add_argument('team_key', help='Team key (e.g., TRA)')
+    parser.add_argument('--full', action='store_true', help='Discard the mirror for this team and resync')
+    args = parser.parse_args()
+
+    client = LinearClient()
+    team = next((t for t in client.get_teams() if t.get('key') == args.team_key), None)
+    if not team:
+        print(f"❌ Team {args.team_key} not found in Linear workspace")
+        raise SystemExit(1)
+
+    result = LinearSync().sync_team(client, team, full=args.full)
+    kind = 'Initial' if result['initial'] else 'Incremental'
+    print(f"✅ {kind} sync of {args.team_key}: {result['fetched']} issues, {result['moved']} moved to other teams "
+          f"(watermark {result['watermark']})")
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Linear Webhook Receiver - Push Linear changes into the local mirror
+
+This script will:
+1. Accept Linear Issue and Comment webhooks and verify their Linear-Signature
+2. Apply each change to the local SQLite mirror (see linear_sync.py)
+3. Queue issues that just became agent-suitable for AgentWorkflow.work_on_team
+
+Usage:
+    export LINEAR_WEBHOOK_SECRET=...       # Signing secret from Linear webhook settings
+    python3 scripts/linear_webhook.py --port 8090
+    python3 scripts/linear_webhook.py --port 8090 --work            # Also work queued issues
+    python3 scripts/linear_webhook.py --record recorded_webhooks/   # Save payloads for replay
+    python3 scripts/linear_webhook.py --drain                       # Work queued issues once
+
+Expose the port with a tunnel (e.g., ngrok) and point a Linear webhook at
+https://<host>/webhooks/linear. Replay recorded payloads locally with
+scripts/replay_webhooks.py.
+"""
+
+import os
+import sys
+import hmac
+import json
+import time
+import hashlib
+import argparse
+import threading
+import http.server
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add scripts directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from team_manager import TeamManager
+from task_analyzer import TaskAnalyzer
+from linear_sync import LinearMirror, DEFAULT_MIRROR_PATH
+
+
+DEFAULT_PORT = 8090
+WEBHOOK_PATH = '/webhooks/linear'
+SIGNATURE_HEADER = 'Linear-Signature'
+MAX_TIMESTAMP_SKEW = 60  # Seconds - Linear recommends rejecting older deliveries
+DEFAULT_QUEUE_DIR = Path(__file__).parent.parent / ".cache" / "webhook_queue"
+
+
+def sign_payload(body: bytes, secret: str) -> str:
+    """Compute the Linear-Signature value (hex HMAC-SHA256 of the raw body)."""
+    return hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(body: bytes, signature: Optional[str], secret: str) -> bool:
+    """
+    Check a delivery's Linear-Signature header.
+
+    Args:
+        body: Raw request body
+        signature: Linear-Signature header value
+        secret: Webhook signing secret
+
+    Returns:
+        True if the signature matches
+    """
+    if not signature:
+        return False
+    return hmac.compare_digest(sign_payload(body, secret), signature)
+
+
+def is_fresh(payload: Dict, max_skew: Optional[float] = MAX_TIMESTAMP_SKEW) -> bool:
+    """Reject replayed deliveries whose webhookTimestamp (epoch ms) is too old."""
+    if max_skew is None:
+        return True
+    timestamp = payload.get('webhookTimestamp')
+    if not isinstance(timestamp, (int, float)):
+        return False
+    return abs(time.time() - timestamp / 1000) <= max_skew
+
+
+class WebhookQueue:
+    """File-backed queue of issues waiting for AgentWorkflow.work_on_team."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize queue.
+
+        Args:
+            path: Queue directory (defaults to .cache/webhook_queue/)
+        """
+        self.path = Path(path) if path else DEFAULT_QUEUE_DIR
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def enqueue(self, team_id: str, issue: Dict) -> bool:
+        """
+        Queue an issue. Re-queuing an already queued issue is a no-op.
+
+        Args:
+            team_id: Configured team identifier
+            issue: Issue dictionary (identifier and title are stored)
+
+        Returns:
+            True if the issue was newly queued
+        """
+        entry_path = self.path / f"{issue['identifier']}.json"
+        if entry_path.exists():
+            return False
+        entry = {
+            'team_id': team_id,
+            'task_id': issue['identifier'],
+            'title': issue.get('title'),
+            'queued_at': time.time()
+        }
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f, indent=2)
+        os.replace(tmp_path, entry_path)
+        return True
+
+    def pending(self) -> List[Dict]:
+        """List queued entries, oldest first."""
+        entries = []
+        for entry_path in self.path.glob('*.json'):
+            try:
+                with open(entry_path, 'r') as f:
+                    entries.append(json.load(f))
+            except (OSError, ValueError):
+                continue  # Half-written or removed concurrently
+        return sorted(entries, key=lambda entry: entry.get('queued_at', 0))
+
+    def remove(self, task_id: str) -> None:
+        """Drop an entry once it has been worked on."""
+        try:
+            (self.path / f"{task_id}.json").unlink()
+        except FileNotFoundError:
+            pass
+
+
+class WebhookProcessor:
+    """Applies verified webhook payloads to the mirror and queue."""
+
+    def __init__(self, team_manager: TeamManager, mirror: Optional[LinearMirror] = None,
+                 queue: Optional[WebhookQueue] = None):
+        """
+        Initialize processor.
+
+        Args:
+            team_manager: TeamManager used to map Linear teams to configured teams
+            mirror: Local issue mirror (defaults to the shared on-disk mirror)
+            queue: Work queue for newly agent-suitable issues
+        """
+        self.team_manager = team_manager
+        self.mirror = mirror or LinearMirror(DEFAULT_MIRROR_PATH)
+        self.queue = queue or WebhookQueue()
+        self.analyzer = TaskAnalyzer(team_manager, use_mirror=False)
+
+    def handle(self, payload: Dict) -> Dict:
+        """
+        Apply one webhook payload.
+
+        Args:
+            payload: Parsed webhook body (type, action, data, ...)
+
+        Returns:
+            Dictionary describing what was done
+        """
+        event_type = payload.get('type')
+        action = payload.get('action')
+        data = payload.get('data') or {}
+
+        if event_type == 'Issue':
+            return self._handle_issue(action, data)
+        if event_type == 'Comment':
+            return self._handle_comment(action, data)
+        return {'ignored': f'{event_type} events are not handled'}
+
+    def _handle_issue(self, action: str, data: Dict) -> Dict:
+        team_id = data.get('teamId') or (data.get('team') or {}).get('id')
+        if action == 'remove' or data.get('archivedAt'):
+            self.mirror.delete_issues([data['id']])
+            return {'issue': data.get('identifier'), 'action': 'removed'}
+
+        previous = self.mirror.get_issue(data['id'])
+        issue = self._issue_from_webhook(data)
+        self.mirror.upsert_issues(team_id, [issue])
+
+        # Labels, state and project come back resolved from the mirror
+        issue = self.mirror.get_issue(data['id']) or issue
+        result = {'issue': issue['identifier'], 'action': 'updated' if previous else 'created'}
+
+        if self._newly_suitable(previous, issue):
+            configured_team = self._configured_team(data.get('team') or {})
+            if configured_team and self.queue.enqueue(configured_team, issue):
+                result['queued'] = configured_team
+        return result
+
+    def _handle_comment(self, action: str, data: Dict) -> Dict:
+        if action == 'remove':
+            self.mirror.delete_comment(data['id'])
+            return {'comment': data['id'], 'action': 'removed'}
+        self.mirror.upsert_comment(data)
+        return {'comment': data['id'], 'action': 'updated' if action == 'update' else 'created'}
+
+    def _newly_suitable(self, previous: Optional[Dict], issue: Dict) -> bool:
+        """True when an open issue is agent-suitable now but was not before."""
+        state_type = ((issue.get('state') or {}).get('type') or '').lower()
+        if state_type in ('completed', 'canceled'):
+            return False
+        if self.analyzer.categorize_task(issue) != 'agent_suitable':
+            return False
+        return previous is None or self.analyzer.categorize_task(previous) != 'agent_suitable'
+
+    def _configured_team(self, linear_team: Dict) -> Optional[str]:
+        """Map a Linear team to a configured team by name, or the only configured team."""
+        team_ids = self.team_manager.get_team_ids()
+        name = (linear_team.get('name') or '').lower()
+        for team_id in team_ids:
+            team_config = self.team_manager.get_team(team_id) or {}
+            if name and team_config.get('name', team_id).lower() == name:
+                return team_id
+        return team_ids[0] if len(team_ids) == 1 else None
+
+    @staticmethod
+    def _issue_from_webhook(data: Dict) -> Dict:
+        """Convert Issue webhook data to the shape LinearMirror.upsert_issues expects."""
+        issue = {
+            'id': data['id'],
+            'identifier': data.get('identifier'),
+            'title': data.get('title'),
+            'description': data.get('description'),
+            'state': data.get('state') or {'id': data.get('stateId')},
+            'priority': data.get('priority'),
+            'assignee': data.get('assignee'),
+            'project': data.get('project') or ({'id': data['projectId']} if data.get('projectId') else None),
+            'createdAt': data.get('createdAt'),
+            'updatedAt': data.get('updatedAt'),
+        }
+        if isinstance(data.get('labels'), list):
+            issue['labels'] = {'nodes': data['labels']}
+        return issue
+
+
+def drain_queue(queue: WebhookQueue, workflow=None) -> int:
+    """
+    Work every queued issue through AgentWorkflow.work_on_team, one call per team.
+
+    Only the issues work_on_team reports as worked on leave the queue; the
+    rest (analysis failed, or the issue wasn't selected, e.g. because the
+    mirror is behind) stay queued for the next drain.
+
+    Args:
+        queue: Webhook work queue
+        workflow: AgentWorkflow instance (created on first use)
+
+    Returns:
+        Number of queued issues processed
+    """
+    by_team: Dict[str, List[str]] = {}
+    for entry in queue.pending():
+        by_team.setdefault(entry['team_id'], []).append(entry['task_id'])
+    if not by_team:
+        return 0
+
+    if workflow is None:
+        from agent_workflow import AgentWorkflow
+        workflow = AgentWorkflow()
+
+    processed = 0
+    for team_id, task_ids in by_team.items():
+        try:
+            results = workflow.work_on_team(team_id, task_ids=task_ids) or []
+        except Exception as e:
+            print(f"❌ Error working queued tasks for {team_id}: {e}")
+            continue
+        worked = {result.get('task_id') for result in results}
+        for task_id in task_ids:
+            if task_id in worked:
+                queue.remove(task_id)
+                processed += 1
+        left = set(task_ids) - worked
+        if left:
+            print(f"⚠️  {len(left)} queued issue(s) for {team_id} not worked on; left in the queue")
+    return processed
+
+
+class WebhookHandler(http.server.BaseHTTPRequestHandler):
+    """Verifies and dispatches webhook deliveries. Configured through attributes on the server."""
+
+    def do_POST(self):
+        if self.path.split('?')[0] != WEBHOOK_PATH:
+            self._reply(404, {'error': 'not found'})
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+
+        if not verify_signature(body, self.headers.get(SIGNATURE_HEADER), self.server.secret):
+            self._reply(401, {'error': 'invalid signature'})
+            print(f"⚠️  Rejected delivery with invalid {SIGNATURE_HEADER}")
+            return
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self._reply(400, {'error': 'invalid JSON'})
+            return
+
+        if not is_fresh(payload, self.server.max_skew):
+            self._reply(401, {'error': 'stale webhookTimestamp'})
+            print("⚠️  Rejected stale delivery (webhookTimestamp outside allowed skew)")
+            return
+
+        if self.server.record_dir:
+            name = f"{int(time.time() * 1000)}-{payload.get('type')}-{payload.get('action')}.json"
+            (self.server.record_dir / name).write_bytes(body)
+
+        try:
+            result = self.server.processor.handle(payload)
+        except Exception as e:
+            # Non-2xx makes Linear redeliver
+            self._reply(500, {'error': str(e)})
+            print(f"❌ Error applying {payload.get('type')} {payload.get('action')}: {e}")
+            return
+
+        self._reply(200, result)
+        print(f"✅ {payload.get('type')} {payload.get('action')}: {json.dumps(result)}")
+        if result.get('queued'):
+            self.server.work_available.set()
+
+    def _reply(self, status: int, body: Dict) -> None:
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Suppress default access log - deliveries are summarized in do_POST
+        pass
+
+
+def run_worker(queue: WebhookQueue, work_available: threading.Event, interval: float = 30):
+    """Drain the queue whenever a delivery queues work (or every `interval` seconds)."""
+    while True:
+        work_available.wait(timeout=interval)
+        work_available.clear()
+        try:
+            drain_queue(queue)
+        except Exception as e:
+            print(f"❌ Queue worker error: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Receive Linear webhooks into the local mirror')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Port to listen on')
+    parser.add_argument('--secret', default=os.getenv('LINEAR_WEBHOOK_SECRET'),
+                        help='Webhook signing secret (default: LINEAR_WEBHOOK_SECRET)')
+    parser.add_argument('--max-skew', type=float, default=MAX_TIMESTAMP_SKEW,
+                        help='Reject deliveries older than this many seconds (0 disables the check)')
+    parser.add_argument('--record', type=Path, help='Directory to save verified payloads for replay')
+    parser.add_argument('--work', action='store_true',
+                        help='Work queued agent-suitable issues as they arrive')
+    parser.add_argument('--drain', action='store_true',
+                        help='Work queued issues once and exit')
+    args = parser.parse_args()
+
+    queue = WebhookQueue()
+
+    if args.drain:
+        processed = drain_queue(queue)
+        print(f"Processed {processed} queued issue(s)")
+        return 0
+
+    if not args.secret:
+        print("Error: LINEAR_WEBHOOK_SECRET not set\n")
+        print("Next steps:")
+        print("  1. Create a webhook in Linear: Settings → API → Webhooks (Issues and Comments)")
+        print("  2. Copy its signing secret")
+        print("  3. export LINEAR_WEBHOOK_SECRET=... (or pass --secret)")
+        return 1
+
+    if args.record:
+        args.record.mkdir(parents=True, exist_ok=True)
+
+    server = http.server.ThreadingHTTPServer((args.host, args.port), WebhookHandler)
+    server.secret = args.secret
+    server.max_skew = args.max_skew or None
+    server.record_dir = args.record
+    server.processor = WebhookProcessor(TeamManager(), queue=queue)
+    server.work_available = threading.Event()
+
+    if args.work:
+        threading.Thread(target=run_worker, args=(queue, server.work_available), daemon=True).start()
+
+    print("=" * 60)
+    print("LINEAR WEBHOOK RECEIVER")
+    print("=" * 60)
+    print(f"\n✅ Listening on http://{args.host}:{args.port}{WEBHOOK_PATH}")
+    print(f"✅ Mirror: {DEFAULT_MIRROR_PATH}")
+    print(f"✅ Queue: {queue.path}" + (" (worked automatically)" if args.work else ""))
+    if args.record:
+        print(f"✅ Recording payloads to: {args.record}")
+    print("\nPress Ctrl+C to stop")
+    print("=" * 60)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
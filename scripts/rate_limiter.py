@@ -0,0 +1,217 @@
+"""
+Token-bucket rate limiter shared across threads and processes.
+
+Buckets are kept in sync with what the server reports (remaining budget and
+reset time from response headers) instead of a local guess. When a state
+file is configured, the bucket is persisted under a file lock so parallel
+workers on the same machine draw from one budget.
+
+Usage:
+    bucket = TokenBucket.shared('linear-requests', capacity=1500, period=3600)
+    bucket.acquire()
+    ...
+    bucket.update_from_server(remaining=1320, limit=1500, reset_at=1735689600.0)
+"""
+
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows - fall back to in-process locking only
+    fcntl = None
+
+
+DEFAULT_STATE_DIR = Path(__file__).parent.parent / ".cache" / "rate_limits"
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a non-blocking acquire cannot be satisfied."""
+
+
+class TokenBucket:
+    """Token bucket with optional cross-process state file."""
+
+    _shared: Dict[str, 'TokenBucket'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, name: str, capacity: float, period: float,
+                 state_path: Optional[Path] = None, max_wait: float = 3600):
+        """
+        Initialize token bucket.
+
+        Args:
+            name: Bucket name (used in error messages and the state file name)
+            capacity: Maximum tokens (e.g., requests per period)
+            period: Seconds to refill a full bucket
+            state_path: Optional JSON file shared by processes using this bucket
+            max_wait: Longest a blocking acquire will sleep before giving up
+        """
+        self.name = name
+        self.capacity = float(capacity)
+        self.period = float(period)
+        self.state_path = Path(state_path) if state_path else None
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._state = {
+            'tokens': self.capacity,
+            'updated_at': time.time(),
+            'blocked_until': 0.0,
+        }
+
+    @classmethod
+    def shared(cls, name: str, capacity: float, period: float,
+               state_dir: Optional[Path] = DEFAULT_STATE_DIR, **kwargs) -> 'TokenBucket':
+        """
+        Get the process-wide bucket for a name, creating it on first use.
+
+        Args:
+            name: Bucket name. Include an API key hash when limits are per key.
+            capacity: Maximum tokens
+            period: Seconds to refill a full bucket
+            state_dir: Directory for the cross-process state file. None keeps state in memory.
+
+        Returns:
+            Shared TokenBucket instance
+        """
+        with cls._shared_lock:
+            bucket = cls._shared.get(name)
+            if bucket is None:
+                state_path = Path(state_dir) / f"{name}.json" if state_dir else None
+                bucket = cls(name, capacity, period, state_path=state_path, **kwargs)
+                cls._shared[name] = bucket
+            return bucket
+
+    @staticmethod
+    def key_hash(secret: str) -> str:
+        """Short, non-reversible tag for naming per-credential buckets."""
+        return hashlib.sha256(secret.encode('utf-8')).hexdigest()[:12]
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self.capacity / self.period
+
+    def acquire(self, cost: float = 1.0, blocking: bool = True) -> float:
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            cost: Tokens to take
+            blocking: If False, raise RateLimitExceeded instead of sleeping
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self.reserve(cost)
+            if wait <= 0:
+                return waited
+            if not blocking or waited + wait > self.max_wait:
+                raise RateLimitExceeded(
+                    f"Rate limit reached for {self.name}; next slot in {wait:.0f}s.\n\n"
+                    "Next steps:\n"
+                    "1. Wait for the rate limit window to reset\n"
+                    "2. Use --limit to work on fewer tasks at once\n"
+                    "3. Consider cloud execution for large batches"
+                )
+            time.sleep(wait)
+            waited += wait
+
+    def reserve(self, cost: float = 1.0) -> float:
+        """
+        Take tokens if available, otherwise report how long to wait.
+
+        Args:
+            cost: Tokens to take
+
+        Returns:
+            0 if the tokens were taken, otherwise seconds until they could be
+        """
+        with self._locked_state() as state:
+            now = time.time()
+            if state['blocked_until'] > now:
+                return state['blocked_until'] - now
+            self._refill(state, now)
+            if state['tokens'] >= cost:
+                state['tokens'] -= cost
+                return 0.0
+            return (cost - state['tokens']) / self.rate
+
+    def update_from_server(self, remaining: Optional[float] = None, limit: Optional[float] = None,
+                           reset_at: Optional[float] = None) -> None:
+        """
+        Resynchronize the bucket with budget reported by the server.
+
+        Args:
+            remaining: Tokens the server says are left in the window
+            limit: Window capacity reported by the server
+            reset_at: Epoch seconds when the window resets
+        """
+        with self._locked_state() as state:
+            now = time.time()
+            if limit:
+                self.capacity = float(limit)
+            if remaining is not None:
+                state['tokens'] = min(float(remaining), self.capacity)
+                state['updated_at'] = now
+                if remaining <= 0 and reset_at and reset_at > now:
+                    state['blocked_until'] = max(state['blocked_until'], reset_at)
+
+    def block_until(self, reset_at: float) -> None:
+        """
+        Stop handing out tokens until a reset time (e.g., after HTTP 429).
+
+        Args:
+            reset_at: Epoch seconds when requests may resume
+        """
+        with self._locked_state() as state:
+            state['blocked_until'] = max(state['blocked_until'], reset_at)
+            state['tokens'] = 0.0
+            state['updated_at'] = time.time()
+
+    @property
+    def tokens(self) -> float:
+        """Current token estimate (after refill)."""
+        with self._locked_state() as state:
+            self._refill(state, time.time())
+            return state['tokens']
+
+    def _refill(self, state: Dict, now: float) -> None:
+        """Add tokens earned since the last update, capped at capacity."""
+        elapsed = max(now - state['updated_at'], 0.0)
+        state['tokens'] = min(self.capacity, state['tokens'] + elapsed * self.rate)
+        state['updated_at'] = now
+
+    @contextmanager
+    def _locked_state(self):
+        """Yield bucket state under the thread lock and, if configured, the file lock."""
+        with self._lock:
+            if not self.state_path:
+                yield self._state
+                return
+
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.state_path, 'a+') as f:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        self._state.update(json.loads(f.read() or '{}'))
+                    except ValueError:
+                        pass  # Corrupt state - keep in-memory values
+                    yield self._state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(self._state))
+                    f.flush()
+                finally:
+                    if fcntl:
+                        fcntl.flock(f, fcntl.LOCK_UN)
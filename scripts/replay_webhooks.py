@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Replay recorded Linear webhook payloads against a local receiver.
+
+Each payload is re-stamped with the current webhookTimestamp (so it passes
+the receiver's freshness check) and signed with the webhook secret, then
+POSTed like a real Linear delivery.
+
+Usage:
+    python3 scripts/linear_webhook.py --record recorded_webhooks/   # capture real deliveries
+    python3 scripts/replay_webhooks.py recorded_webhooks/
+    python3 scripts/replay_webhooks.py payload.json --url http://localhost:8090/webhooks/linear
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import List
+
+import requests
+
+# Add scripts directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from linear_webhook import DEFAULT_PORT, WEBHOOK_PATH, SIGNATURE_HEADER, sign_payload
+
+
+def collect_payload_files(paths: List[Path]) -> List[Path]:
+    """Expand directories into their *.json files, in name (recording) order."""
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.glob('*.json')))
+        else:
+            files.append(path)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay recorded Linear webhook payloads')
+    parser.add_argument('paths', nargs='+', type=Path, help='Payload files or directories of *.json files')
+    parser.add_argument('--url', default=f'http://localhost:{DEFAULT_PORT}{WEBHOOK_PATH}',
+                        help='Webhook receiver URL')
+    parser.add_argument('--secret', default=os.getenv('LINEAR_WEBHOOK_SECRET'),
+                        help='Webhook signing secret (default: LINEAR_WEBHOOK_SECRET)')
+    parser.add_argument('--keep-timestamp', action='store_true',
+                        help='Send the recorded webhookTimestamp instead of the current time')
+    parser.add_argument('--delay', type=float, default=0, help='Seconds to wait between deliveries')
+    args = parser.parse_args()
+
+    if not args.secret:
+        print("Error: LINEAR_WEBHOOK_SECRET not set (or pass --secret)")
+        return 1
+
+    files = collect_payload_files(args.paths)
+    if not files:
+        print("No payload files found")
+        return 1
+
+    failures = 0
+    with requests.Session() as session:
+        for path in files:
+            payload = json.loads(path.read_text())
+            if not args.keep_timestamp:
+                payload['webhookTimestamp'] = int(time.time() * 1000)
+            body = json.dumps(payload).encode('utf-8')
+
+            response = session.post(args.url, data=body, timeout=30, headers={
+                'Content-Type': 'application/json',
+                'Linear-Event': str(payload.get('type')),
+                SIGNATURE_HEADER: sign_payload(body, args.secret),
+            })
+            ok = response.status_code == 200
+            failures += 0 if ok else 1
+            print(f"{'✅' if ok else '❌'} {path.name}: {response.status_code} {response.text[:200]}")
+
+            if args.delay:
+                time.sleep(args.delay)
+
+    print(f"\nReplayed {len(files)} payload(s), {failures} failed")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    exit(main())
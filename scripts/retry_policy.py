@@ -0,0 +1,221 @@
+"""
+Retry policy shared by the Linear, ActiveCampaign and Google clients.
+
+Transient failures (timeouts, connection resets, 5xx) are retried with
+jittered exponential backoff, but only for idempotent operations and only
+while the retry budget allows it. Per-endpoint counters show which service
+is costing us throughput.
+
+Usage:
+    policy = RetryPolicy(timeout=30)
+    data = policy.call(lambda: fetch(timeout=policy.timeout), endpoint='linear:GetIssue')
+    print(get_retry_stats())
+"""
+
+import asyncio
+import random
+import socket
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import requests
+    REQUESTS_TRANSIENT_ERRORS = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+    )
+except ImportError:
+    REQUESTS_TRANSIENT_ERRORS = ()
+
+try:
+    import httpx
+    HTTPX_TRANSIENT_ERRORS = (httpx.TransportError,)
+except ImportError:
+    HTTPX_TRANSIENT_ERRORS = ()
+
+
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+class TransientHTTPError(Exception):
+    """Raised by clients for responses that are safe to retry (5xx, 429)."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def is_transient(error: Exception) -> bool:
+    """
+    Decide whether an exception is a transient failure worth retrying.
+
+    Args:
+        error: Exception raised by a request
+
+    Returns:
+        True for timeouts, connection errors and retryable HTTP statuses
+    """
+    if isinstance(error, (ConnectionError, TimeoutError, socket.timeout)
+                  + REQUESTS_TRANSIENT_ERRORS + HTTPX_TRANSIENT_ERRORS):
+        return True
+
+    # TransientHTTPError.status, googleapiclient HttpError.resp.status, requests HTTPError.response.status_code
+    status = getattr(error, 'status', None)
+    if status is None:
+        status = getattr(getattr(error, 'resp', None), 'status', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    try:
+        return int(status) in RETRYABLE_STATUSES
+    except (TypeError, ValueError):
+        return False
+
+
+def _record(endpoint: str, counter: str) -> None:
+    with _stats_lock:
+        counters = _stats.setdefault(endpoint, {'calls': 0, 'retries': 0, 'failures': 0, 'budget_exhausted': 0})
+        counters[counter] += 1
+
+
+def get_retry_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Get per-endpoint call/retry/failure counters for this process.
+
+    Returns:
+        Dictionary mapping endpoint name to counters
+    """
+    with _stats_lock:
+        return {endpoint: dict(counters) for endpoint, counters in _stats.items()}
+
+
+def format_retry_stats() -> str:
+    """Format endpoints that needed retries or failed, worst first."""
+    stats = get_retry_stats()
+    degraded = sorted(
+        ((endpoint, c) for endpoint, c in stats.items() if c['retries'] or c['failures']),
+        key=lambda item: item[1]['retries'] + item[1]['failures'],
+        reverse=True
+    )
+    if not degraded:
+        return ''
+    lines = ["Retry counters (endpoint: calls / retries / failures):"]
+    for endpoint, c in degraded:
+        lines.append(f"  {endpoint}: {c['calls']} / {c['retries']} / {c['failures']}")
+    return '\n'.join(lines)
+
+
+class RetryPolicy:
+    """Jittered exponential backoff with a retry budget."""
+
+    def __init__(self, max_attempts: int = 4, base_delay: float = 0.5, max_delay: float = 30.0,
+                 timeout: Union[float, Tuple[float, float]] = (10, 60),
+                 budget_ratio: float = 0.2, budget_min_retries: int = 10):
+        """
+        Initialize retry policy.
+
+        Args:
+            max_attempts: Total attempts per call, including the first
+            base_delay: Backoff base in seconds (doubles each attempt)
+            max_delay: Upper bound for a single backoff sleep
+            timeout: Per-request timeout in seconds, or (connect, read) tuple
+            budget_ratio: Retries allowed as a fraction of calls made by this policy
+            budget_min_retries: Retries always allowed, regardless of call volume
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.budget_ratio = budget_ratio
+        self.budget_min_retries = budget_min_retries
+        self._calls = 0
+        self._retries = 0
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number `attempt` (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+    def _take_retry_budget(self) -> bool:
+        with self._lock:
+            if self._retries < self.budget_min_retries + self.budget_ratio * self._calls:
+                self._retries += 1
+                return True
+            return False
+
+    def call(self, fn: Callable[[], Any], endpoint: str, idempotent: bool = True,
+             retryable: Optional[Callable[[Exception], bool]] = None) -> Any:
+        """
+        Run fn, retrying transient failures.
+
+        Args:
+            fn: Zero-argument callable performing one attempt
+            endpoint: Name used for counters (e.g., 'linear:GetIssue')
+            idempotent: Whether repeating the operation is safe. Non-idempotent
+                        calls are never retried.
+            retryable: Optional override for is_transient
+
+        Returns:
+            Result of fn
+        """
+        retryable = retryable or is_transient
+        self._start_call(endpoint)
+
+        attempt = 1
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                delay = self._retry_delay(e, endpoint, idempotent, retryable, attempt)
+                time.sleep(delay)
+                attempt += 1
+
+    async def call_async(self, fn: Callable[[], Awaitable[Any]], endpoint: str, idempotent: bool = True,
+                         retryable: Optional[Callable[[Exception], bool]] = None) -> Any:
+        """
+        Async version of call(): awaits fn() and sleeps without blocking the event loop.
+
+        Args:
+            fn: Zero-argument callable returning an awaitable for one attempt
+            endpoint: Name used for counters
+            idempotent: Whether repeating the operation is safe
+            retryable: Optional override for is_transient
+
+        Returns:
+            Result of the awaited fn()
+        """
+        retryable = retryable or is_transient
+        self._start_call(endpoint)
+
+        attempt = 1
+        while True:
+            try:
+                return await fn()
+            except Exception as e:
+                delay = self._retry_delay(e, endpoint, idempotent, retryable, attempt)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _start_call(self, endpoint: str) -> None:
+        with self._lock:
+            self._calls += 1
+        _record(endpoint, 'calls')
+
+    def _retry_delay(self, error: Exception, endpoint: str, idempotent: bool,
+                     retryable: Callable[[Exception], bool], attempt: int) -> float:
+        """Return the backoff before the next attempt, or re-raise if the error is final."""
+        if not idempotent or not retryable(error) or attempt >= self.max_attempts:
+            _record(endpoint, 'failures')
+            raise error
+        if not self._take_retry_budget():
+            _record(endpoint, 'budget_exhausted')
+            _record(endpoint, 'failures')
+            raise error
+        delay = self.backoff(attempt)
+        _record(endpoint, 'retries')
+        print(f"Warning: {endpoint} failed ({str(error)[:100]}); retry {attempt}/{self.max_attempts - 1} in {delay:.1f}s")
+        return delay
@@ -125,10 +125,8 @@ def health_check() -> Dict:
                     try:
                         from linear_client import LinearClient
                         client = LinearClient(api_key=linear_key)
-                        # Test connection
-                        query = "query { viewer { name } }"
-                        response = client._make_request(query)
-                        if 'viewer' in response:
+                        # Test connection (a cached team list wouldn't prove the key works)
+                        if client.get_viewer():
                             print(f"    ✅ {team_name}: Linear API connected")
                             results['teams_valid'].append({
                                 'id': team_id,
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Stream large row sets into a Google Sheets tab.
+
+Rows come from any iterator (csv.reader, a generator, a DB cursor) and are
+cut into chunks bounded by both row count and payload size. Up to
+`concurrency` chunks are written at once, each from its own worker thread
+with its own HTTP transport (googleapiclient transports aren't
+thread-safe). Only the chunks in flight are held in memory, so a 500k-row
+export imports in constant memory. All writes draw from one per-credentials
+token bucket sized to the Sheets write quota.
+
+Two modes:
+- 'update' (default): each chunk goes to an explicit range via
+  values.batchUpdate, so chunks can land in any order and a failed import
+  can simply be re-run (every chunk rewrites the same cells).
+- 'append': chunks go through values.append one at a time (the next chunk is
+  read and encoded while the previous one is in flight). Use it to add rows
+  below existing data.
+
+Usage:
+    writer = SheetsStreamWriter(GoogleSheetsClient().registry)
+    with open('contacts.csv', newline='') as f:
+        stats = writer.write_rows(spreadsheet_id, 'Raw - Contacts', csv.reader(f))
+
+    python sheets_stream.py contacts.csv SPREADSHEET_ID "Raw - Contacts" [--append] [--skip-header]
+"""
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from google_client import a1_sheet_name, execute_request
+from google_services import GoogleServiceRegistry
+from rate_limiter import TokenBucket
+
+
+DEFAULT_CHUNK_ROWS = 10000  # Rows per write request
+DEFAULT_CHUNK_BYTES = 2 * 1024 * 1024  # Google recommends request payloads of at most 2 MB
+DEFAULT_CONCURRENCY = 4  # Chunks written at once in 'update' mode
+SHEETS_WRITES_PER_MINUTE = 60  # Default Sheets write quota per user per project
+
+
+def cell_value(value):
+    """Convert a DB/CSV value into something the Sheets API accepts (None -> '', dates etc. -> str)."""
+    if value is None:
+        return ''
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def iter_row_chunks(rows: Iterable[Sequence], max_rows: int = DEFAULT_CHUNK_ROWS,
+                    max_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[Tuple[List[List], int]]:
+    """
+    Group rows into chunks bounded by row count and encoded size.
+
+    Args:
+        rows: Row iterator; each row is a sequence of cell values
+        max_rows: Maximum rows per chunk
+        max_bytes: Maximum JSON-encoded size of a chunk's values (a single
+                   larger row still gets a chunk of its own)
+
+    Yields:
+        (rows, encoded size in bytes) tuples
+    """
+    chunk: List[List] = []
+    size = 0
+    for row in rows:
+        row = [cell_value(value) for value in row]
+        row_size = len(json.dumps(row, ensure_ascii=False).encode('utf-8')) + 1
+        if chunk and (len(chunk) >= max_rows or size + row_size > max_bytes):
+            yield chunk, size
+            chunk, size = [], 0
+        chunk.append(row)
+        size += row_size
+    if chunk:
+        yield chunk, size
+
+
+class SheetsStreamWriter:
+    """Chunked, concurrent writer for large Sheets value ranges."""
+
+    def __init__(self, registry: GoogleServiceRegistry, concurrency: int = DEFAULT_CONCURRENCY,
+                 chunk_rows: int = DEFAULT_CHUNK_ROWS, chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                 writes_per_minute: float = SHEETS_WRITES_PER_MINUTE):
+        """
+        Initialize the writer.
+
+        Args:
+            registry: Google service registry (e.g., GoogleSheetsClient().registry)
+            concurrency: Chunks written at once in 'update' mode
+            chunk_rows: Maximum rows per write request
+            chunk_bytes: Maximum payload size per write request
+            writes_per_minute: Sheets write quota shared by every writer on these credentials
+        """
+        self.registry = registry
+        self.concurrency = max(1, concurrency)
+        self.chunk_rows = chunk_rows
+        self.chunk_bytes = chunk_bytes
+        self.limiter = TokenBucket.shared(
+            f"google-sheets-writes-{TokenBucket.key_hash(os.path.abspath(registry.creds_path))}",
+            capacity=writes_per_minute,
+            period=60
+        )
+
+    def write_rows(self, spreadsheet_id: str, sheet_title: str, rows: Iterable[Sequence],
+                   start_row: int = 1, start_column: str = 'A', mode: str = 'update',
+                   value_input_option: str = 'RAW') -> Dict:
+        """
+        Write rows to a sheet tab, streaming them from an iterator.
+
+        Args:
+            spreadsheet_id: Spreadsheet ID
+            sheet_title: Tab name (e.g., 'Raw - Contacts')
+            rows: Row iterator (csv.reader, generator, DB cursor, ...)
+            start_row: 1-based row of the first written row ('update' mode;
+                       'append' mode appends after the table found there)
+            start_column: Column letter of the first cell
+            mode: 'update' (explicit ranges, concurrent) or 'append' (values.append, sequential)
+            value_input_option: 'RAW' stores values as-is; 'USER_ENTERED' parses
+                                formulas, dates and numbers like the Sheets UI
+
+        Returns:
+            Throughput stats: 'rows', 'chunks', 'bytes', 'seconds', 'rows_per_second', 'bytes_per_second'
+        """
+        if mode not in ('update', 'append'):
+            raise ValueError(f"Unknown write mode: {mode} (expected 'update' or 'append')")
+
+        sheet = a1_sheet_name(sheet_title)
+        # Concurrent appends could interleave, so append mode writes one chunk at a time
+        concurrency = self.concurrency if mode == 'update' else 1
+        stats = {'rows': 0, 'chunks': 0, 'bytes': 0}
+        started = time.monotonic()
+
+        def send(values: List[List], first_row: int) -> int:
+            service = self.registry.thread_service('sheets', 'v4')
+            self.limiter.acquire()
+            try:
+                if mode == 'update':
+                    execute_request(service.spreadsheets().values().batchUpdate(
+                        spreadsheetId=spreadsheet_id,
+                        body={'valueInputOption': value_input_option,
+                              'data': [{'range': f"{sheet}!{start_column}{first_row}", 'values': values}]}
+                    ))
+                else:
+                    execute_request(service.spreadsheets().values().append(
+                        spreadsheetId=spreadsheet_id,
+                        range=f"{sheet}!{start_column}{start_row}",
+                        valueInputOption=value_input_option,
+                        insertDataOption='INSERT_ROWS',
+                        body={'values': values}
+                    ), idempotent=False)
+            except Exception as e:
+                hint = "Re-running the import is safe: each chunk rewrites its own range." if mode == 'update' \
+                    else "Rows before this chunk were appended; re-running appends them again."
+                raise Exception(
+                    f"Writing rows {first_row}-{first_row + len(values) - 1} of {sheet_title} failed: {e}\n{hint}"
+                ) from e  # The HttpError (status, quota details) stays on __cause__
+            return len(values)
+
+        def record(done) -> None:
+            for future in done:
+                stats['rows'] += future.result()
+                stats['chunks'] += 1
+            elapsed = max(time.monotonic() - started, 1e-9)
+            print(f"Wrote {stats['rows']} rows to {sheet_title} ({stats['rows'] / elapsed:.0f} rows/s)")
+
+        next_row = start_row
+        in_flight = set()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='sheets-writer') as executor:
+            try:
+                for values, size in iter_row_chunks(rows, self.chunk_rows, self.chunk_bytes):
+                    if len(in_flight) >= concurrency:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        record(done)
+                    in_flight.add(executor.submit(send, values, next_row))
+                    next_row += len(values)
+                    stats['bytes'] += size
+                if in_flight:
+                    record(wait(in_flight).done)
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+
+        stats['seconds'] = round(time.monotonic() - started, 3)
+        elapsed = max(stats['seconds'], 1e-9)
+        stats['rows_per_second'] = round(stats['rows'] / elapsed, 1)
+        stats['bytes_per_second'] = round(stats['bytes'] / elapsed, 1)
+        return stats
+
+    def write_csv(self, spreadsheet_id: str, sheet_title: str, path: str,
+                  skip_header: bool = False, **kwargs) -> Dict:
+        """
+        Stream a CSV file into a sheet tab.
+
+        Args:
+            spreadsheet_id: Spreadsheet ID
+            sheet_title: Tab name
+            path: CSV file path
+            skip_header: Drop the CSV header row (e.g., when the tab already has headers)
+            **kwargs: Passed to write_rows (start_row, mode, value_input_option, ...)
+
+        Returns:
+            Throughput stats (see write_rows)
+        """
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            if skip_header:
+                next(reader, None)
+            return self.write_rows(spreadsheet_id, sheet_title, reader, **kwargs)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    from google_client import GoogleSheetsClient
+
+    parser = argparse.ArgumentParser(description='Stream a CSV file into a Google Sheets tab')
+    parser.add_argument('csv_path', help='CSV file to import')
+    parser.add_argument('spreadsheet_id', help='Target spreadsheet ID')
+    parser.add_argument('sheet_title', help="Target tab (e.g., 'Raw - Contacts')")
+    parser.add_argument('--start-row', type=int, default=1, help='First row to write (default: 1)')
+    parser.add_argument('--skip-header', action='store_true', help="Don't write the CSV header row")
+    parser.add_argument('--append', action='store_true', help='Append below existing data instead of writing explicit ranges')
+    parser.add_argument('--user-entered', action='store_true', help='Parse values like the Sheets UI (formulas, dates)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS)
+
+    args = parser.parse_args()
+    writer = SheetsStreamWriter(GoogleSheetsClient().registry, concurrency=args.concurrency,
+                                chunk_rows=args.chunk_rows)
+    stats = writer.write_csv(
+        args.spreadsheet_id, args.sheet_title, args.csv_path,
+        skip_header=args.skip_header,
+        start_row=args.start_row,
+        mode='append' if args.append else 'update',
+        value_input_option='USER_ENTERED' if args.user_entered else 'RAW'
+    )
+    print(f"\n✅ {stats['rows']} rows in {stats['chunks']} chunk(s), {stats['bytes'] / 1e6:.1f} MB "
+          f"in {stats['seconds']:.1f}s ({stats['rows_per_second']:.0f} rows/s)")
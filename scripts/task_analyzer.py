@@ -6,23 +6,38 @@ This module provides functionality to analyze Linear tasks and determine
 what can be automated or worked on by an agent.
 """
 
-from typing import Dict, List, Optional
+import asyncio
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 from linear_client import LinearClient
 from team_manager import TeamManager
+from http_session import create_async_http_client, create_session
+from linear_sync import LinearMirror, LinearSync, DEFAULT_MIRROR_PATH
+
+try:
+    import httpx  # Enables concurrent multi-team analysis via AsyncLinearClient
+except ImportError:
+    httpx = None
 
 
 class TaskAnalyzer:
     """Analyzes tasks across teams and projects."""
     
-    def __init__(self, team_manager: TeamManager):
+    def __init__(self, team_manager: TeamManager, use_mirror: bool = True,
+                 mirror_path: Optional[Path] = DEFAULT_MIRROR_PATH):
         """
         Initialize task analyzer.
         
         Args:
             team_manager: TeamManager instance
+            use_mirror: Read issues from the local SQLite mirror after an incremental
+                        sync, instead of downloading every open issue each run
+            mirror_path: SQLite file for the mirror (None keeps it in memory)
         """
         self.team_manager = team_manager
         self._linear_clients = {}  # Cache clients per team
+        self._session = create_session()  # Shared so warm connections are reused across teams
+        self._sync = LinearSync(LinearMirror(mirror_path)) if use_mirror else None
     
     def _get_linear_client(self, team_id: str) -> Optional[LinearClient]:
         """Get or create Linear client for a team."""
@@ -33,7 +48,7 @@ class TaskAnalyzer:
         if not api_key:
             return None
         
-        client = LinearClient(api_key=api_key)
+        client = LinearClient(api_key=api_key, session=self._session)
         self._linear_clients[team_id] = client
         return client
     
@@ -50,133 +65,85 @@ class TaskAnalyzer:
         """
         client = self._get_linear_client(team_id)
         if not client:
-            return {
-                'error': f'No Linear API key configured for team: {team_id}',
-                'team_id': team_id,
-                'next_steps': [
-                    'Run: python scripts/setup_team.py',
-                    'Select the team and add Linear API key',
-                    'Get API key from: https://linear.app/settings/api'
-                ]
-            }
+            return self._missing_api_key_result(team_id)
         
-        team_config = self.team_manager.get_team(team_id)
-        team_name = team_config.get('name', team_id) if team_config else team_id
-        
-        # Get team key from Linear
-        # First, get all teams to find the one matching our team_id
-        teams_query = """
-        query {
-            teams {
-                nodes {
-                    id
-                    key
-                    name
-                }
-            }
-        }
-        """
+        team_name = self._team_name(team_id)
         
+        # Get team key from Linear (workspace teams are cached per API key)
         try:
-            teams_data = client._make_request(teams_query)
-            teams = teams_data.get('teams', {}).get('nodes', [])
-            
-            # Try to find team by name or use first team
-            team_key = None
-            for team in teams:
-                if team.get('name', '').lower() == team_name.lower():
-                    team_key = team.get('key')
-                    break
+            team = self._resolve_team(client.get_teams(), team_name)
+            if not team:
+                return self._team_not_found_result(team_id)
             
-            if not team_key and teams:
-                # Use first team as fallback
-                team_key = teams[0].get('key')
-            
-            if not team_key:
-                return {
-                    'error': f'Could not find team in Linear workspace',
-                    'team_id': team_id,
-                    'next_steps': [
-                        'Verify team name matches Linear workspace',
-                        'Check team exists in your Linear account',
-                        'List teams: python scripts/agent_workflow.py --list-teams'
-                    ]
-                }
+            if self._sync:
+                # Pull only issues changed since the last run, then read the mirror
+                self._sync.sync_team(client, team)
+                issues = self._sync.mirror.get_open_issues(team['id'], project_id)
+                categorized = self._categorize_tasks(issues)
+            else:
+                # Stream open issues for this team page by page
+                issues = []
+                
+                def collect(issue_stream):
+                    for issue in issue_stream:
+                        issues.append(issue)
+                        yield issue
+                
+                categorized = self._categorize_tasks(collect(client.iter_team_issues(
+                    team['key'],
+                    page_size=100,
+                    projection='categorize',
+                    issue_filter=self._open_issue_filter(project_id)
+                )))
             
-            # Get open issues for this team
-            issues_query = """
-            query GetTeamIssues($teamKey: String!, $first: Int!) {
-                team(key: $teamKey) {
-                    issues(first: $first, filter: { state: { type: { neq: completed } } }) {
-                        nodes {
-                            id
-                            identifier
-                            title
-                            description
-                            state {
-                                id
-                                name
-                                type
-                            }
-                            priority
-                            assignee {
-                                id
-                                name
-                                email
-                            }
-                            project {
-                                id
-                                name
-                            }
-                            labels {
-                                nodes {
-                                    id
-                                    name
-                                }
-                            }
-                            createdAt
-                            updatedAt
-                        }
-                    }
-                }
-            }
-            """
+            return self._build_result(team_id, team_name, team['key'], project_id, issues, categorized)
             
-            variables = {
-                "teamKey": team_key,
-                "first": 250  # Linear allows up to 250 per query
+        except Exception as e:
+            return {
+                'error': str(e),
+                'team_id': team_id
             }
+    
+    async def analyze_team_tasks_async(self, team_id: str, project_id: Optional[str] = None,
+                                       http_client=None) -> Dict:
+        """
+        Async version of analyze_team_tasks using AsyncLinearClient.
+        
+        Args:
+            team_id: Team identifier
+            project_id: Optional project identifier to filter tasks
+            http_client: Optional shared httpx.AsyncClient
             
-            data = client._make_request(issues_query, variables)
-            team_data = data.get('team', {})
-            all_issues = team_data.get('issues', {}).get('nodes', [])
-            
-            # Filter by project if specified
-            if project_id:
-                issues = [issue for issue in all_issues 
-                         if issue.get('project', {}).get('id') == project_id]
-                project_name = next(
-                    (issue.get('project', {}).get('name') for issue in all_issues 
-                     if issue.get('project', {}).get('id') == project_id),
-                    project_id
-                )
-            else:
-                issues = all_issues
-                project_name = None
+        Returns:
+            Dictionary with analysis results
+        """
+        from async_linear_client import AsyncLinearClient
+        
+        api_key = self.team_manager.get_linear_api_key(team_id)
+        if not api_key:
+            return self._missing_api_key_result(team_id)
+        
+        team_name = self._team_name(team_id)
+        
+        try:
+            async with AsyncLinearClient(api_key=api_key, http_client=http_client) as client:
+                team = self._resolve_team(await client.get_teams(), team_name)
+                if not team:
+                    return self._team_not_found_result(team_id)
+                
+                if self._sync:
+                    await self._sync.sync_team_async(client, team)
+                    issues = self._sync.mirror.get_open_issues(team['id'], project_id)
+                else:
+                    issues = [issue async for issue in client.iter_team_issues(
+                        team['key'],
+                        page_size=100,
+                        projection='categorize',
+                        issue_filter=self._open_issue_filter(project_id)
+                    )]
             
-            # Categorize tasks
             categorized = self._categorize_tasks(issues)
-            
-            return {
-                'team_id': team_id,
-                'team_name': team_name,
-                'team_key': team_key,
-                'project_id': project_id,
-                'project_name': project_name,
-                'total_tasks': len(issues),
-                'categorized': categorized,
-                'tasks': issues
-            }
+            return self._build_result(team_id, team_name, team['key'], project_id, issues, categorized)
             
         except Exception as e:
             return {
@@ -184,12 +151,85 @@ class TaskAnalyzer:
                 'team_id': team_id
             }
     
-    def _categorize_tasks(self, issues: List[Dict]) -> Dict:
+    def _team_name(self, team_id: str) -> str:
+        """Get display name for a configured team."""
+        team_config = self.team_manager.get_team(team_id)
+        return team_config.get('name', team_id) if team_config else team_id
+    
+    @staticmethod
+    def _resolve_team(teams: List[Dict], team_name: str) -> Optional[Dict]:
+        """Find the Linear team matching a team name, falling back to the first team."""
+        for team in teams:
+            if team.get('name', '').lower() == team_name.lower():
+                return team
+        
+        if teams:
+            # Use first team as fallback
+            return teams[0]
+        return None
+    
+    @staticmethod
+    def _open_issue_filter(project_id: Optional[str] = None) -> Dict:
+        """Build the IssueFilter for open issues, optionally limited to a project."""
+        issue_filter = {'state': {'type': {'neq': 'completed'}}}
+        if project_id:
+            issue_filter['project'] = {'id': {'eq': project_id}}
+        return issue_filter
+    
+    @staticmethod
+    def _missing_api_key_result(team_id: str) -> Dict:
+        return {
+            'error': f'No Linear API key configured for team: {team_id}',
+            'team_id': team_id,
+            'next_steps': [
+                'Run: python scripts/setup_team.py',
+                'Select the team and add Linear API key',
+                'Get API key from: https://linear.app/settings/api'
+            ]
+        }
+    
+    @staticmethod
+    def _team_not_found_result(team_id: str) -> Dict:
+        return {
+            'error': f'Could not find team in Linear workspace',
+            'team_id': team_id,
+            'next_steps': [
+                'Verify team name matches Linear workspace',
+                'Check team exists in your Linear account',
+                'List teams: python scripts/agent_workflow.py --list-teams'
+            ]
+        }
+    
+    @staticmethod
+    def _build_result(team_id: str, team_name: str, team_key: str, project_id: Optional[str],
+                      issues: List[Dict], categorized: Dict) -> Dict:
+        """Assemble the analysis dictionary returned by analyze_team_tasks."""
+        if project_id:
+            project_name = next(
+                ((issue.get('project') or {}).get('name') for issue in issues
+                 if (issue.get('project') or {}).get('id') == project_id),
+                project_id
+            )
+        else:
+            project_name = None
+        
+        return {
+            'team_id': team_id,
+            'team_name': team_name,
+            'team_key': team_key,
+            'project_id': project_id,
+            'project_name': project_name,
+            'total_tasks': len(issues),
+            'categorized': categorized,
+            'tasks': issues
+        }
+    
+    def _categorize_tasks(self, issues: Iterable[Dict]) -> Dict:
         """
         Categorize tasks by agent-suitability and other criteria.
         
         Args:
-            issues: List of issue dictionaries
+            issues: Iterable of issue dictionaries (consumed incrementally)
             
         Returns:
             Dictionary with categorized tasks
@@ -203,28 +243,39 @@ class TaskAnalyzer:
         }
         
         for issue in issues:
-            state = issue.get('state', {})
-            state_type = state.get('type', '').lower()
-            priority = issue.get('priority', 0)
-            assignee = issue.get('assignee')
-            
-            # Check if blocked
-            if state_type == 'canceled' or state.get('name', '').lower() == 'blocked':
-                categories['blocked'].append(issue)
-            # Check if low priority
-            elif priority >= 3:  # Linear priority: 0=urgent, 1=high, 2=normal, 3=low, 4=no priority
-                categories['low_priority'].append(issue)
-            # Check if agent-suitable (has clear description, not assigned, etc.)
-            elif self._is_agent_suitable(issue):
-                categories['agent_suitable'].append(issue)
-            # Needs human review
-            elif assignee or not issue.get('description'):
-                categories['needs_review'].append(issue)
-            else:
-                categories['other'].append(issue)
+            categories[self.categorize_task(issue)].append(issue)
         
         return categories
     
+    def categorize_task(self, issue: Dict) -> str:
+        """
+        Categorize a single task.
+        
+        Args:
+            issue: Issue dictionary
+            
+        Returns:
+            One of 'agent_suitable', 'needs_review', 'blocked', 'low_priority', 'other'
+        """
+        state = issue.get('state') or {}
+        state_type = (state.get('type') or '').lower()
+        priority = issue.get('priority') or 0
+        assignee = issue.get('assignee')
+        
+        # Check if blocked
+        if state_type == 'canceled' or (state.get('name') or '').lower() == 'blocked':
+            return 'blocked'
+        # Check if low priority
+        if priority >= 3:  # Linear priority: 0=urgent, 1=high, 2=normal, 3=low, 4=no priority
+            return 'low_priority'
+        # Check if agent-suitable (has clear description, not assigned, etc.)
+        if self._is_agent_suitable(issue):
+            return 'agent_suitable'
+        # Needs human review
+        if assignee or not issue.get('description'):
+            return 'needs_review'
+        return 'other'
+    
     def _is_agent_suitable(self, issue: Dict) -> bool:
         """
         Determine if a task is suitable for agent automation.
@@ -235,8 +286,8 @@ class TaskAnalyzer:
         Returns:
             True if agent-suitable
         """
-        description = issue.get('description', '')
-        title = issue.get('title', '')
+        description = issue.get('description') or ''
+        title = issue.get('title') or ''
         
         # Must have description
         if not description or len(description) < 50:
@@ -258,26 +309,55 @@ class TaskAnalyzer:
         
         return has_keyword or has_criteria
     
-    def analyze_all_teams(self) -> Dict:
+    def analyze_all_teams(self, max_concurrency: int = 5) -> Dict:
         """
         Analyze tasks across all teams and provide summaries.
         
+        Teams are fetched concurrently when httpx is installed, otherwise one
+        after another.
+        
+        Args:
+            max_concurrency: Maximum teams analyzed at once (async path only)
+        
         Returns:
             Dictionary with analysis for each team
         """
+        if httpx is not None:
+            return asyncio.run(self.analyze_all_teams_async(max_concurrency=max_concurrency))
+        
         results = {}
         
         for team_id in self.team_manager.get_team_ids():
-            team_config = self.team_manager.get_team(team_id)
-            team_name = team_config.get('name', team_id) if team_config else team_id
-            
-            print(f"Analyzing team: {team_name} ({team_id})...")
+            print(f"Analyzing team: {self._team_name(team_id)} ({team_id})...")
             
             analysis = self.analyze_team_tasks(team_id)
             results[team_id] = analysis
         
         return results
     
+    async def analyze_all_teams_async(self, max_concurrency: int = 5) -> Dict:
+        """
+        Analyze all teams concurrently over one pooled httpx client.
+        
+        Args:
+            max_concurrency: Maximum teams analyzed at once
+            
+        Returns:
+            Dictionary with analysis for each team (in team_manager order)
+        """
+        team_ids = self.team_manager.get_team_ids()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async with create_async_http_client(max_connections=max_concurrency * 2) as http_client:
+            async def analyze(team_id: str) -> Dict:
+                async with semaphore:
+                    print(f"Analyzing team: {self._team_name(team_id)} ({team_id})...")
+                    return await self.analyze_team_tasks_async(team_id, http_client=http_client)
+            
+            analyses = await asyncio.gather(*(analyze(team_id) for team_id in team_ids))
+        
+        return dict(zip(team_ids, analyses))
+    
     def generate_summary(self, analysis: Dict) -> str:
         """
         Generate a human-readable summary from analysis results.
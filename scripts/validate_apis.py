@@ -37,19 +37,9 @@ def test_linear_api() -> tuple[bool, str]:
         client = LinearClient()
         
         # Try a simple query
-        query = """
-        query {
-            viewer {
-                id
-                name
-                email
-            }
-        }
-        """
-        response = client._make_request(query)
+        user = client.get_viewer()
         
-        if 'viewer' in response:
-            user = response['viewer']
+        if user:
             return True, f"✅ Linear API connected (User: {user.get('name', 'Unknown')})"
         else:
             return False, "❌ Linear API connection failed - invalid response"
@@ -47,10 +47,8 @@ def validate_team(team_id: str, manager: TeamManager) -> Dict:
         try:
             from linear_client import LinearClient
             client = LinearClient(api_key=linear_key)
-            query = "query { viewer { name email } }"
-            response = client._make_request(query)
-            if 'viewer' in response:
-                viewer = response['viewer']
+            viewer = client.get_viewer()
+            if viewer:
                 results['linear']['working'] = True
                 results['linear']['user'] = viewer.get('name', 'Unknown')
                 results['linear']['email'] = viewer.get('email', 'Unknown')